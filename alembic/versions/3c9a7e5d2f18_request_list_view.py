@@ -0,0 +1,95 @@
+"""request list view projection
+
+Revision ID: 3c9a7e5d2f18
+Revises: 8d2f4a6c1b90
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a7e5d2f18'
+down_revision: Union[str, Sequence[str], None] = '8d2f4a6c1b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_REQUEST_INDEXES = (
+    ('ix_requests_active_status_created_at', ['status', 'created_at']),
+    ('ix_requests_active_secretary_id', ['secretary_id', 'status', 'created_at']),
+    ('ix_requests_active_judge_id', ['judge_id', 'status', 'created_at']),
+    ('ix_requests_active_management_department_id', ['management_department_id', 'status', 'created_at']),
+)
+
+ACTIVE_VIEW_INDEXES = (
+    ('ix_request_list_view_active_status_created_at', ['status', 'created_at']),
+    ('ix_request_list_view_active_secretary_id', ['secretary_id', 'status', 'created_at']),
+    ('ix_request_list_view_active_judge_id', ['judge_id', 'status', 'created_at']),
+    ('ix_request_list_view_active_management_id', ['management_id', 'status', 'created_at']),
+    ('ix_request_list_view_active_management_department_id', ['management_department_id', 'status', 'created_at']),
+)
+
+BACKFILL = """
+INSERT INTO request_list_view (
+    request_id, registration_number, human_registration_number, request_type, status, is_emergency,
+    department_id, secretary_id, judge_id, management_id, management_department_id,
+    items_text, next_deadline, created_at, archived_at
+)
+SELECT r.id, r.registration_number, r.human_registration_number, r.request_type, r.status, r.is_emergency,
+       r.department_id, r.secretary_id, r.judge_id, r.management_id, r.management_department_id,
+       agg.items_text, agg.next_deadline, r.created_at, r.archived_at
+FROM requests r
+CROSS JOIN LATERAL (
+    SELECT coalesce(string_agg(i.name || ' (' || ri.count || 'шт.)', E'\\n' ORDER BY ri.item_id), '') AS items_text,
+           min(least(ri.deadline_executor, ri.deadline_organization, ri.deadline_planning)) AS next_deadline
+    FROM request_item ri
+    JOIN items i ON i.id = ri.item_id
+    WHERE ri.request_id = r.id
+) agg
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'request_list_view',
+        sa.Column('request_id', sa.Integer(), nullable=False),
+        sa.Column('registration_number', sa.String(length=128), nullable=False),
+        sa.Column('human_registration_number', sa.String(length=64), nullable=True),
+        sa.Column('request_type', postgresql.ENUM(name='requesttype', create_type=False), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='requeststatus', create_type=False), nullable=False),
+        sa.Column('is_emergency', sa.Boolean(), nullable=False),
+        sa.Column('department_id', sa.Integer(), nullable=False),
+        sa.Column('secretary_id', sa.Integer(), nullable=True),
+        sa.Column('judge_id', sa.Integer(), nullable=False),
+        sa.Column('management_id', sa.Integer(), nullable=True),
+        sa.Column('management_department_id', sa.Integer(), nullable=True),
+        sa.Column('items_text', sa.Text(), server_default='', nullable=False),
+        sa.Column('next_deadline', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['request_id'], ['requests.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('request_id')
+    )
+    op.execute(BACKFILL)
+
+    for name, columns in ACTIVE_VIEW_INDEXES:
+        op.create_index(name, 'request_list_view', columns, unique=False,
+                        postgresql_where=sa.text('archived_at IS NULL'))
+
+    # Списки и счетчики читают проекцию, индексы активных заявок на requests больше не нужны
+    for name, _ in ACTIVE_REQUEST_INDEXES:
+        op.drop_index(name, table_name='requests', postgresql_where=sa.text('archived_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in ACTIVE_REQUEST_INDEXES:
+        op.create_index(name, 'requests', columns, unique=False, postgresql_where=sa.text('archived_at IS NULL'))
+
+    op.drop_table('request_list_view')
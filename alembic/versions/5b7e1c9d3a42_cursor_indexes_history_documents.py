@@ -0,0 +1,34 @@
+"""cursor indexes for history and documents
+
+Revision ID: 5b7e1c9d3a42
+Revises: 44c30c88e688
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e1c9d3a42'
+down_revision: Union[str, Sequence[str], None] = '44c30c88e688'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_request_history_request_id_id', 'request_history', ['request_id', 'id'], unique=False)
+    op.drop_index(op.f('ix_request_history_request_id'), table_name='request_history')
+    op.create_index('ix_request_documents_request_id_id', 'request_documents', ['request_id', 'id'], unique=False)
+    op.drop_index(op.f('ix_request_documents_request_id'), table_name='request_documents')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_request_documents_request_id'), 'request_documents', ['request_id'], unique=False)
+    op.drop_index('ix_request_documents_request_id_id', table_name='request_documents')
+    op.create_index(op.f('ix_request_history_request_id'), 'request_history', ['request_id'], unique=False)
+    op.drop_index('ix_request_history_request_id_id', table_name='request_history')
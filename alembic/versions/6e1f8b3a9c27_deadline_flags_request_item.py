@@ -0,0 +1,54 @@
+"""deadline flags for request items
+
+Revision ID: 6e1f8b3a9c27
+Revises: 3c9a7e5d2f18
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1f8b3a9c27'
+down_revision: Union[str, Sequence[str], None] = '3c9a7e5d2f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ITEM_DEADLINE = 'least(deadline_executor, deadline_organization, deadline_planning)'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('request_item', sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('request_item', sa.Column('is_reminded', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('request_list_view',
+                  sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # Уже прошедшие сроки отмечаются сразу, напоминания по ним не рассылаются
+    op.execute(
+        f"UPDATE request_item SET is_overdue = true, is_reminded = true WHERE {ITEM_DEADLINE} < now()"
+    )
+    op.execute(
+        "UPDATE request_list_view v SET is_overdue = true "
+        "WHERE EXISTS (SELECT 1 FROM request_item ri WHERE ri.request_id = v.request_id AND ri.is_overdue)"
+    )
+
+    op.create_index('ix_request_item_pending_overdue', 'request_item', [sa.text(ITEM_DEADLINE)], unique=False,
+                    postgresql_where=sa.text('NOT is_overdue'))
+    op.create_index('ix_request_item_pending_reminder', 'request_item', [sa.text(ITEM_DEADLINE)], unique=False,
+                    postgresql_where=sa.text('NOT is_reminded'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_request_item_pending_reminder', table_name='request_item',
+                  postgresql_where=sa.text('NOT is_reminded'))
+    op.drop_index('ix_request_item_pending_overdue', table_name='request_item',
+                  postgresql_where=sa.text('NOT is_overdue'))
+    op.drop_column('request_list_view', 'is_overdue')
+    op.drop_column('request_item', 'is_reminded')
+    op.drop_column('request_item', 'is_overdue')
@@ -0,0 +1,116 @@
+"""partition request_history by year, archived_at for requests
+
+Revision ID: 8d2f4a6c1b90
+Revises: 5b7e1c9d3a42
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4a6c1b90'
+down_revision: Union[str, Sequence[str], None] = '5b7e1c9d3a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_REQUEST_INDEXES = (
+    ('ix_requests_active_status_created_at', ['status', 'created_at']),
+    ('ix_requests_active_secretary_id', ['secretary_id', 'status', 'created_at']),
+    ('ix_requests_active_judge_id', ['judge_id', 'status', 'created_at']),
+    ('ix_requests_active_management_department_id', ['management_department_id', 'status', 'created_at']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('requests', sa.Column('archived_at', sa.DateTime(timezone=True), nullable=True))
+    for name, columns in ACTIVE_REQUEST_INDEXES:
+        op.create_index(name, 'requests', columns, unique=False, postgresql_where=sa.text('archived_at IS NULL'))
+
+    # Секционированную таблицу нельзя получить из обычной: создаем новую и переносим строки
+    op.execute("ALTER TABLE request_history RENAME TO request_history_old")
+    op.execute("ALTER TABLE request_history_old RENAME CONSTRAINT request_history_pkey TO request_history_old_pkey")
+    op.execute("ALTER INDEX ix_request_history_request_id_id RENAME TO ix_request_history_old_request_id_id")
+    op.execute("ALTER INDEX ix_request_history_user_id RENAME TO ix_request_history_old_user_id")
+    op.execute("""
+        CREATE TABLE request_history (
+            id INTEGER NOT NULL DEFAULT nextval('request_history_id_seq'),
+            action requestaction NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            request_id INTEGER NOT NULL REFERENCES requests (id),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    # Последовательность принадлежит старой таблице и удалилась бы вместе с ней
+    op.execute("ALTER SEQUENCE request_history_id_seq OWNED BY request_history.id")
+
+    # Годовые секции от первой записи до следующего года
+    op.execute("""
+        DO $$
+        DECLARE
+            partition_year INTEGER;
+        BEGIN
+            FOR partition_year IN SELECT generate_series(
+                COALESCE(
+                    (SELECT EXTRACT(YEAR FROM MIN(created_at))::INTEGER FROM request_history_old),
+                    EXTRACT(YEAR FROM now())::INTEGER
+                ),
+                EXTRACT(YEAR FROM now())::INTEGER + 1
+            ) LOOP
+                EXECUTE format(
+                    'CREATE TABLE request_history_y%s PARTITION OF request_history FOR VALUES FROM (%L) TO (%L)',
+                    partition_year,
+                    make_timestamptz(partition_year, 1, 1, 0, 0, 0, 'UTC'),
+                    make_timestamptz(partition_year + 1, 1, 1, 0, 0, 0, 'UTC')
+                );
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE request_history_default PARTITION OF request_history DEFAULT")
+
+    op.execute("""
+        INSERT INTO request_history (id, action, description, created_at, request_id, user_id)
+        SELECT id, action, description, COALESCE(created_at, now()), request_id, user_id
+        FROM request_history_old
+    """)
+    op.create_index('ix_request_history_request_id_id', 'request_history', ['request_id', 'id'], unique=False)
+    op.create_index(op.f('ix_request_history_user_id'), 'request_history', ['user_id'], unique=False)
+    op.execute("DROP TABLE request_history_old")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE request_history RENAME TO request_history_partitioned")
+    op.execute("ALTER INDEX ix_request_history_request_id_id RENAME TO ix_request_history_partitioned_request_id_id")
+    op.execute("ALTER INDEX ix_request_history_user_id RENAME TO ix_request_history_partitioned_user_id")
+    op.execute("""
+        CREATE TABLE request_history (
+            id INTEGER NOT NULL DEFAULT nextval('request_history_id_seq'),
+            action requestaction NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            request_id INTEGER NOT NULL REFERENCES requests (id),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            CONSTRAINT request_history_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("ALTER SEQUENCE request_history_id_seq OWNED BY request_history.id")
+    op.execute("""
+        INSERT INTO request_history (id, action, description, created_at, request_id, user_id)
+        SELECT id, action, description, created_at, request_id, user_id
+        FROM request_history_partitioned
+    """)
+    op.create_index('ix_request_history_request_id_id', 'request_history', ['request_id', 'id'], unique=False)
+    op.create_index(op.f('ix_request_history_user_id'), 'request_history', ['user_id'], unique=False)
+    op.execute("DROP TABLE request_history_partitioned CASCADE")
+
+    for name, _ in reversed(ACTIVE_REQUEST_INDEXES):
+        op.drop_index(name, table_name='requests', postgresql_where=sa.text('archived_at IS NULL'))
+    op.drop_column('requests', 'archived_at')
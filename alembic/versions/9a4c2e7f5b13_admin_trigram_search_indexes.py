@@ -0,0 +1,32 @@
+"""trigram indexes for admin search
+
+Revision ID: 9a4c2e7f5b13
+Revises: 6e1f8b3a9c27
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c2e7f5b13'
+down_revision: Union[str, Sequence[str], None] = '6e1f8b3a9c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_requests_registration_number_trgm', 'requests', ['registration_number'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'registration_number': 'gin_trgm_ops'})
+    op.create_index('ix_users_full_name_trgm', 'users', ['full_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_full_name_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_requests_registration_number_trgm', table_name='requests', postgresql_using='gin')
@@ -0,0 +1,43 @@
+# Внешние зависимости
+from datetime import datetime, timezone, timedelta
+import asyncio
+import argparse
+# Внутренние модули
+from web_app.src.core import config, engine
+from web_app.src.crud import sql_create_history_partitions, sql_archive_requests
+
+
+async def archive_requests(older_than_days: int, batch_size: int) -> dict:
+    """
+    Периодическое обслуживание (cron, раз в сутки): секции request_history на следующие годы
+    и перенос в архив завершенных и отмененных заявок, закрытых больше older_than_days дней назад
+    """
+    try:
+        partitions = await sql_create_history_partitions(years_ahead=config.HISTORY_PARTITIONS_AHEAD)
+
+        older_than = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        archived = 0
+        while True:
+            # Короткие транзакции пачками не блокируют работу пользователей с заявками
+            batch_archived = await sql_archive_requests(older_than=older_than, batch_size=batch_size)
+            archived += batch_archived
+            if batch_archived < batch_size:
+                break
+
+    finally:
+        await engine.dispose()
+
+    return {"partitions": partitions, "archived": archived}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Архивирование старых заявок и создание секций истории")
+    parser.add_argument("--older-than-days", type=int, default=config.ARCHIVE_AFTER_DAYS,
+                        help="Возраст закрытых заявок для архива")
+    parser.add_argument("--batch-size", type=int, default=config.ARCHIVE_BATCH_SIZE, help="Размер пачки")
+    args = parser.parse_args()
+
+    print(asyncio.run(archive_requests(
+        older_than_days=args.older_than_days,
+        batch_size=args.batch_size
+    )))
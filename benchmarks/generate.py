@@ -0,0 +1,250 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Tuple
+from datetime import datetime, timedelta, UTC
+from itertools import accumulate
+import uuid
+import time
+import random
+import asyncio
+import argparse
+import sqlalchemy as sa
+# Внутренние модули
+from web_app.src.core import engine
+from web_app.src.models import (Request, RequestStatus, RequestType, RequestHistory, RequestDocument,
+                                RequestItemStatus, Judge, Secretary, Executor, Management, ManagementDepartment,
+                                Item)
+from web_app.src.crud.request_list_view import get_request_list_view_upsert
+from benchmarks.seed import STATUS_HISTORY, pick_status
+
+
+REQUEST_COLUMNS = [
+    "id", "registration_number", "human_registration_number", "description", "request_type", "status",
+    "is_emergency", "pdf_request_url", "pdf_signed_request_url", "created_at", "completed_at",
+    "secretary_id", "judge_id", "management_id", "management_department_id", "department_id"
+]
+REQUEST_ITEM_COLUMNS = ["request_id", "item_id", "count", "executor_id", "status", "deadline_executor"]
+HISTORY_COLUMNS = ["id", "action", "description", "created_at", "request_id", "user_id"]
+DOCUMENT_COLUMNS = ["id", "document_type", "file_path", "file_name", "size", "created_at", "request_id"]
+
+DOCUMENT_TYPES = [("image/jpeg", ".jpg", 0.7), ("image/png", ".png", 0.2), ("video/mp4", ".mp4", 0.1)]
+
+
+# Справочные данные, к которым привязываются сгенерированные заявки
+async def load_references(conn) -> Dict[str, Any]:
+    courts_result = await conn.execute(
+        sa.select(Judge.id, Judge.user_id, Judge.department_id, Secretary.id, Secretary.user_id)
+        .join(Secretary, Secretary.judge_id == Judge.id)
+    )
+    courts = courts_result.all()
+    if not courts:
+        raise RuntimeError("Нет судей с секретарями: сначала выполните python -m benchmarks.seed")
+
+    items_result = await conn.execute(sa.select(Item.id).order_by(Item.id))
+    executors_result = await conn.execute(sa.select(Executor.id, Executor.user_id))
+    management_result = await conn.execute(sa.select(Management.id))
+    management_department_result = await conn.execute(sa.select(ManagementDepartment.id))
+
+    return {
+        "courts": courts,
+        "items": items_result.scalars().all(),
+        "executors": executors_result.all(),
+        "management": management_result.scalars().all(),
+        "management_departments": management_department_result.scalars().all()
+    }
+
+
+async def next_id(conn, table: sa.Table) -> int:
+    result = await conn.execute(sa.select(sa.func.coalesce(sa.func.max(table.c.id), 0)))
+    return result.scalar_one() + 1
+
+
+# Генерация одной пачки строк всех таблиц
+def generate_chunk(
+    rng: random.Random,
+    references: Dict[str, Any],
+    item_weights: List[float],
+    ids: Dict[str, int],
+    size: int,
+    days: int,
+    documents_ratio: float,
+    now: datetime
+) -> Tuple[List[tuple], List[tuple], List[tuple], List[tuple]]:
+    requests, items, history, documents = [], [], [], []
+
+    for _ in range(size):
+        request_id = ids["requests"]
+        ids["requests"] += 1
+
+        judge_id, judge_user_id, department_id, secretary_id, secretary_user_id = rng.choice(references["courts"])
+        # Нагрузка растет к текущей дате, поэтому свежих заявок больше
+        age_days = int(days * rng.random() ** 1.5)
+        created_at = now - timedelta(days=age_days, seconds=rng.randrange(24 * 3600))
+        status = pick_status(rng, age_days)
+        request_type = RequestType.MATERIAL if rng.random() < 0.75 else RequestType.TECHNICAL
+        registration_number = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        assigned = status in (RequestStatus.IN_PROGRESS, RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED,
+                              RequestStatus.FINISHED)
+        completed_at = created_at + timedelta(days=rng.lognormvariate(2, 0.6)) if status in (
+            RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED, RequestStatus.FINISHED) else None
+
+        requests.append((
+            request_id,
+            registration_number,
+            f"{request_id}-{department_id}-{created_at.year}",
+            "" if request_type == RequestType.MATERIAL else "Не работает оборудование",
+            request_type.name,
+            status.name,
+            request_type == RequestType.TECHNICAL and rng.random() < 0.1,
+            f"/u8ufy1/static/pdf_requests/not_signed/{registration_number}.pdf",
+            None if status == RequestStatus.REGISTERED else
+            f"/u8ufy1/static/pdf_requests/signed/{registration_number}.pdf",
+            created_at,
+            completed_at,
+            secretary_id,
+            judge_id,
+            rng.choice(references["management"]) if assigned and references["management"] else None,
+            rng.choice(references["management_departments"])
+            if assigned and references["management_departments"] else None,
+            department_id
+        ))
+
+        # Перекос популярности предметов: немногие расходники встречаются в большинстве заявок
+        executor_id, executor_user_id = rng.choice(references["executors"]) \
+            if assigned and references["executors"] else (None, None)
+        item_status = {
+            RequestStatus.CANCELLED: RequestItemStatus.CANCELLED,
+            RequestStatus.COMPLETED: RequestItemStatus.COMPLETED,
+            RequestStatus.ENDING_COMPLETED: RequestItemStatus.COMPLETED,
+            RequestStatus.FINISHED: RequestItemStatus.COMPLETED,
+        }.get(status, RequestItemStatus.REGISTERED)
+        request_items = set(rng.choices(references["items"], cum_weights=item_weights, k=rng.randint(1, 6)))
+        for item_id in request_items:
+            items.append((
+                request_id,
+                item_id,
+                max(1, int(rng.expovariate(0.3))),
+                executor_id,
+                item_status.name,
+                created_at + timedelta(days=rng.choice((3, 7, 14, 30))) if executor_id else None
+            ))
+
+        moment = created_at
+        for action in STATUS_HISTORY[status]:
+            user_id = secretary_user_id
+            if action.name in ("CONFIRMED", "CANCELLED"):
+                user_id = judge_user_id
+            elif action.name == "COMPLETED" and executor_user_id:
+                user_id = executor_user_id
+
+            history.append((ids["history"], action.name, f"Заявка {action.value}", moment, request_id, user_id))
+            ids["history"] += 1
+            moment += timedelta(minutes=rng.randint(5, 3 * 24 * 60))
+
+        if rng.random() < documents_ratio:
+            for _ in range(rng.randint(1, 3)):
+                document_type, extension, _ = rng.choices(
+                    DOCUMENT_TYPES, weights=[weight for _, _, weight in DOCUMENT_TYPES]
+                )[0]
+                file_name = f"{uuid.UUID(int=rng.getrandbits(128), version=4).hex}{extension}"
+                documents.append((
+                    ids["documents"],
+                    document_type,
+                    f"web_app/src/static/user_documents/{file_name}",
+                    f"photo{extension}",
+                    rng.randint(50 * 1024, 5 * 1024 * 1024),
+                    created_at,
+                    request_id
+                ))
+                ids["documents"] += 1
+
+    return requests, items, history, documents
+
+
+async def generate(requests_count: int, days: int, chunk_size: int, documents_ratio: float,
+                   zipf_exponent: float, random_seed: int) -> Dict[str, int]:
+    """Массовая загрузка синтетических заявок через COPY"""
+    rng = random.Random(random_seed)
+    now = datetime.now(UTC)
+    totals = {"requests": 0, "request_item": 0, "request_history": 0, "request_documents": 0}
+
+    async with engine.connect() as conn:
+        references = await load_references(conn)
+        ids = {
+            "requests": await next_id(conn, Request.__table__),
+            "history": await next_id(conn, RequestHistory.__table__),
+            "documents": await next_id(conn, RequestDocument.__table__)
+        }
+        await conn.commit()
+
+        # Популярные предметы выбираются случайно, но воспроизводимо
+        rng.shuffle(references["items"])
+        item_weights = list(accumulate(1 / rank ** zipf_exponent for rank in range(1, len(references["items"]) + 1)))
+
+        raw_connection = await conn.get_raw_connection()
+        copy_connection = raw_connection.driver_connection
+
+        first_request_id = ids["requests"]
+        for start in range(0, requests_count, chunk_size):
+            requests, items, history, documents = generate_chunk(
+                rng, references, item_weights, ids, min(chunk_size, requests_count - start),
+                days, documents_ratio, now
+            )
+
+            async with copy_connection.transaction():
+                await copy_connection.copy_records_to_table("requests", records=requests, columns=REQUEST_COLUMNS)
+                await copy_connection.copy_records_to_table(
+                    "request_item", records=items, columns=REQUEST_ITEM_COLUMNS
+                )
+                await copy_connection.copy_records_to_table(
+                    "request_history", records=history, columns=HISTORY_COLUMNS
+                )
+                await copy_connection.copy_records_to_table(
+                    "request_documents", records=documents, columns=DOCUMENT_COLUMNS
+                )
+
+            totals["requests"] += len(requests)
+            totals["request_item"] += len(items)
+            totals["request_history"] += len(history)
+            totals["request_documents"] += len(documents)
+            print(f"Загружено заявок: {totals['requests']} из {requests_count}")
+
+        # Строки проекции списков для загруженных заявок, по одной транзакции на пачку
+        for start in range(first_request_id, ids["requests"], chunk_size):
+            await conn.execute(get_request_list_view_upsert(
+                Request.id.between(start, min(start + chunk_size, ids["requests"]) - 1)
+            ))
+            await conn.commit()
+
+        # id задавались явно, сдвигаем последовательности
+        for table in ("requests", "request_history", "request_documents"):
+            await copy_connection.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+            )
+        await copy_connection.execute(
+            "ANALYZE requests, request_item, request_history, request_documents, request_list_view"
+        )
+
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Генерация большого объема заявок, предметов и истории через COPY")
+    parser.add_argument("--requests", type=int, default=1_000_000, help="Количество заявок")
+    parser.add_argument("--days", type=int, default=3 * 365, help="Глубина истории в днях")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Заявок в одной транзакции COPY")
+    parser.add_argument("--documents-ratio", type=float, default=0.3, help="Доля заявок с вложениями")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Показатель перекоса популярности предметов")
+    parser.add_argument("--seed", type=int, default=42, help="Зерно генератора случайных чисел")
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    result = asyncio.run(generate(
+        requests_count=args.requests,
+        days=args.days,
+        chunk_size=args.chunk_size,
+        documents_ratio=args.documents_ratio,
+        zipf_exponent=args.zipf,
+        random_seed=args.seed
+    ))
+    print(result, f"{time.perf_counter() - started_at:.1f} s")
@@ -0,0 +1,91 @@
+# Внешние зависимости
+from typing import Dict, List, Any
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+
+# Тяжелые библиотеки, которые не должны загружаться при старте воркера
+HEAVY_MODULES = ["weasyprint", "pandas", "openpyxl", "magic", "emails", "lxml"]
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Разбор вывода -X importtime: self [us] | cumulative [us] | imported package"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+
+    return rows
+
+
+def measure(target: str) -> Dict[str, Any]:
+    code = (
+        f"import sys, json; import {target}; "
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))"
+    )
+
+    started_at = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=os.environ.copy()
+    )
+    wall_ms = (time.perf_counter() - started_at) * 1000
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+
+    rows = parse_importtime(result.stderr)
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "imports_ms": round(sum(row["self_ms"] for row in rows), 1),
+        "modules": len(rows),
+        "heavy_loaded": json.loads(result.stdout.strip().splitlines()[-1]),
+        "rows": rows
+    }
+
+
+def main(target: str, top: int, repeat: int) -> Dict[str, Any]:
+    runs = [measure(target) for _ in range(repeat)]
+    best = min(runs, key=lambda run: run["wall_ms"])
+
+    # Пакеты (без учета самого приложения) с наибольшим суммарным временем импорта
+    root_package = target.split(".")[0]
+    top_level = sorted(
+        (row for row in best["rows"] if "." not in row["module"] and row["module"] != root_package),
+        key=lambda row: row["cumulative_ms"], reverse=True
+    )[:top]
+
+    return {
+        "target": target,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "wall_ms": [run["wall_ms"] for run in runs],
+        "best_wall_ms": best["wall_ms"],
+        "imports_ms": best["imports_ms"],
+        "modules": best["modules"],
+        "heavy_loaded": best["heavy_loaded"],
+        "top": [
+            {"module": row["module"], "cumulative_ms": round(row["cumulative_ms"], 1)} for row in top_level
+        ]
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Время импорта приложения в стиле python -X importtime")
+    parser.add_argument("--target", default="web_app.main", help="Импортируемый модуль")
+    parser.add_argument("--top", type=int, default=15, help="Сколько самых медленных пакетов показать")
+    parser.add_argument("--repeat", type=int, default=3, help="Количество запусков (берется лучший)")
+    args = parser.parse_args()
+
+    print(json.dumps(main(args.target, args.top, args.repeat), ensure_ascii=False, indent=2))
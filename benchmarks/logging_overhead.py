@@ -0,0 +1,108 @@
+# Внешние зависимости
+from typing import Dict, Any, Callable
+import os
+import json
+import time
+import queue
+import logging
+import argparse
+import tempfile
+from logging.handlers import RotatingFileHandler, QueueListener
+# Внутренние модули
+from web_app.src.core.logger import JsonFormatter, LazyQueueHandler, ContextFilter
+from web_app.src.core.context import request_id_var, user_id_var, route_var
+
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def build_handlers(log_dir: str, formatter: logging.Formatter):
+    # stdout заменяется на /dev/null, чтобы замер не зависел от терминала
+    stream_handler = logging.StreamHandler(open(os.devnull, mode="w", encoding="utf-8"))
+    file_handler = RotatingFileHandler(
+        filename=f"{log_dir}/bench.log", maxBytes=10 * 1024 * 1024, backupCount=1, encoding="utf-8"
+    )
+
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    return [stream_handler, file_handler]
+
+
+# Прежняя схема: синхронная запись обоими обработчиками и f-строки
+def sync_request(logger: logging.Logger, i: int):
+    registration_number = f"{i:08d}"
+    logger.info(f"Create request {registration_number} by user {i % 100}")
+    for item_id in range(5):
+        logger.debug(f"Item {item_id} added to request {registration_number}")
+    logger.info(f"Request {registration_number} created, pdf generated")
+    logger.warning(f"Request not found by registration_number: {registration_number}")
+
+
+# Новая схема: очередь и ленивое форматирование
+def queued_request(logger: logging.Logger, i: int):
+    registration_number = f"{i:08d}"
+    logger.info("Create request %s by user %s", registration_number, i % 100)
+    for item_id in range(5):
+        logger.debug("Item %s added to request %s", item_id, registration_number)
+    logger.info("Request %s created, pdf generated", registration_number)
+    logger.warning("Request not found by registration_number: %s", registration_number)
+
+
+def measure(logger: logging.Logger, emit: Callable[[logging.Logger, int], None], requests: int,
+            drain: Callable[[], None]) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    for i in range(requests):
+        request_id_var.set(f"{i:032x}")
+        user_id_var.set(i % 100)
+        route_var.set("POST /api/v1/request/create/")
+        emit(logger, i)
+    caller_seconds = time.perf_counter() - started_at
+
+    # Время до полной записи очереди на диск
+    drain()
+    total_seconds = time.perf_counter() - started_at
+
+    return {
+        "caller_us_per_request": round(caller_seconds / requests * 1_000_000, 2),
+        "total_us_per_request": round(total_seconds / requests * 1_000_000, 2)
+    }
+
+
+def main(requests: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as log_dir:
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.setLevel(logging.INFO)
+        sync_logger.propagate = False
+        for handler in build_handlers(log_dir, logging.Formatter(TEXT_FORMAT)):
+            sync_logger.addHandler(handler)
+
+        before = measure(sync_logger, sync_request, requests, drain=lambda: None)
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *build_handlers(log_dir, JsonFormatter()), respect_handler_level=True)
+        queued_logger = logging.getLogger("bench.queued")
+        queued_logger.setLevel(logging.INFO)
+        queued_logger.propagate = False
+        queue_handler = LazyQueueHandler(log_queue)
+        queue_handler.addFilter(ContextFilter())
+        queued_logger.addHandler(queue_handler)
+
+        listener.start()
+        after = measure(queued_logger, queued_request, requests, drain=listener.stop)
+
+    return {
+        "requests": requests,
+        "records_per_request": 3,
+        "disabled_debug_calls_per_request": 5,
+        "before_sync_fstring": before,
+        "after_queue_lazy_json": after
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Накладные расходы логирования на один HTTP запрос")
+    parser.add_argument("--requests", type=int, default=20_000, help="Количество имитируемых запросов")
+    args = parser.parse_args()
+
+    print(json.dumps(main(args.requests), ensure_ascii=False, indent=2))
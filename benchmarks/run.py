@@ -0,0 +1,123 @@
+# Внешние зависимости
+from typing import Dict, List, Any
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import platform
+import httpx
+
+# Внутренние модули
+from web_app.main import app
+from web_app.src.utils import token_service
+from benchmarks.scenarios import SCENARIOS, Scenario, ScenarioContext, Recorder, login
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Процентиль методом ближайшего ранга"""
+    ordered = sorted(values)
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def build_report(recorder: Recorder, elapsed: float, params: Dict[str, Any]) -> Dict[str, Any]:
+    endpoints = {}
+    for name, latencies in sorted(recorder.latencies.items()):
+        endpoints[name] = {
+            "count": len(latencies),
+            "errors": recorder.errors.get(name, 0),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+            "throughput_rps": round(len(latencies) / elapsed, 2)
+        }
+
+    return {
+        "params": params,
+        "python": platform.python_version(),
+        "elapsed_s": round(elapsed, 2),
+        "total_requests": sum(len(latencies) for latencies in recorder.latencies.values()),
+        "endpoints": endpoints
+    }
+
+
+# Один виртуальный пользователь: вход и повторение сценария
+async def virtual_user(scenario: Scenario, username: str, context: ScenarioContext, iterations: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        await login(client, context, username)
+
+        kwargs = {}
+        if scenario.needs_judge_id:
+            judge_ids = {username: int(judge_id) for judge_id, username in context.manifest["judge_usernames"].items()}
+            kwargs["judge_id"] = judge_ids[username]
+
+        if scenario.needs_executor_id:
+            executor_ids = {
+                username: int(executor_id) for executor_id, username in context.manifest["executor_usernames"].items()
+            }
+            kwargs["executor_id"] = executor_ids[username]
+
+        for _ in range(iterations):
+            await scenario.run(client, context, **kwargs)
+
+
+async def main(manifest_path: str, users_per_scenario: int, iterations: int, scenarios: List[str],
+               random_seed: int) -> Dict[str, Any]:
+    with open(manifest_path, mode="r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    context = ScenarioContext(manifest=manifest, recorder=Recorder(), rng=random.Random(random_seed))
+
+    async with app.router.lifespan_context(app):
+        # Сбрасываем счетчики попыток входа от предыдущих запусков
+        for key in await token_service.redis.keys("login_*"):
+            await token_service.redis.delete(key)
+
+        tasks = []
+        for scenario in SCENARIOS:
+            if scenarios and scenario.name not in scenarios:
+                continue
+
+            for username in manifest["users"][scenario.role][:users_per_scenario]:
+                tasks.append(virtual_user(scenario, username, context, iterations))
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started_at
+
+    return build_report(context.recorder, elapsed, {
+        "users_per_scenario": users_per_scenario,
+        "iterations": iterations,
+        "scenarios": scenarios or [scenario.name for scenario in SCENARIOS],
+        "seed": random_seed
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон сценариев по ролям через ASGI приложение")
+    parser.add_argument("--manifest", default="benchmarks/seed_manifest.json", help="Манифест из benchmarks.seed")
+    parser.add_argument("--users", type=int, default=10, help="Виртуальных пользователей на сценарий")
+    parser.add_argument("--iterations", type=int, default=20, help="Повторений сценария на пользователя")
+    parser.add_argument("--scenario", action="append", default=[], help="Запустить только указанные сценарии")
+    parser.add_argument("--seed", type=int, default=42, help="Зерно генератора случайных чисел")
+    parser.add_argument("--output", default=None, help="Файл для JSON отчета")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(
+        manifest_path=args.manifest,
+        users_per_scenario=args.users,
+        iterations=args.iterations,
+        scenarios=args.scenario,
+        random_seed=args.seed
+    ))
+
+    result = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, mode="w", encoding="utf-8") as file:
+            file.write(result)
+
+    print(result)
@@ -0,0 +1,177 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+import json
+import time
+import random
+import httpx
+
+
+# Подписанный файл: libmagic определяет CMS SignedData (PKCS#7) как application/octet-stream, как того ждет сервер
+SIGNED_FILE = b"0\x82\x05\x00\x06\x09*\x86H\x86\xf7\r\x01\x07\x02" + bytes(64)
+
+
+@dataclass
+class Recorder:
+    """Сбор задержек по эндпоинтам"""
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    async def call(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies.setdefault(name, []).append(time.perf_counter() - started_at)
+
+        if response.status_code >= 400:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+        return response
+
+
+@dataclass
+class ScenarioContext:
+    manifest: Dict[str, Any]
+    recorder: Recorder
+    rng: random.Random
+
+    def pop_request(self, status: str, judge_id: Optional[int] = None,
+                    executor_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        pool = self.manifest["requests"][status]
+        for i, request in enumerate(pool):
+            if judge_id is not None and request["judge_id"] != judge_id:
+                continue
+
+            if executor_id is not None and executor_id not in request["item_executors"]:
+                continue
+
+            return pool.pop(i)
+
+        return None
+
+
+async def login(client: httpx.AsyncClient, context: ScenarioContext, username: str) -> None:
+    response = await context.recorder.call(
+        client, "POST /token", "POST", "/token",
+        data={"username": username, "password": context.manifest["password"]}
+    )
+    response.raise_for_status()
+
+
+# Секретарь смотрит список и создает заявку
+async def secretary_create(client: httpx.AsyncClient, context: ScenarioContext) -> None:
+    await context.recorder.call(
+        client, "GET /request/view/list/requests", "GET", "/api/v1/request/view/list/requests",
+        params={"page": 1, "page_size": 10}
+    )
+    items = [
+        {"id": item_id, "quantity": context.rng.randint(1, 5)}
+        for item_id in context.rng.sample(context.manifest["item_ids"], k=context.rng.randint(1, 4))
+    ]
+    await context.recorder.call(
+        client, "POST /request/create", "POST", "/api/v1/request/create/",
+        data={"items": json.dumps(items), "description": "", "request_type": "0", "is_emergency": "false"}
+    )
+
+
+# Судья формирует pdf с подписью и загружает подписанный файл
+async def judge_sign(client: httpx.AsyncClient, context: ScenarioContext, judge_id: int) -> None:
+    await context.recorder.call(
+        client, "GET /request/view/list/requests", "GET", "/api/v1/request/view/list/requests",
+        params={"page": 1, "page_size": 10}
+    )
+
+    request = context.pop_request("REGISTERED", judge_id=judge_id)
+    if request is None:
+        return
+
+    registration_number = request["registration_number"]
+    now = datetime.now(UTC)
+    await context.recorder.call(
+        client, "POST /signature/generate-pdf/emblem", "POST",
+        f"/api/v1/signature/generate-pdf/emblem/{registration_number}",
+        json={
+            "owner": "CN=Бенчмарк, O=Тест",
+            "thumbprint": "00" * 20,
+            "valid_from": (now - timedelta(days=1)).isoformat(),
+            "valid_until": (now + timedelta(days=365)).isoformat()
+        }
+    )
+    await context.recorder.call(
+        client, "POST /signature/load-pdf/signed", "POST",
+        f"/api/v1/signature/load-pdf/signed/{registration_number}",
+        files={"file": (f"{registration_number}.pdf", SIGNED_FILE, "application/pdf")}
+    )
+
+
+# Сотрудник управления назначает сотрудника отдела
+async def management_redirect(client: httpx.AsyncClient, context: ScenarioContext) -> None:
+    await context.recorder.call(
+        client, "GET /request/view/filter/info", "GET", "/api/v1/request/view/filter/info"
+    )
+    await context.recorder.call(
+        client, "GET /request/view/list/requests", "GET", "/api/v1/request/view/list/requests",
+        params={"page": 1, "page_size": 10}
+    )
+
+    request = context.pop_request("CONFIRMED")
+    if request is None:
+        return
+
+    await context.recorder.call(
+        client, "PATCH /request/redirect/management", "PATCH",
+        f"/api/v1/request/redirect/management/{request['registration_number']}",
+        json={
+            "user_role_id": context.rng.choice(context.manifest["management_department_ids"]),
+            "description": "Назначено нагрузочным тестом"
+        }
+    )
+
+
+# Исполнитель открывает заявку из своего списка и выполняет назначенный ему предмет
+async def executor_complete(client: httpx.AsyncClient, context: ScenarioContext, executor_id: int) -> None:
+    await context.recorder.call(
+        client, "GET /request/view/list/requests", "GET", "/api/v1/request/view/list/requests",
+        params={"page": 1, "page_size": 10}
+    )
+
+    request = context.pop_request("IN_PROGRESS", executor_id=executor_id)
+    if request is None:
+        return
+
+    registration_number = request["registration_number"]
+    item_id = request["items"][request["item_executors"].index(executor_id)]
+    await context.recorder.call(
+        client, "GET /request/view/detail", "GET", f"/api/v1/request/view/detail/{registration_number}"
+    )
+    await context.recorder.call(
+        client, "PATCH /request/execute", "PATCH", f"/api/v1/request/execute/{registration_number}",
+        json={"id": item_id, "comment": "Выполнено"}
+    )
+
+
+# Сотрудник управления выгружает заявки в xlsx
+async def management_export(client: httpx.AsyncClient, context: ScenarioContext) -> None:
+    await context.recorder.call(
+        client, "GET /download/requests", "GET", "/api/v1/download/requests",
+        params={"status": context.rng.randrange(9)}
+    )
+
+
+@dataclass
+class Scenario:
+    name: str
+    role: str
+    run: Callable[..., Awaitable[None]]
+    # Сценарию нужен id профиля судьи или исполнителя, под которым выполнен вход
+    needs_judge_id: bool = False
+    needs_executor_id: bool = False
+
+
+SCENARIOS = [
+    Scenario("secretary_create", "SECRETARY", secretary_create),
+    Scenario("judge_sign", "JUDGE", judge_sign, needs_judge_id=True),
+    Scenario("management_redirect", "MANAGEMENT", management_redirect),
+    Scenario("executor_complete", "EXECUTOR", executor_complete, needs_executor_id=True),
+    Scenario("management_export", "MANAGEMENT", management_export),
+]
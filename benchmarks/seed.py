@@ -0,0 +1,356 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Iterable
+from datetime import datetime, timedelta, UTC
+import json
+import random
+import asyncio
+import argparse
+import sqlalchemy as sa
+from alembic import command
+# Внутренние модули
+from web_app.src.core import config, engine, get_alembic_config
+from web_app.src.models import (Base, User, UserRole, Secretary, Judge, Management, ManagementDepartment,
+                                Executor, ExecutorOrganization, Department, Category, Item, Request,
+                                RequestStatus, RequestType, RequestAction, RequestHistory, request_item,
+                                RequestItemStatus)
+from web_app.src.crud import sql_create_history_partitions
+from web_app.src.crud.request_list_view import get_request_list_view_upsert
+from web_app.src.utils.work_with_password import get_password_hash
+
+
+BENCH_PASSWORD = "bench-password"
+BATCH_SIZE = 1000
+
+LAST_NAMES = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Васильев", "Соколов", "Морозов"]
+FIRST_NAMES = ["Иван", "Петр", "Алексей", "Сергей", "Дмитрий", "Андрей", "Николай", "Михаил"]
+MIDDLE_NAMES = ["Иванович", "Петрович", "Алексеевич", "Сергеевич", "Дмитриевич", "Андреевич"]
+
+# Путь заявки по статусам: статус -> действия истории, которые к нему привели
+STATUS_HISTORY = {
+    RequestStatus.REGISTERED: [RequestAction.REGISTERED],
+    RequestStatus.CANCELLED: [RequestAction.REGISTERED, RequestAction.CANCELLED],
+    RequestStatus.CONFIRMED: [RequestAction.REGISTERED, RequestAction.CONFIRMED],
+    RequestStatus.IN_PROGRESS: [RequestAction.REGISTERED, RequestAction.CONFIRMED, RequestAction.IN_PROGRESS,
+                                RequestAction.APPOINTED],
+    RequestStatus.COMPLETED: [RequestAction.REGISTERED, RequestAction.CONFIRMED, RequestAction.IN_PROGRESS,
+                              RequestAction.APPOINTED, RequestAction.COMPLETED],
+    RequestStatus.ENDING_COMPLETED: [RequestAction.REGISTERED, RequestAction.CONFIRMED, RequestAction.IN_PROGRESS,
+                                     RequestAction.APPOINTED, RequestAction.COMPLETED,
+                                     RequestAction.ENDING_COMPLETED],
+    RequestStatus.FINISHED: [RequestAction.REGISTERED, RequestAction.CONFIRMED, RequestAction.IN_PROGRESS,
+                             RequestAction.APPOINTED, RequestAction.COMPLETED, RequestAction.ENDING_COMPLETED,
+                             RequestAction.FINISHED],
+}
+
+
+def random_full_name(rng: random.Random) -> str:
+    return f"{rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)} {rng.choice(MIDDLE_NAMES)}"
+
+
+# Старые заявки чаще завершены, свежие чаще в начале пути
+def pick_status(rng: random.Random, age_days: int) -> RequestStatus:
+    if age_days > 60:
+        weights = [1, 4, 1, 2, 4, 2, 86]
+    elif age_days > 14:
+        weights = [5, 5, 10, 30, 15, 5, 30]
+    else:
+        weights = [30, 5, 25, 30, 4, 1, 5]
+
+    return rng.choices(list(STATUS_HISTORY.keys()), weights=weights)[0]
+
+
+def chunks(rows: List[Dict[str, Any]], size: int = BATCH_SIZE) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+# Вставка пачками с возвратом id в порядке параметров
+async def insert_returning_ids(conn, table, rows: List[Dict[str, Any]]) -> List[int]:
+    ids = []
+    for batch in chunks(rows):
+        result = await conn.execute(
+            sa.insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            batch
+        )
+        ids.extend(result.scalars().all())
+
+    return ids
+
+
+async def insert_rows(conn, table, rows: List[Dict[str, Any]]) -> None:
+    for batch in chunks(rows):
+        await conn.execute(sa.insert(table), batch)
+
+
+async def seed(courts: int, days: int, requests_per_week: float, random_seed: int, reset: bool) -> Dict[str, Any]:
+    """Наполнение базы синтетическими данными, возвращает манифест для сценариев нагрузки"""
+    rng = random.Random(random_seed)
+    now = datetime.now(UTC)
+    password_hash = get_password_hash(BENCH_PASSWORD)
+
+    # Схема как у init_db.py для новой базы: расширение для триграммных индексов, таблицы по моделям,
+    # секции истории и пометка последней ревизией Alembic
+    async with engine.begin() as conn:
+        if reset:
+            await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    await sql_create_history_partitions(years_ahead=config.HISTORY_PARTITIONS_AHEAD)
+    # env.py Alembic запускает свой event loop, поэтому stamp выполняется в отдельном потоке
+    await asyncio.to_thread(command.stamp, get_alembic_config(), "head")
+
+    async with engine.begin() as conn:
+        # Участки
+        department_ids = await insert_returning_ids(conn, Department.__table__, [
+            {
+                "name": f"Судебный участок № {code}",
+                "code": code,
+                "address": f"Санкт-Петербург, ул. Тестовая, д. {code}",
+                "phone_numbers": [f"+7 812 000-{code:04d}"]
+            }
+            for code in range(1, courts + 1)
+        ])
+
+        # Каталог
+        category_ids = await insert_returning_ids(conn, Category.__table__, [
+            {"name": f"Категория {i}"} for i in range(1, 21)
+        ])
+        item_ids = await insert_returning_ids(conn, Item.__table__, [
+            {
+                "serial_number": f"bench-{category_id}-{i}",
+                "name": f"Предмет {category_id}-{i}",
+                "description": "Синтетический предмет",
+                "category_id": category_id
+            }
+            for category_id in category_ids for i in range(1, 51)
+        ])
+
+        # Пользователи всех ролей
+        def users_for(role: UserRole, prefix: str, count: int) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "username": f"bench_{prefix}_{i}",
+                    "email": f"bench_{prefix}_{i}@example.com",
+                    "full_name": random_full_name(rng),
+                    "password_hash": password_hash,
+                    "role": role
+                }
+                for i in range(1, count + 1)
+            ]
+
+        judge_users = users_for(UserRole.JUDGE, "judge", courts)
+        secretary_users = users_for(UserRole.SECRETARY, "secretary", courts)
+        management_users = users_for(UserRole.MANAGEMENT, "management", 5)
+        management_department_users = users_for(UserRole.MANAGEMENT_DEPARTMENT, "management_department", 10)
+        executor_users = users_for(UserRole.EXECUTOR, "executor", 30)
+        organization_users = users_for(UserRole.EXECUTOR_ORGANIZATION, "organization", 5)
+
+        user_ids = await insert_returning_ids(conn, User.__table__, (
+            judge_users + secretary_users + management_users + management_department_users +
+            executor_users + organization_users
+        ))
+        for user, user_id in zip(
+            judge_users + secretary_users + management_users + management_department_users +
+            executor_users + organization_users,
+            user_ids
+        ):
+            user["id"] = user_id
+
+        judge_ids = await insert_returning_ids(conn, Judge.__table__, [
+            {"user_id": user["id"], "department_id": department_id}
+            for user, department_id in zip(judge_users, department_ids)
+        ])
+        secretary_ids = await insert_returning_ids(conn, Secretary.__table__, [
+            {"user_id": user["id"], "judge_id": judge_id, "department_id": department_id}
+            for user, judge_id, department_id in zip(secretary_users, judge_ids, department_ids)
+        ])
+        management_ids = await insert_returning_ids(conn, Management.__table__, [
+            {"user_id": user["id"]} for user in management_users
+        ])
+        management_department_ids = await insert_returning_ids(conn, ManagementDepartment.__table__, [
+            {"user_id": user["id"], "division": f"Отдел {i}", "management_id": rng.choice(management_ids)}
+            for i, user in enumerate(management_department_users, start=1)
+        ])
+        executor_departments = [rng.choice(management_department_ids) for _ in executor_users]
+        executor_ids = await insert_returning_ids(conn, Executor.__table__, [
+            {"user_id": user["id"], "position": "Инженер", "management_department_id": management_department_id}
+            for user, management_department_id in zip(executor_users, executor_departments)
+        ])
+        executor_organization_ids = await insert_returning_ids(conn, ExecutorOrganization.__table__, [
+            {"user_id": user["id"], "name": f"Организация {i}"}
+            for i, user in enumerate(organization_users, start=1)
+        ])
+
+        # Заявки за период
+        total_requests = int(courts * days / 7 * requests_per_week)
+        request_rows = []
+        request_courts = []
+        for _ in range(total_requests):
+            court = rng.randrange(courts)
+            request_courts.append(court)
+            age_days = rng.randrange(days)
+            request_type = rng.choice([RequestType.MATERIAL, RequestType.TECHNICAL])
+            registration_number = f"bench-{rng.getrandbits(64):016x}"
+            status = pick_status(rng, age_days)
+
+            request_rows.append({
+                "registration_number": registration_number,
+                "description": "" if request_type == RequestType.MATERIAL else "Не работает оборудование",
+                "request_type": request_type,
+                "status": status,
+                "is_emergency": request_type == RequestType.TECHNICAL and rng.random() < 0.1,
+                "pdf_request_url": f"/u8ufy1/static/pdf_requests/not_signed/{registration_number}.pdf",
+                "pdf_signed_request_url": None if status == RequestStatus.REGISTERED else
+                f"/u8ufy1/static/pdf_requests/signed/{registration_number}.pdf",
+                "created_at": now - timedelta(days=age_days, minutes=rng.randrange(24 * 60)),
+                "secretary_id": secretary_ids[court],
+                "judge_id": judge_ids[court],
+                "department_id": department_ids[court],
+                "management_id": rng.choice(management_ids) if status in (
+                    RequestStatus.IN_PROGRESS, RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED,
+                    RequestStatus.FINISHED) else None,
+                "management_department_id": rng.choice(management_department_ids) if status in (
+                    RequestStatus.IN_PROGRESS, RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED,
+                    RequestStatus.FINISHED) else None,
+            })
+
+        request_ids = await insert_returning_ids(conn, Request.__table__, request_rows)
+
+        # Человекочитаемый номер как у sql_create_request: id-код участка-год
+        requests_table, departments_table = Request.__table__, Department.__table__
+        await conn.execute(
+            sa.update(requests_table)
+            .where(requests_table.c.department_id == departments_table.c.id,
+                   requests_table.c.id.in_(request_ids))
+            .values(human_registration_number=sa.func.concat(
+                requests_table.c.id, "-", departments_table.c.code, "-",
+                sa.cast(sa.extract("year", requests_table.c.created_at), sa.Integer)
+            ))
+        )
+
+        items_rows = []
+        history_rows = []
+        for request_id, row, court in zip(request_ids, request_rows, request_courts):
+            status = row["status"]
+            row["id"] = request_id
+            row["items"] = rng.sample(item_ids, k=rng.randint(1, 5))
+
+            executor_id = rng.choice(executor_ids) if row["management_department_id"] else None
+            row["item_executors"] = [executor_id] * len(row["items"])
+            item_status = {
+                RequestStatus.CANCELLED: RequestItemStatus.CANCELLED,
+                RequestStatus.COMPLETED: RequestItemStatus.COMPLETED,
+                RequestStatus.ENDING_COMPLETED: RequestItemStatus.COMPLETED,
+                RequestStatus.FINISHED: RequestItemStatus.COMPLETED,
+            }.get(status, RequestItemStatus.REGISTERED)
+
+            for item_id in row["items"]:
+                items_rows.append({
+                    "request_id": request_id,
+                    "item_id": item_id,
+                    "count": rng.randint(1, 10),
+                    "executor_id": executor_id,
+                    "status": item_status,
+                    "deadline_executor": row["created_at"] + timedelta(days=14) if executor_id else None
+                })
+
+            actor_user_id = secretary_users[court]["id"]
+            for step, action in enumerate(STATUS_HISTORY[status]):
+                history_rows.append({
+                    "action": action,
+                    "description": f"Заявка {action.value}",
+                    "created_at": row["created_at"] + timedelta(hours=step * rng.randint(1, 48)),
+                    "request_id": request_id,
+                    "user_id": actor_user_id
+                })
+
+        await insert_rows(conn, request_item, items_rows)
+        await insert_rows(conn, RequestHistory.__table__, history_rows)
+
+        # Списки заявок читаются из проекции: заполняем ее в той же транзакции
+        await conn.execute(get_request_list_view_upsert(sa.true()))
+
+    def pool(status: RequestStatus) -> List[Dict[str, Any]]:
+        return [
+            {
+                "registration_number": row["registration_number"],
+                "judge_id": row["judge_id"],
+                "management_id": row["management_id"],
+                "items": row["items"],
+                # Исполнитель каждого предмета (в том же порядке, что и items)
+                "item_executors": row["item_executors"]
+            }
+            for row in request_rows if row["status"] == status
+        ]
+
+    return {
+        "password": BENCH_PASSWORD,
+        "users": {
+            UserRole.SECRETARY.name: [user["username"] for user in secretary_users],
+            UserRole.JUDGE.name: [user["username"] for user in judge_users],
+            UserRole.MANAGEMENT.name: [user["username"] for user in management_users],
+            UserRole.MANAGEMENT_DEPARTMENT.name: [user["username"] for user in management_department_users],
+            UserRole.EXECUTOR.name: [user["username"] for user in executor_users],
+            UserRole.EXECUTOR_ORGANIZATION.name: [user["username"] for user in organization_users],
+        },
+        "judge_usernames": {judge_id: user["username"] for judge_id, user in zip(judge_ids, judge_users)},
+        "management_usernames": {
+            management_id: user["username"] for management_id, user in zip(management_ids, management_users)
+        },
+        "management_department_usernames": {
+            management_department_id: user["username"]
+            for management_department_id, user in zip(management_department_ids, management_department_users)
+        },
+        "executor_usernames": {
+            executor_id: user["username"] for executor_id, user in zip(executor_ids, executor_users)
+        },
+        # Отдел каждого исполнителя: сотрудник отдела назначает только исполнителей своего отдела
+        "executor_departments": dict(zip(executor_ids, executor_departments)),
+        "user_ids": {
+            user["username"]: user["id"]
+            for user in (judge_users + secretary_users + management_users + management_department_users +
+                         executor_users + organization_users)
+        },
+        "management_department_ids": management_department_ids,
+        "executor_ids": executor_ids,
+        "executor_organization_ids": executor_organization_ids,
+        "item_ids": item_ids,
+        "requests": {
+            status.name: pool(status)
+            for status in (RequestStatus.REGISTERED, RequestStatus.CONFIRMED, RequestStatus.IN_PROGRESS,
+                           RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED)
+        },
+        "counts": {
+            "departments": len(department_ids),
+            "users": len(user_ids),
+            "items": len(item_ids),
+            "requests": len(request_ids),
+            "request_items": len(items_rows),
+            "history": len(history_rows)
+        }
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Наполнение локальной базы синтетическими данными для нагрузки")
+    parser.add_argument("--courts", type=int, default=200, help="Количество судебных участков")
+    parser.add_argument("--days", type=int, default=365, help="Глубина истории в днях")
+    parser.add_argument("--requests-per-week", type=float, default=2, help="Заявок на участок в неделю")
+    parser.add_argument("--seed", type=int, default=42, help="Зерно генератора случайных чисел")
+    parser.add_argument("--reset", action="store_true", help="Удалить все таблицы перед наполнением")
+    parser.add_argument("--manifest", default="benchmarks/seed_manifest.json", help="Куда сохранить манифест")
+    args = parser.parse_args()
+
+    manifest = asyncio.run(seed(
+        courts=args.courts,
+        days=args.days,
+        requests_per_week=args.requests_per_week,
+        random_seed=args.seed,
+        reset=args.reset
+    ))
+
+    with open(args.manifest, mode="w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    print(json.dumps(manifest["counts"], ensure_ascii=False))
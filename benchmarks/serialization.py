@@ -0,0 +1,130 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Callable
+from types import SimpleNamespace
+from datetime import datetime, timezone
+import json
+import time
+import argparse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+# Внутренние модули
+from web_app.src.models import RequestStatus, RequestType
+from web_app.src.schemas import (RequestResponse, RightsResponse, RequestsPageResponse, ActualStatusRequest,
+                                 ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS, RIGHTS_BY_REQUEST_STATUS)
+
+
+USER_RIGHTS = {"view": True, "edit": False, "approve": False, "download": True}
+
+
+# Строки, похожие на результат запроса списка заявок
+def make_rows(count: int) -> List[SimpleNamespace]:
+    statuses = list(RequestStatus)
+    request_types = list(RequestType)
+    return [
+        SimpleNamespace(
+            registration_number=f"{i:08d}-0000-4000-8000-000000000000",
+            human_registration_number=f"2026/{i:06d}",
+            request_type=request_types[i % len(request_types)],
+            status=statuses[i % len(statuses)],
+            is_emergency=i % 7 == 0,
+            created_at=datetime(2026, 1, 1, 12, i % 60, tzinfo=timezone.utc)
+        )
+        for i in range(count)
+    ]
+
+
+# Прежний путь: валидация каждой строки, 13 сравнений статуса, jsonable_encoder и json.dumps
+def serialize_validated(rows: List[SimpleNamespace]) -> bytes:
+    requests = [
+        RequestResponse(
+            registration_number=row.registration_number,
+            human_registration_number=row.human_registration_number,
+            request_type={"name": row.request_type.name, "value": row.request_type.value},
+            status={"name": row.status.name, "value": row.status.value},
+            is_emergency=row.is_emergency,
+            created_at=row.created_at,
+            rights=RightsResponse(
+                view=True,
+                edit=row.status == RequestStatus.REGISTERED,
+                approve=row.status == RequestStatus.REGISTERED,
+                reject_before=row.status == RequestStatus.REGISTERED,
+                reject_after=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                redirect_management_department=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                redirect_executor=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                redirect_org=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                deadline=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                planning=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                ready=row.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
+                confirm_management_department=row.status == RequestStatus.COMPLETED,
+                confirm_management=row.status == RequestStatus.ENDING_COMPLETED
+            ),
+            actual_status=ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS.get(row.status, ActualStatusRequest.REGISTERED)
+        )
+        for row in rows
+    ]
+    return JSONResponse(jsonable_encoder({"rights": USER_RIGHTS, "requests": requests})).body
+
+
+# Новый путь: model_construct, права из таблицы по статусу, сериализация ядром pydantic
+def serialize_constructed(rows: List[SimpleNamespace]) -> bytes:
+    requests = [
+        RequestResponse.model_construct(
+            registration_number=row.registration_number,
+            human_registration_number=row.human_registration_number,
+            request_type={"name": row.request_type.name, "value": row.request_type.value},
+            status={"name": row.status.name, "value": row.status.value},
+            is_emergency=row.is_emergency,
+            created_at=row.created_at,
+            rights=RIGHTS_BY_REQUEST_STATUS[row.status],
+            actual_status=ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS.get(row.status, ActualStatusRequest.REGISTERED)
+        )
+        for row in rows
+    ]
+    return RequestsPageResponse.model_construct(rights=USER_RIGHTS, requests=requests).model_dump_json().encode()
+
+
+def normalize(body: bytes) -> Dict[str, Any]:
+    page = json.loads(body)
+    for request in page["requests"]:
+        request["created_at"] = datetime.fromisoformat(request["created_at"])
+
+    return page
+
+
+def measure(serializer: Callable[[List[SimpleNamespace]], bytes], rows: List[SimpleNamespace],
+            iterations: int) -> Dict[str, Any]:
+    serializer(rows)
+    timings = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        serializer(rows)
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    timings.sort()
+    return {
+        "median_ms": round(timings[len(timings) // 2], 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95)], 3)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Время сериализации страницы списка заявок")
+    parser.add_argument("--rows", type=int, default=100, help="Строк на странице")
+    parser.add_argument("--iterations", type=int, default=500, help="Количество повторов")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+
+    # Оба пути должны отдавать одинаковые данные (даты pydantic пишет с суффиксом Z вместо +00:00)
+    assert normalize(serialize_validated(rows)) == normalize(serialize_constructed(rows))
+
+    validated = measure(serialize_validated, rows, args.iterations)
+    constructed = measure(serialize_constructed, rows, args.iterations)
+
+    print(json.dumps({
+        "rows": args.rows,
+        "iterations": args.iterations,
+        "validated_jsonable_encoder": validated,
+        "model_construct_dump_json": constructed,
+        "speedup": round(validated["median_ms"] / constructed["median_ms"], 1)
+    }, ensure_ascii=False, indent=2))
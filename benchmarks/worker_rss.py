@@ -0,0 +1,67 @@
+# Внешние зависимости
+from typing import Dict, Any
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+
+# Каждый режим выполняется в отдельном процессе, имитируя воркер после импорта приложения и одной выгрузки
+SNIPPETS = {
+    "import_only": "",
+    "openpyxl_write_only": (
+        "from web_app.src.utils import build_xlsx\n"
+        "build_xlsx(rows, 'Заявки')\n"
+    ),
+    "pandas_excel_writer": (
+        "from io import BytesIO\n"
+        "import pandas as pd\n"
+        "output = BytesIO()\n"
+        "with pd.ExcelWriter(output, engine='openpyxl') as writer:\n"
+        "    pd.DataFrame(rows).to_excel(writer, sheet_name='Заявки', index=False)\n"
+    ),
+}
+
+TEMPLATE = """
+import json
+import web_app.main
+
+rows = [
+    {{
+        "Индентификатор": i,
+        "Номер": f"{{i:08d}}-0000-4000-8000-000000000000",
+        "Предметы": "Бумага А4 (5шт.)\\nКартридж (1шт.)",
+        "Тип": "Материально-техническое обеспечение",
+        "Статус": "Зарегистрирована",
+        "Аварийность": "Нет",
+        "Создана": "01.01.2026 12:00"
+    }}
+    for i in range({rows})
+]
+
+{snippet}
+
+status = dict(line.split(":", 1) for line in open("/proc/self/status") if line.startswith(("VmRSS", "VmHWM")))
+print(json.dumps({{key: int(value.split()[0]) // 1024 for key, value in status.items()}}))
+"""
+
+
+def measure(mode: str, rows: int) -> Dict[str, Any]:
+    code = TEMPLATE.format(rows=rows, snippet=SNIPPETS[mode])
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=os.environ.copy())
+
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+
+    memory = json.loads(result.stdout.strip().splitlines()[-1])
+    return {"rss_mb": memory["VmRSS"], "peak_rss_mb": memory["VmHWM"]}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RSS процесса воркера: выгрузка xlsx через openpyxl и через pandas")
+    parser.add_argument("--rows", type=int, default=10_000, help="Строк в выгрузке")
+    args = parser.parse_args()
+
+    report = {"rows": args.rows, "modes": {mode: measure(mode, args.rows) for mode in SNIPPETS}}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
@@ -0,0 +1,166 @@
+# Внешние зависимости
+from typing import Dict, List
+import os
+import re
+import gzip
+import json
+import hashlib
+import posixpath
+import brotli
+# Внутренние модули
+from web_app.src.core import config
+
+
+# Каталоги статики, которые отдаются браузеру (шрифты первыми: на них ссылаются стили)
+ASSET_DIRS = ("webfonts", "js", "css")
+# Текстовые форматы, для которых имеет смысл заранее сжатая копия (woff2 уже сжат)
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".svg", ".json", ".txt")
+HASH_LENGTH = 12
+
+CSS_URL_PATTERN = re.compile(r"url\(\s*(['\"]?)([^'\")]+)\1\s*\)")
+
+
+# Путь ресурса относительно корня статики для ссылки url(...) в файле стилей
+def resolve_css_reference(css_path: str, reference: str) -> str:
+    path = reference.split("?", 1)[0].split("#", 1)[0]
+    static_prefix = f"{config.STATIC_URL}/"
+
+    if path.startswith(static_prefix):
+        return path[len(static_prefix):]
+
+    if path.startswith(("/", "data:", "http:", "https:")):
+        return ""
+
+    return posixpath.normpath(posixpath.join(posixpath.dirname(css_path), path))
+
+
+# Замена ссылок на шрифты и изображения в стилях на версии с хешем
+def rewrite_css_urls(css_path: str, content: str, manifest: Dict[str, str]) -> str:
+    def replace(match: re.Match) -> str:
+        quote, reference = match.groups()
+        hashed = manifest.get(resolve_css_reference(css_path, reference))
+        if hashed is None:
+            return match.group(0)
+
+        suffix = reference[len(reference.split("?", 1)[0].split("#", 1)[0]):]
+        return f"url({quote}{config.STATIC_URL}/{hashed}{suffix}{quote})"
+
+    return CSS_URL_PATTERN.sub(replace, content)
+
+
+# Запись заранее сжатых копий для gzip_static / brotli_static (только если они меньше оригинала)
+def write_compressed(path: str, content: bytes) -> None:
+    variants = {
+        ".gz": gzip.compress(content, compresslevel=9, mtime=0),
+        ".br": brotli.compress(content, quality=11)
+    }
+
+    for extension, compressed in variants.items():
+        if len(compressed) < len(content):
+            with open(path + extension, mode="wb") as file:
+                file.write(compressed)
+
+
+# Атомарная запись JSON файла
+def write_json(path: str, data) -> None:
+    with open(f"{path}.tmp", mode="w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+# Манифесты прошлых сборок (от новых к старым) с учетом заменяемого текущего манифеста
+def update_manifest_history(history_path: str, manifest: Dict[str, str]) -> List[Dict[str, str]]:
+    history = []
+    if os.path.exists(history_path):
+        with open(history_path, mode="r", encoding="utf-8") as file:
+            history = json.load(file)
+
+    if os.path.exists(config.STATIC_MANIFEST):
+        with open(config.STATIC_MANIFEST, mode="r", encoding="utf-8") as file:
+            previous = json.load(file)
+
+        if previous != manifest:
+            history.insert(0, previous)
+
+    history = [item for item in history if item != manifest][:config.STATIC_KEEP_BUILDS]
+    write_json(history_path, history)
+    return history
+
+
+# Удаление файлов сборок, которых нет ни в новом манифесте, ни в хранимых прошлых
+def remove_stale_files(build_dir: str, manifests: List[Dict[str, str]]) -> int:
+    keep = set()
+    for manifest in manifests:
+        for hashed_path in manifest.values():
+            path = os.path.join(config.STATIC_DIR, hashed_path)
+            keep.update((path, f"{path}.gz", f"{path}.br"))
+
+    removed = 0
+    for root, _, file_names in os.walk(build_dir):
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            if root != build_dir and path not in keep:
+                os.remove(path)
+                removed += 1
+
+    return removed
+
+
+def build_static() -> Dict[str, str]:
+    """
+    Копирует ресурсы в каталог сборки с хешем содержимого в имени (css/styles.css -> css/styles.<hash>.css),
+    пишет manifest.json для static_url() и сжатые копии .gz/.br рядом с файлами
+    """
+    build_dir = os.path.join(config.STATIC_DIR, config.STATIC_BUILD_DIR)
+    os.makedirs(build_dir, exist_ok=True)
+
+    manifest = {}
+    for asset_dir in ASSET_DIRS:
+        source_dir = os.path.join(config.STATIC_DIR, asset_dir)
+        if not os.path.isdir(source_dir):
+            continue
+
+        for file_name in sorted(os.listdir(source_dir)):
+            source_path = os.path.join(source_dir, file_name)
+            if file_name.startswith(".") or not os.path.isfile(source_path):
+                continue
+
+            with open(source_path, mode="rb") as file:
+                content = file.read()
+
+            logical_path = f"{asset_dir}/{file_name}"
+            if file_name.endswith(".css"):
+                content = rewrite_css_urls(logical_path, content.decode("utf-8"), manifest).encode("utf-8")
+
+            digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+            stem, extension = os.path.splitext(file_name)
+            hashed_path = f"{config.STATIC_BUILD_DIR}/{asset_dir}/{stem}.{digest}{extension}"
+            manifest[logical_path] = hashed_path
+
+            # Имя определяется содержимым: уже собранный файл не перезаписывается
+            target_path = os.path.join(config.STATIC_DIR, hashed_path)
+            if os.path.exists(target_path):
+                continue
+
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            if extension in COMPRESSIBLE_EXTENSIONS:
+                write_compressed(target_path, content)
+
+            # Файл появляется под итоговым именем последним, поэтому прерванная сборка не оставит его обрезанным
+            with open(f"{target_path}.tmp", mode="wb") as file:
+                file.write(content)
+            os.replace(f"{target_path}.tmp", target_path)
+
+    # Прошлые сборки остаются на диске: уже открытые страницы продолжают получать свои файлы
+    history = update_manifest_history(os.path.join(build_dir, "manifest.history.json"), manifest)
+
+    # Манифест подменяется атомарно, когда все файлы уже на месте
+    write_json(config.STATIC_MANIFEST, manifest)
+
+    remove_stale_files(build_dir, [manifest] + history)
+    return manifest
+
+
+if __name__ == "__main__":
+    result = build_static()
+    print(f"Собрано файлов статики: {len(result)}")
@@ -0,0 +1,37 @@
+# Внешние зависимости
+import os
+import shutil
+import multiprocessing
+
+
+# Каталог метрик всех воркеров: задается до импорта prometheus_client (preload_app импортирует
+# приложение раньше хука on_starting) и очищается от файлов прошлого запуска
+prometheus_multiproc_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+shutil.rmtree(prometheus_multiproc_dir, ignore_errors=True)
+os.makedirs(prometheus_multiproc_dir, exist_ok=True)
+
+bind = os.getenv("WEB_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_WORKERS", multiprocessing.cpu_count()))
+
+# Воркеры не могут делить один RotatingFileHandler (строки теряются при ротации): логи пишутся только
+# в stdout, их собирает драйвер json-file и promtail. Задается до импорта приложения (preload_app)
+if workers > 1:
+    os.environ["LOG_TO_FILE"] = "false"
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Приложение импортируется один раз в мастере, воркеры получают его через fork
+preload_app = True
+
+# Плавная замена воркеров: после max_requests (с разбросом, чтобы не перезапускались одновременно)
+# воркер дообрабатывает текущие запросы в течение graceful_timeout и завершается
+max_requests = int(os.getenv("WEB_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.getenv("WEB_MAX_REQUESTS_JITTER", 1000))
+graceful_timeout = int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("WEB_TIMEOUT", 120))
+keepalive = 5
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,61 @@
+# Внешние зависимости
+import asyncio
+from sqlalchemy import inspect, text
+from alembic import command
+# Внутренние модули
+from web_app.src.core import config, engine, get_alembic_config
+from web_app.src.models import Base
+from web_app.src.crud import sql_create_history_partitions
+
+
+# Для базы без таблицы версий Alembic создаем таблицы по моделям
+async def create_tables_if_unversioned() -> bool:
+    try:
+        async with engine.begin() as conn:
+            is_versioned = await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table("alembic_version"))
+            if not is_versioned:
+                # Триграммные индексы поиска в админке требуют расширения pg_trgm
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.run_sync(Base.metadata.create_all)
+
+    finally:
+        await engine.dispose()
+
+    return is_versioned
+
+
+# Секции истории заявок на текущий и следующие годы (create_all создает только родительскую таблицу).
+# Ошибка не останавливает запуск: без новой секции строки попадают в секцию по умолчанию
+async def create_history_partitions():
+    try:
+        await sql_create_history_partitions(years_ahead=config.HISTORY_PARTITIONS_AHEAD)
+
+    except Exception as e:
+        config.logger.error("History partitions were not created, continuing startup: %s", e)
+
+    finally:
+        await engine.dispose()
+
+
+def init_db():
+    """
+    Подготовка схемы БД перед запуском воркеров:
+    база под управлением миграций обновляется до последней ревизии,
+    новая создается по моделям и помечается последней ревизией
+    """
+    is_versioned = asyncio.run(create_tables_if_unversioned())
+    alembic_config = get_alembic_config()
+
+    if is_versioned:
+        print("Применяем миграции")
+        command.upgrade(alembic_config, "head")
+
+    else:
+        print("Таблицы созданы, помечаем базу последней ревизией")
+        command.stamp(alembic_config, "head")
+
+    asyncio.run(create_history_partitions())
+
+
+if __name__ == "__main__":
+    init_db()
@@ -1,69 +1,110 @@
 # Внешние зависимости
-from typing import Dict
-import pandas as pd
+from typing import Iterator, Tuple, Optional, List
+import argparse
+import asyncio
+from openpyxl import load_workbook
 # Внутренние модули
-from web_app.src.crud import sql_create_category_and_items
-
-
-def parse_xlsx(filename: str) -> Dict[str, Dict[int, str]]:
-    df = pd.read_excel(f"{filename}.xlsx")
-    all_values = df.values.flatten().tolist()
-    current_category = None
-    current_items = {}
-    current_item_id = None
-    result = {}
-
-    for value in all_values:
-        if isinstance(value, str):
-            if value.isupper():
-                if current_category is not None:
-                    result[current_category] = current_items
-                    
-                current_category = value.capitalize()
-                current_items = {}
-                
+from web_app.src.crud import sql_upsert_category_and_items, sql_get_item_serial_numbers
+
+
+# Разбираем ячейку с названием и описанием товара
+def parse_item_value(value: str) -> Tuple[str, str]:
+    if value.startswith("Штамп") or value.startswith("Угловой штамп"):
+        if value.startswith("Угловой штамп"):
+            item_name_part_1, last_part = value.split(" ", 1)
+            item_name_part_2, description_item = last_part.split("\n", 1)
+            item_name = f"{item_name_part_1} {item_name_part_2}"
+
+        else:
+            item_name, description_item = value.split(" ", 1)
+
+        if "Штемпель" in description_item:
+            start_index_shtempel = description_item.find("Штемпель") - 1
+            end_index_shtempel = description_item[start_index_shtempel:].rfind(")")
+            if end_index_shtempel >= 0:
+                end_index_shtempel += start_index_shtempel + 1
+                item_name = f"{item_name} {description_item[start_index_shtempel:end_index_shtempel]}"
+                description_item = f"{description_item[:start_index_shtempel]}{description_item[end_index_shtempel:]}"
+
             else:
-                if current_category is not None and current_item_id is not None:
-                    if value.startswith("Штамп") or value.startswith("Угловой штамп"):
-                        if value.startswith("Угловой штамп"):
-                            item_name_part_1, last_part = value.split(" ", 1)
-                            item_name_part_2, description_item = last_part.split("\n", 1)
-                            item_name = f"{item_name_part_1} {item_name_part_2}"
-                            
-                        else:
-                            item_name, description_item = value.split(" ", 1)
-                            
-                        if "Штемпель" in description_item:
-                            start_index_shtempel = description_item.find("Штемпель") - 1
-                            end_index_shtempel = description_item[start_index_shtempel:].rfind(")")
-                            if end_index_shtempel >= 0:
-                                end_index_shtempel += start_index_shtempel + 1
-                                item_name = f"{item_name} {description_item[start_index_shtempel:end_index_shtempel]}"
-                                description_item = f"{description_item[:start_index_shtempel]}{description_item[end_index_shtempel:]}"
-                                
-                            else:
-                                item_name = f"{item_name} {description_item[start_index_shtempel:]})"
-                                description_item = f"{description_item[:start_index_shtempel]}"
-                        
-                    else:
-                        item_name, _, description_item = value.partition("(")
-                        description_item = description_item.replace(")", "", 1).strip()
-                    
-                    item_name = item_name.strip()
-                    description_item = description_item.strip()
-                    current_items[current_item_id] = (item_name, description_item)
-        
-        elif isinstance(value, int):
-            current_item_id = value
-    
-    if current_category is not None:
-        result[current_category] = current_items
-                    
-    return result
-    
-    
+                item_name = f"{item_name} {description_item[start_index_shtempel:]})"
+                description_item = f"{description_item[:start_index_shtempel]}"
+
+    else:
+        item_name, _, description_item = value.partition("(")
+        description_item = description_item.replace(")", "", 1).strip()
+
+    return item_name.strip(), description_item.strip()
+
+
+# Потоково читаем лист и отдаем строки (категория, номер, название, описание)
+def parse_xlsx(filename: str) -> Iterator[Tuple[str, str, str, str]]:
+    workbook = load_workbook(f"{filename}.xlsx", read_only=True, data_only=True)
+    try:
+        current_category: Optional[str] = None
+        current_item_id: Optional[int] = None
+
+        # Первая строка листа - заголовок
+        for row in workbook.active.iter_rows(min_row=2, values_only=True):
+            for value in row:
+                if isinstance(value, str):
+                    if value.isupper():
+                        current_category = value.capitalize()
+
+                    elif current_category is not None and current_item_id is not None:
+                        item_name, description_item = parse_item_value(value)
+                        yield current_category, str(current_item_id), item_name, description_item
+
+                elif isinstance(value, float) and value.is_integer():
+                    current_item_id = int(value)
+
+                elif isinstance(value, int) and not isinstance(value, bool):
+                    current_item_id = value
+
+    finally:
+        workbook.close()
+
+
+# Делим поток строк на пачки
+def batched(rows: Iterator[Tuple[str, str, str, str]], size: int) -> Iterator[List[Tuple[str, str, str, str]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def main(filename: str, batch_size: int):
+    existing_serial_numbers = await sql_get_item_serial_numbers()
+    seen_serial_numbers = set()
+    summary = {"categories_created": 0, "inserted": 0, "updated": 0, "unchanged": 0}
+
+    for batch in batched(parse_xlsx(filename=filename), size=batch_size):
+        seen_serial_numbers.update(serial_number for _, serial_number, _, _ in batch)
+        batch_summary = await sql_upsert_category_and_items(rows=batch)
+
+        for key, value in batch_summary.items():
+            summary[key] += value
+
+    missing = existing_serial_numbers - seen_serial_numbers
+
+    print(f"Категорий создано: {summary['categories_created']}")
+    print(f"Товаров добавлено: {summary['inserted']}")
+    print(f"Товаров обновлено: {summary['updated']}")
+    print(f"Товаров без изменений: {summary['unchanged']}")
+    print(f"Товаров нет в файле: {len(missing)}")
+    if missing:
+        print(", ".join(sorted(missing)))
+
+
 if __name__ == "__main__":
-    result = parse_xlsx(filename="items")
-    import asyncio
-    asyncio.run(sql_create_category_and_items(data=result))
-        
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Импорт каталога товаров из xlsx")
+    parser.add_argument("--filename", default="items", help="Имя файла без расширения")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Размер пачки для записи в базу")
+    args = parser.parse_args()
+
+    asyncio.run(main(filename=args.filename, batch_size=args.batch_size))
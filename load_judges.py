@@ -1,22 +1,12 @@
 # Внешние зависимости
-from typing import Dict
+from typing import Dict, List
+import os
 import re
 import secrets
 import asyncio
-from passlib.context import CryptContext
 import pandas as pd
 # Внутренние модули
-from web_app.src.crud import sql_add_user_judge
-
-
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto",
-    # Опциональные настройки для большей безопасности
-    argon2__time_cost=2,
-    argon2__memory_cost=1024,
-    argon2__parallelism=2,
-)
+from provision_users import provision_users
 
 
 def get_emails() -> Dict[int, str]:
@@ -55,34 +45,13 @@ def get_judges() -> Dict[int, str]:
     return result
 
 
-async def generate_judges():
-    emails = get_emails()
-    judges = get_judges()
+OUTPUT_FILENAME = "judge_users.xlsx"
+CHECKPOINT_FILENAME = "judge_users.checkpoint.json"
 
-    insert_data = []
-    for number_department, judge_name in judges.items():
-        email = emails[number_department]
-        username = email.split(".")[0]
-        password = secrets.token_urlsafe(6)[:8]
-        password_hash = pwd_context.hash(password)
-
-        data = {
-            "username": username,
-            "email": email,
-            "password": password,
-            "password_hash": password_hash,
-            "full_name": judge_name
-        }
 
-        insert_data.append(data)
-
-        await sql_add_user_judge(
-            department_code=number_department,
-            data=data
-        )
-
-    df = pd.DataFrame(insert_data)
-    df = df.drop(columns=["password_hash"])
+# Сохраняем логины и пароли созданных судей
+def save_judge_users(judge_users: List[dict]) -> None:
+    df = pd.DataFrame(judge_users, columns=["username", "email", "password", "full_name"])
 
     df = df.rename(columns={
         "username": "Логин",
@@ -91,13 +60,48 @@ async def generate_judges():
         "full_name": "ФИО Судьи"
     })
 
-    df.to_excel("judge_users.xlsx", index=False)
-    print("Файл успешно создан!")
+    df.to_excel(OUTPUT_FILENAME, index=False)
 
 
+async def generate_judges():
+    emails = get_emails()
+    judges = get_judges()
 
-if __name__ == "__main__":
-    asyncio.run(generate_judges())
+    insert_data = []
+    for number_department, judge_name in judges.items():
+        email = emails[number_department]
 
+        insert_data.append({
+            "username": email.split(".")[0],
+            "email": email,
+            "password": secrets.token_urlsafe(6)[:8],
+            "full_name": judge_name,
+            "department_code": number_department
+        })
+
+    # При продолжении прерванного запуска сохраняем уже выданные пароли
+    judge_users = []
+    if os.path.exists(CHECKPOINT_FILENAME) and os.path.exists(OUTPUT_FILENAME):
+        judge_users = pd.read_excel(OUTPUT_FILENAME).rename(columns={
+            "Логин": "username",
+            "Почта": "email",
+            "Пароль": "password",
+            "ФИО Судьи": "full_name"
+        }).to_dict(orient="records")
+
+    # Пароли записываются в файл сразу после сохранения каждой пачки в базе
+    def on_batch(created: List[dict]) -> None:
+        judge_users.extend(created)
+        save_judge_users(judge_users)
+
+    summary = await provision_users(
+        users=insert_data,
+        checkpoint_path=CHECKPOINT_FILENAME,
+        on_batch=on_batch
+    )
+    print(summary)
+    print("Файл успешно создан!")
 
 
+if __name__ == "__main__":
+    asyncio.run(generate_judges())
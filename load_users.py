@@ -2,15 +2,15 @@
 import asyncio
 import pandas as pd
 # Внутренние модули
-from web_app.src.utils import get_password_hash
-from web_app.src.crud import sql_add_user_judge, sql_add_user
+from provision_users import provision_users
 
 
 async def init_users():
     df = pd.read_excel("users.xlsx")
 
+    users = []
     # Цикл по строкам таблицы
-    for index, row in df.iterrows():
+    for row in df.to_dict(orient="records"):
         # Обращение к данным по имени колонки
         username = row["Логин"]
 
@@ -18,30 +18,17 @@ async def init_users():
         if "msud" in username:
             department_code = int(username.replace("msud", ""))
 
-        email = row["Почта"]
-        password = row["Пароль"]
-        full_name = row["ФИО"]
-
-        data = {
+        users.append({
             "username": username,
-            "email": email,
-            "password": password,
-            "password_hash": get_password_hash(password),
-            "full_name": full_name
-        }
-
-        if department_code is not None:
-            await sql_add_user_judge(
-                department_code=department_code,
-                data=data
-            )
+            "email": row["Почта"],
+            "password": row["Пароль"],
+            "full_name": row["ФИО"],
+            "department_code": department_code
+        })
 
-        else:
-            await sql_add_user(data=data)
+    summary = await provision_users(users=users, checkpoint_path="users.checkpoint.json")
+    print(summary)
 
 
 if __name__ == "__main__":
     asyncio.run(init_users())
-
-
-
@@ -0,0 +1,102 @@
+# Внешние зависимости
+from typing import List, Dict, Optional, Callable, Set
+from concurrent.futures import ProcessPoolExecutor
+import os
+import json
+import asyncio
+import argparse
+# Внутренние модули
+from web_app.src.utils.work_with_password import get_password_hash
+from web_app.src.crud import sql_bulk_add_users
+
+
+# Хешируем пароли в отдельном процессе
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return [get_password_hash(password) for password in passwords]
+
+
+# Читаем обработанные логины из контрольной точки
+def load_checkpoint(checkpoint_path: str) -> Set[str]:
+    if not os.path.exists(checkpoint_path):
+        return set()
+
+    with open(checkpoint_path, mode="r", encoding="utf-8") as file:
+        return set(json.load(file)["done"])
+
+
+# Сохраняем контрольную точку атомарно, чтобы прерванный запуск не испортил файл
+def save_checkpoint(checkpoint_path: str, done: Set[str]) -> None:
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, mode="w", encoding="utf-8") as file:
+        json.dump({"done": sorted(done)}, file, ensure_ascii=False)
+
+    os.replace(temp_path, checkpoint_path)
+
+
+async def provision_users(
+    users: List[dict],
+    checkpoint_path: str,
+    batch_size: int = 200,
+    workers: Optional[int] = None,
+    on_batch: Optional[Callable[[List[dict]], None]] = None
+) -> Dict[str, int]:
+    """
+    Массовое создание пользователей.
+    Каждый элемент users: username, email, password, full_name и необязательный department_code.
+    """
+    done = load_checkpoint(checkpoint_path)
+    pending = [user for user in users if user["username"] not in done]
+    summary = {"created": 0, "skipped": 0, "resumed": len(users) - len(pending)}
+
+    workers = workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+
+            # Делим пачку между процессами, argon2 нагружает процессор
+            chunk_size = max(1, -(-len(batch) // workers))
+            chunks = [batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)]
+            hashed_chunks = await asyncio.gather(*(
+                loop.run_in_executor(executor, hash_passwords, [user["password"] for user in chunk])
+                for chunk in chunks
+            ))
+
+            for chunk, hashes in zip(chunks, hashed_chunks):
+                for user, password_hash in zip(chunk, hashes):
+                    user["password_hash"] = password_hash
+
+            result = await sql_bulk_add_users(users=batch)
+            created = set(result["created"])
+            summary["created"] += len(created)
+            summary["skipped"] += result["skipped"]
+
+            if on_batch is not None:
+                on_batch([user for user in batch if user["username"] in created])
+
+            done.update(user["username"] for user in batch)
+            save_checkpoint(checkpoint_path, done)
+
+            print(f"Обработано {min(start + batch_size, len(pending))} из {len(pending)}")
+
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Массовое создание пользователей из JSON файла")
+    parser.add_argument("filename", help="JSON файл со списком пользователей")
+    parser.add_argument("--checkpoint", default="provision_users.checkpoint.json", help="Файл контрольной точки")
+    parser.add_argument("--batch-size", type=int, default=200, help="Размер пачки для записи в базу")
+    parser.add_argument("--workers", type=int, default=None, help="Количество процессов для хеширования")
+    args = parser.parse_args()
+
+    with open(args.filename, mode="r", encoding="utf-8") as file:
+        users_data = json.load(file)
+
+    print(asyncio.run(provision_users(
+        users=users_data,
+        checkpoint_path=args.checkpoint,
+        batch_size=args.batch_size,
+        workers=args.workers
+    )))
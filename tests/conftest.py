@@ -0,0 +1,224 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Optional
+import os
+import sys
+import asyncio
+import itertools
+import pytest
+
+
+# Тесты наполняют базу заново (drop_all), поэтому работают только с отдельной базой из TEST_DATABASE_URL
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+# Приложение собирается с QueryBudgetMiddleware в строгом режиме: превышение бюджета - исключение
+os.environ["QUERY_BUDGET_MODE"] = "strict"
+# Схема создается из моделей, ревизия Alembic не проверяется
+os.environ["DB_REVISION_CHECK"] = "off"
+
+
+class Dataset:
+    """Данные наполненной базы для вызова эндпоинтов от имени каждой роли"""
+
+    def __init__(self, manifest: Dict[str, Any], portal):
+        self.manifest = manifest
+        self.portal = portal
+        self.password = manifest["password"]
+        self._counter = itertools.count(1)
+        self.pools: Dict[str, List[Dict[str, Any]]] = {
+            status: list(pool) for status, pool in manifest["requests"].items()
+        }
+
+        # Секретарь и судья с индексом 0 относятся к одному участку: берем заявки этого судьи
+        judge_username = manifest["users"]["JUDGE"][0]
+        self.judge_id = next(
+            judge_id for judge_id, username in manifest["judge_usernames"].items() if username == judge_username
+        )
+
+        # Исполнитель и управление с наибольшим числом заявок в работе: изменяющим вызовам хватит своих заявок,
+        # сотрудник отдела - из отдела исполнителя, иначе он не может его назначить
+        in_progress = self.pools["IN_PROGRESS"]
+        self.executor_id = max(
+            manifest["executor_usernames"],
+            key=lambda executor_id: sum(executor_id in request["item_executors"] for request in in_progress)
+        )
+        self.management_id = max(
+            manifest["management_usernames"],
+            key=lambda management_id: sum(request["management_id"] == management_id for request in in_progress)
+        )
+        self.management_department_id = manifest["executor_departments"][self.executor_id]
+
+        self.usernames = {role: usernames[0] for role, usernames in manifest["users"].items()}
+        self.usernames.update({
+            "EXECUTOR": manifest["executor_usernames"][self.executor_id],
+            "MANAGEMENT": manifest["management_usernames"][self.management_id],
+            "MANAGEMENT_DEPARTMENT": manifest["management_department_usernames"][self.management_department_id],
+        })
+
+    def username(self, role: str) -> str:
+        return self.usernames[role]
+
+    def user_id(self, role: str) -> int:
+        return self.manifest["user_ids"][self.username(role)]
+
+    def in_scope(self, request: Dict[str, Any], role: Optional[str]) -> bool:
+        """Заявка, с которой роль может работать: своя или еще не назначенная"""
+        if role in (None, "SECRETARY", "JUDGE"):
+            return request["judge_id"] == self.judge_id
+
+        if role == "EXECUTOR":
+            return bool({None, self.executor_id} & set(request["item_executors"]))
+
+        if role == "MANAGEMENT":
+            return request["management_id"] in (None, self.management_id)
+
+        return True
+
+    def take(self, status: str, role: Optional[str]) -> Dict[str, Any]:
+        """Заявка в статусе для роли: изменяющие вызовы получают новую, пока пул не исчерпан"""
+        pool = [request for request in self.pools[status] if self.in_scope(request, role)]
+        if len(pool) > 1:
+            self.pools[status].remove(pool[0])
+
+        return pool[0]
+
+    def peek(self, status: str, role: Optional[str]) -> Dict[str, Any]:
+        """Заявка в статусе для вызовов, которые ее не изменяют"""
+        return [request for request in self.pools[status] if self.in_scope(request, role)][-1]
+
+    def item(self, request: Dict[str, Any], role: Optional[str]) -> int:
+        """Предмет заявки: исполнитель работает только со своими предметами"""
+        if role == "EXECUTOR":
+            return request["items"][request["item_executors"].index(self.executor_id)]
+
+        return request["items"][0]
+
+    def attachment(self, request: Dict[str, Any]) -> str:
+        """Вложение заявки: запись в базе и файл во временном каталоге документов"""
+        import sqlalchemy as sa
+        from web_app.src.core import config
+        from web_app.src.core.database import AsyncSessionLocal
+        from web_app.src.models import Request, RequestDocument
+
+        content = b"%PDF-1.4\n%%EOF\n"
+        file_name = f"{self.unique('test_attachment')}.pdf"
+        file_path = os.path.join(config.USER_DOCUMENTS, file_name)
+        with open(file_path, "wb") as file:
+            file.write(content)
+
+        async def insert() -> None:
+            async with AsyncSessionLocal() as session:
+                request_id = await session.scalar(
+                    sa.select(Request.id).where(Request.registration_number == request["registration_number"])
+                )
+                session.add(RequestDocument(
+                    document_type="pdf", file_path=file_path, file_name=file_name, size=len(content),
+                    request_id=request_id
+                ))
+                await session.commit()
+
+        self.portal.call(insert)
+        return file_name
+
+    def unique(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._counter)}"
+
+    def reset_password_token(self) -> str:
+        """Токен смены пароля для пользователя, под которым тесты не входят"""
+        from web_app.src.utils import token_service
+
+        token = self.unique("test_reset")
+        user_id = self.manifest["user_ids"][self.manifest["users"]["EXECUTOR_ORGANIZATION"][-1]]
+        self.portal.call(token_service.add_reset_password_token, token, user_id)
+        return token
+
+    def secretary_token(self) -> str:
+        """Токен подтверждения создания секретаря (как после POST /create/secretary)"""
+        from web_app.src.utils import token_service
+        from web_app.src.utils.work_with_password import get_password_hash
+
+        token = self.unique("test_secretary")
+        self.portal.call(token_service.add_data_secretary, token, {
+            "full_name": "Тестовый Секретарь",
+            "username": self.unique("test_secretary"),
+            "password": get_password_hash(self.password),
+            "judge_id": self.judge_id
+        })
+        return token
+
+
+async def _seed() -> Dict[str, Any]:
+    from web_app.src.core import engine
+    from benchmarks.seed import seed
+
+    try:
+        return await seed(courts=3, days=60, requests_per_week=40, random_seed=42, reset=True)
+
+    finally:
+        # Соединения пула привязаны к event loop наполнения, приложение откроет свои
+        await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def app():
+    from web_app.main import app
+    from web_app.src.middlewares import QueryBudgetMiddleware
+
+    budget_middleware = [
+        middleware for middleware in app.user_middleware if middleware.cls is QueryBudgetMiddleware
+    ]
+    assert budget_middleware and budget_middleware[0].kwargs["mode"] == "strict"
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def manifest() -> Dict[str, Any]:
+    return asyncio.run(_seed())
+
+
+@pytest.fixture(scope="session")
+def client(app, manifest, tmp_path_factory):
+    from fastapi.testclient import TestClient
+    from web_app.src.core import config
+
+    monkeypatch = pytest.MonkeyPatch()
+
+    # PDF и вложения пишутся во временный каталог: очистка хранилища при старте приложения
+    # не должна удалять файлы рабочего дерева, которых нет в тестовой базе
+    storage = tmp_path_factory.mktemp("storage")
+    for directory in ("pdf_requests/temp", "pdf_requests/signed", "pdf_requests/not_signed", "user_documents"):
+        (storage / directory).mkdir(parents=True)
+    monkeypatch.setattr(config, "PDF_REQUESTS", str(storage / "pdf_requests"))
+    monkeypatch.setattr(config, "USER_DOCUMENTS", str(storage / "user_documents"))
+
+    # Письма не отправляются: SMTP в тестах недоступен
+    authentication_router = sys.modules["web_app.src.routers.authentication_router"]
+    monkeypatch.setattr(authentication_router, "send_password_reset_email", lambda **kwargs: True)
+    monkeypatch.setattr(authentication_router, "send_confirm_create_secretary_email", lambda **kwargs: True)
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def dataset(client, manifest) -> Dataset:
+    return Dataset(manifest=manifest, portal=client.portal)
+
+
+@pytest.fixture
+def login_as(client, dataset):
+    """Вход от имени роли (None - запрос без входа)"""
+
+    def login(role: Optional[str]) -> None:
+        client.cookies.clear()
+        if role is None:
+            return
+
+        response = client.post("/token", data={"username": dataset.username(role), "password": dataset.password})
+        assert response.status_code == 200, response.text
+
+    return login
@@ -0,0 +1,299 @@
+# Внешние зависимости
+from typing import Dict, List, Any, Callable, Tuple, Optional
+from datetime import datetime, timedelta, UTC
+import os
+import json
+import httpx
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL не задан: нужна отдельная база PostgreSQL и Redis", allow_module_level=True)
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+# Внутренние модули
+from web_app.main import app
+from web_app.src.core.database import AsyncSessionLocal
+from web_app.src.middlewares import QueryBudgetMiddleware, QueryBudgetExceeded, query_budget
+from web_app.src.models import User, UserRole
+
+
+# Эндпоинты без бюджета: бесконечный поток событий и метрики Prometheus
+EXEMPT_PATHS = {"/api/v1/events/requests", "/metrics"}
+
+ROLES = [None] + [role.name for role in UserRole]
+
+ROUTES = [
+    route for route in app.routes
+    if isinstance(route, APIRoute) and route.path not in EXEMPT_PATHS
+]
+
+
+# Ожидаемые коды ответа по ролям: без входа 401, указанным ролям 200, остальным 403
+def allowed(*roles: str) -> Dict[Optional[str], int]:
+    return {role: 401 if role is None else 200 if role in roles else 403 for role in ROLES}
+
+
+# Эндпоинты, доступные без входа
+PUBLIC = dict.fromkeys(ROLES, 200)
+
+MANAGEMENTS = ("MANAGEMENT", "MANAGEMENT_DEPARTMENT")
+EXECUTORS = ("EXECUTOR", "EXECUTOR_ORGANIZATION")
+AUTHORS = ("SECRETARY", "JUDGE")
+
+# Коды ответа по эндпоинту; остальные эндпоинты доступны любому вошедшему пользователю
+EXPECTED_STATUS: Dict[Tuple[str, str], Dict[Optional[str], int]] = {
+    ("GET", "/api/v1/judges"): PUBLIC,
+    ("GET", "/api/v1/request/view/data/{registration_number}"): PUBLIC,
+    ("GET", "/api/v1/user/{user_id}"): PUBLIC,
+    ("GET", "/black_tokens"): PUBLIC,
+    ("GET", "/confirm-create-secretary"): PUBLIC,
+    ("GET", "/create-secretary"): PUBLIC,
+    ("GET", "/login"): PUBLIC,
+    ("GET", "/login/forgot-password"): PUBLIC,
+    ("GET", "/login/reset-password"): PUBLIC,
+    ("GET", "/logout"): dict.fromkeys(ROLES, 303),
+    ("POST", "/api/v1/check/username"): PUBLIC,
+    ("POST", "/create/secretary"): PUBLIC,
+    ("POST", "/create/secretary/confirm"): PUBLIC,
+    ("POST", "/login/forgot-password"): PUBLIC,
+    ("POST", "/logout"): PUBLIC,
+    ("POST", "/token"): PUBLIC,
+    ("GET", "/api/v1/download/planning"): allowed(*MANAGEMENTS),
+    ("GET", "/api/v1/download/requests"): allowed(*MANAGEMENTS),
+    ("GET", "/api/v1/request/create/executors"): allowed(*MANAGEMENTS),
+    ("GET", "/api/v1/request/create/info"): allowed(*AUTHORS),
+    ("GET", "/api/v1/request/create/item"): allowed(*AUTHORS),
+    ("GET", "/api/v1/request/create/managements"): allowed("MANAGEMENT"),
+    ("GET", "/api/v1/request/create/organizations"): allowed(*MANAGEMENTS, "EXECUTOR"),
+    ("GET", "/api/v1/request/view/list/planning"): allowed(*MANAGEMENTS, *EXECUTORS),
+    ("GET", "/planning"): allowed(*MANAGEMENTS, *EXECUTORS),
+    ("GET", "/request/{registration_number}/edit"): allowed(*AUTHORS),
+    ("GET", "/request/{registration_number}/redirect/management"): allowed("MANAGEMENT"),
+    ("GET", "/signature/{registration_number}"): allowed("JUDGE"),
+    ("POST", "/api/v1/request/create/"): allowed(*AUTHORS),
+    ("POST", "/api/v1/signature/generate-pdf/emblem/{registration_number}"): allowed("JUDGE"),
+    ("POST", "/api/v1/signature/load-pdf/signed/{registration_number}"): allowed("JUDGE"),
+    ("DELETE", "/api/v1/request/attachment/{registration_number}/{filename}"): allowed(*AUTHORS),
+    ("PATCH", "/api/v1/request/edit/{registration_number}"): allowed(*AUTHORS),
+    ("PATCH", "/api/v1/request/reject/{registration_number}"): allowed("JUDGE", "MANAGEMENT"),
+    ("PATCH", "/api/v1/request/redirect/management/{registration_number}"): allowed("MANAGEMENT"),
+    ("PATCH", "/api/v1/request/redirect/executor/{registration_number}"): allowed(*MANAGEMENTS),
+    ("PATCH", "/api/v1/request/redirect/organization/{registration_number}"): allowed(*MANAGEMENTS, "EXECUTOR"),
+    ("PATCH", "/api/v1/request/execute/{registration_number}"): allowed(*MANAGEMENTS, *EXECUTORS),
+    ("PATCH", "/api/v1/request/planning/{registration_number}"): allowed("EXECUTOR"),
+    ("PATCH", "/api/v1/request/bulk/finish"): allowed(*MANAGEMENTS),
+    ("PATCH", "/api/v1/request/bulk/reject"): allowed("JUDGE", "MANAGEMENT"),
+    ("PATCH", "/api/v1/request/bulk/redirect/management"): allowed("MANAGEMENT"),
+    ("PATCH", "/api/v1/request/bulk/redirect/executor"): allowed(*MANAGEMENTS),
+    ("PATCH", "/api/v1/request/bulk/redirect/organization"): allowed("EXECUTOR"),
+}
+
+# Статус заявки, подставляемой в {registration_number} и в массовые действия: изменяющие вызовы берут заявку,
+# для которой действие допустимо
+PATH_STATUS = {
+    ("PATCH", "/api/v1/request/edit/{registration_number}"): "REGISTERED",
+    ("PATCH", "/api/v1/request/reject/{registration_number}"): "REGISTERED",
+    ("PATCH", "/api/v1/request/redirect/management/{registration_number}"): "CONFIRMED",
+    ("DELETE", "/api/v1/request/attachment/{registration_number}/{filename}"): "REGISTERED",
+    ("POST", "/api/v1/signature/generate-pdf/emblem/{registration_number}"): "REGISTERED",
+    ("POST", "/api/v1/signature/load-pdf/signed/{registration_number}"): "REGISTERED",
+    ("GET", "/request/{registration_number}/edit"): "REGISTERED",
+    ("GET", "/request/{registration_number}/redirect/management"): "CONFIRMED",
+    ("GET", "/signature/{registration_number}"): "REGISTERED",
+    ("PATCH", "/api/v1/request/bulk/reject"): "REGISTERED",
+    ("PATCH", "/api/v1/request/bulk/redirect/management"): "CONFIRMED",
+    # Массовое назначение пропускает заявки, где исполнитель уже назначен
+    ("PATCH", "/api/v1/request/bulk/redirect/executor"): "CONFIRMED",
+}
+
+# Статус заявки, когда действие роли отличается: управление отклоняет заявки в работе,
+# сотрудник отдела подтверждает выполнение, управление завершает подтвержденные
+ROLE_STATUS = {
+    ("PATCH", "/api/v1/request/reject/{registration_number}"): {"MANAGEMENT": "IN_PROGRESS"},
+    ("PATCH", "/api/v1/request/bulk/reject"): {"MANAGEMENT": "IN_PROGRESS"},
+    ("PATCH", "/api/v1/request/execute/{registration_number}"): {
+        "MANAGEMENT": "ENDING_COMPLETED", "MANAGEMENT_DEPARTMENT": "COMPLETED"
+    },
+    ("PATCH", "/api/v1/request/bulk/finish"): {
+        "MANAGEMENT": "ENDING_COMPLETED", "MANAGEMENT_DEPARTMENT": "COMPLETED"
+    },
+}
+
+# Подписанный файл: libmagic определяет CMS SignedData (PKCS#7) как application/octet-stream
+SIGNED_FILE = b"0\x82\x05\x00\x06\x09*\x86H\x86\xf7\r\x01\x07\x02" + bytes(64)
+
+
+def deadline() -> str:
+    return (datetime.now(UTC) + timedelta(days=7)).isoformat()
+
+
+def request_form(dataset, requests: List[Dict[str, Any]], role: Optional[str]) -> Dict[str, Any]:
+    return {
+        "data": {
+            "items": json.dumps([{"id": item_id, "quantity": 1} for item_id in requests[0]["items"]]),
+            "description": "",
+            "request_type": "0",
+            "is_emergency": "false"
+        }
+    }
+
+
+def registration_numbers(requests: List[Dict[str, Any]]) -> List[str]:
+    return [request["registration_number"] for request in requests]
+
+
+# Параметры вызова по эндпоинту: (dataset, заявки для пути или массового действия, роль) -> аргументы httpx
+CALLS: Dict[Tuple[str, str], Callable[..., Dict[str, Any]]] = {
+    ("GET", "/api/v1/request/create/item"): lambda dataset, requests, role: {"params": {"search": "Предмет"}},
+    ("POST", "/api/v1/request/create/"): request_form,
+    ("GET", "/api/v1/request/view/list/requests"): lambda dataset, requests, role: {
+        "params": {"page": 1, "page_size": 10}
+    },
+    ("GET", "/api/v1/request/view/list/planning"): lambda dataset, requests, role: {
+        "params": {"page": 1, "page_size": 10}
+    },
+    ("GET", "/login/reset-password"): lambda dataset, requests, role: {
+        "params": {"token": dataset.reset_password_token()}
+    },
+    ("GET", "/confirm-create-secretary"): lambda dataset, requests, role: {
+        "params": {"token": dataset.secretary_token()}
+    },
+    ("POST", "/api/v1/check/username"): lambda dataset, requests, role: {
+        "json": {"username": dataset.username("SECRETARY")}
+    },
+    ("PATCH", "/api/v1/request/edit/{registration_number}"): request_form,
+    ("PATCH", "/api/v1/request/reject/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"comment": "Отклонено тестом"}
+    },
+    ("PATCH", "/api/v1/request/redirect/management/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"user_role_id": dataset.management_department_id, "description": "Тест"}
+    },
+    ("PATCH", "/api/v1/request/redirect/executor/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"user_role_id": dataset.executor_id, "description": "Тест",
+                 "item_id": dataset.item(requests[0], role), "deadline": deadline()}
+    },
+    ("PATCH", "/api/v1/request/redirect/organization/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"user_role_id": dataset.manifest["executor_organization_ids"][0], "description": "Тест",
+                 "item_id": dataset.item(requests[0], role), "deadline": deadline()}
+    },
+    ("PATCH", "/api/v1/request/execute/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"id": dataset.item(requests[0], role), "comment": "Выполнено тестом"}
+    },
+    ("PATCH", "/api/v1/request/planning/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"item_id": dataset.item(requests[0], role), "deadline": deadline()}
+    },
+    ("POST", "/token"): lambda dataset, requests, role: {
+        "data": {"username": dataset.username("MANAGEMENT"), "password": dataset.password}
+    },
+    ("POST", "/login/forgot-password"): lambda dataset, requests, role: {
+        "json": {"email": f"{dataset.username('MANAGEMENT')}@example.com"}
+    },
+    ("POST", "/create/secretary"): lambda dataset, requests, role: {
+        "json": {"full_name": "Тестовый Секретарь", "username": dataset.unique("test_secretary"),
+                 "password": dataset.password, "judge_id": dataset.judge_id}
+    },
+    ("POST", "/create/secretary/confirm"): lambda dataset, requests, role: {
+        "json": {"token": dataset.secretary_token()}
+    },
+    ("GET", "/api/v1/download/requests"): lambda dataset, requests, role: {"params": {"status": 0}},
+    ("POST", "/api/v1/signature/generate-pdf/emblem/{registration_number}"): lambda dataset, requests, role: {
+        "json": {"owner": "CN=Тест, O=Тест", "thumbprint": "00" * 20,
+                 "valid_from": (datetime.now(UTC) - timedelta(days=1)).isoformat(),
+                 "valid_until": (datetime.now(UTC) + timedelta(days=365)).isoformat()}
+    },
+    ("POST", "/api/v1/signature/load-pdf/signed/{registration_number}"): lambda dataset, requests, role: {
+        "files": {"file": (f"{requests[0]['registration_number']}.pdf", SIGNED_FILE, "application/pdf")}
+    },
+    ("PATCH", "/api/v1/request/bulk/finish"): lambda dataset, requests, role: {
+        "json": {"registration_numbers": registration_numbers(requests)}
+    },
+    ("PATCH", "/api/v1/request/bulk/reject"): lambda dataset, requests, role: {
+        "json": {"registration_numbers": registration_numbers(requests), "comment": "Отклонено тестом"}
+    },
+    ("PATCH", "/api/v1/request/bulk/redirect/management"): lambda dataset, requests, role: {
+        "json": {"registration_numbers": registration_numbers(requests),
+                 "user_role_id": dataset.management_department_id}
+    },
+    ("PATCH", "/api/v1/request/bulk/redirect/executor"): lambda dataset, requests, role: {
+        "json": {"registration_numbers": registration_numbers(requests),
+                 "user_role_id": dataset.executor_id, "deadline": deadline()}
+    },
+    ("PATCH", "/api/v1/request/bulk/redirect/organization"): lambda dataset, requests, role: {
+        "json": {"registration_numbers": registration_numbers(requests),
+                 "user_role_id": dataset.manifest["executor_organization_ids"][0], "deadline": deadline()}
+    },
+}
+
+
+# Ожидаемый код ответа эндпоинта для роли
+def expected_status(route: APIRoute, role: Optional[str]) -> int:
+    key = (next(iter(route.methods)), route.path)
+    return EXPECTED_STATUS.get(key, allowed(*ROLES))[role]
+
+
+# Метод, путь и аргументы вызова эндпоинта
+def build_call(route: APIRoute, role: Optional[str], dataset) -> Tuple[str, str, Dict[str, Any]]:
+    method = next(iter(route.methods))
+    key = (method, route.path)
+    succeeds = expected_status(route, role) < 300
+
+    # Заявку расходуют только успешные изменяющие вызовы, остальные ее не меняют
+    status = ROLE_STATUS.get(key, {}).get(role) or PATH_STATUS.get(key, "IN_PROGRESS")
+    pick = dataset.take if method != "GET" and succeeds else dataset.peek
+    requests = [pick(status, role) for _ in range(2 if "/bulk/" in route.path else 1)]
+
+    url = route.path.format(
+        registration_number=requests[0]["registration_number"],
+        filename=dataset.attachment(requests[0]) if "{filename}" in route.path and succeeds else "missing.pdf",
+        user_id=dataset.user_id("SECRETARY")
+    )
+    kwargs = CALLS[key](dataset, requests, role) if key in CALLS else {}
+
+    return method, url, kwargs
+
+
+def test_every_route_declares_budget():
+    missing = [route.path for route in ROUTES if getattr(route.endpoint, "__query_budget__", None) is None]
+    assert not missing, f"Эндпоинты без @query_budget: {missing}"
+
+
+@pytest.mark.parametrize("role", ROLES, ids=lambda role: role or "ANONYMOUS")
+@pytest.mark.parametrize("route", ROUTES, ids=lambda route: f"{next(iter(route.methods))} {route.path}")
+def test_route_within_query_budget(client, dataset, login_as, route: APIRoute, role: Optional[str]):
+    login_as(role)
+    method, url, kwargs = build_call(route, role, dataset)
+
+    # В строгом режиме middleware выбрасывает QueryBudgetExceeded при превышении бюджета или ленивой загрузке
+    response = client.request(method, url, follow_redirects=False, **kwargs)
+
+    assert response.status_code == expected_status(route, role), response.text
+    # Массовые действия отвечают 200, даже если ни одна заявка не обработана
+    if "/bulk/" in route.path and response.status_code == 200:
+        assert response.json()["failed"] == 0, response.text
+
+    assert int(response.headers["X-Query-Count"]) <= route.endpoint.__query_budget__
+
+
+def test_lazy_load_detected(client):
+    lazy_app = FastAPI()
+
+    # Профиль пользователя не загружен опциями запроса: обращение к нему - ленивая загрузка
+    @lazy_app.get("/lazy")
+    @query_budget(2)
+    async def lazy_endpoint():
+        async with AsyncSessionLocal() as session:
+            user = await session.scalar(sa.select(User).where(User.role == UserRole.EXECUTOR).limit(1))
+            await session.run_sync(lambda _: user.executor_profile)
+
+        return {"user_id": user.id}
+
+    async def call():
+        transport = httpx.ASGITransport(app=QueryBudgetMiddleware(lazy_app, mode="strict"))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as lazy_client:
+            await lazy_client.get("/lazy")
+
+    # Запрос выполняется в event loop приложения: пул соединений движка привязан к нему
+    with pytest.raises(QueryBudgetExceeded, match=r"lazy loads: User\.executor_profile"):
+        client.portal.call(call)
@@ -0,0 +1,61 @@
+# Внешние зависимости
+import time
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+# Внутренние модули
+from web_app.src.middlewares import CompressionMiddleware
+from web_app.src.utils import ReferenceSnapshot
+from web_app.src.utils.reference_cache import ReferenceCache
+
+
+# Тело больше minimum_size, чтобы CompressionMiddleware его сжимал
+BODY = ("[" + ", ".join(f'{{"id": {i}, "name": "Участок {i}"}}' for i in range(100)) + "]").encode("utf-8")
+SNAPSHOT = ReferenceSnapshot(
+    data=None, version=1, etag='W/"departments-1-abc"', body=BODY, loaded_at=time.monotonic()
+)
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+
+    @app.get("/reference")
+    async def reference(request: Request):
+        return ReferenceCache.response(SNAPSHOT, request)
+
+    return TestClient(CompressionMiddleware(app, minimum_size=64))
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip", "br"])
+def test_reference_response_varies_by_encoding(client, accept_encoding: str):
+    response = client.get("/reference", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["ETag"] == SNAPSHOT.etag
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    "if_none_match", ['W/"departments-1-abc"', '"departments-1-abc"', '"other", W/"departments-1-abc"']
+)
+def test_reference_not_modified(client, if_none_match: str):
+    response = client.get("/reference", headers={"Accept-Encoding": "gzip", "If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == SNAPSHOT.etag
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_compression_weakens_strong_etag():
+    app = FastAPI()
+
+    @app.get("/strong")
+    async def strong():
+        return Response(content=BODY, media_type="application/json", headers={"ETag": '"strong"'})
+
+    client = TestClient(CompressionMiddleware(app, minimum_size=64))
+
+    assert client.get("/strong", headers={"Accept-Encoding": "gzip"}).headers["ETag"] == 'W/"strong"'
+    assert client.get("/strong", headers={"Accept-Encoding": "identity"}).headers["ETag"] == '"strong"'
@@ -5,26 +5,36 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqladmin import Admin
 from prometheus_fastapi_instrumentator import Instrumentator
 # Внутренние модули
-from web_app.src.core import config, engine, setup_database
+from web_app.src.core import config, engine, check_database_revision, get_trace_exporter
 from web_app.src.routers import router
 from web_app.src.admin import (UserAdmin, ItemAdmin, CategoryAdmin, DepartmentAdmin,
                                RequestAdmin, SecretaryAdmin, JudgeAdmin, ManagementAdmin,
                                ExecutorAdmin, ManagementDepartmentAdmin, ExecutorOrganizationAdmin,
                                authentication_backend)
-from web_app.src.middlewares import AuthenticationMiddleware
-from web_app.src.utils import token_service
-
+from web_app.src.middlewares import (AuthenticationMiddleware, QueryBudgetMiddleware, RequestContextMiddleware,
+                                    CompressionMiddleware)
+from web_app.src.utils import token_service, event_service, reference_cache
+from web_app.src.tasks import get_storage_sweeper, get_deadline_scheduler
 
 
 async def startup():
     config.logger.info("Запускаем приложение...")
-    await setup_database()
+    await check_database_revision()
     await token_service.init_redis()
+    await event_service.start()
+    await reference_cache.start()
+    await get_storage_sweeper().start()
+    await get_deadline_scheduler().start()
 
 
 async def shutdown():
     config.logger.info("Останавливаем приложение...")
+    await get_deadline_scheduler().stop()
+    await get_storage_sweeper().stop()
+    await reference_cache.stop()
+    await event_service.stop()
     await token_service.close_redis()
+    get_trace_exporter().close()
 
 
 @asynccontextmanager
@@ -52,8 +62,24 @@ app.add_middleware(
 
 app.add_middleware(AuthenticationMiddleware, login_url="/u8ufy1/login")
 
-# Метрики /metrics
-instrumentator = Instrumentator()
+# Подсчет SQL запросов на каждый HTTP запрос (отладка и тесты)
+if config.QUERY_BUDGET_MODE != "off":
+    app.add_middleware(QueryBudgetMiddleware, mode=config.QUERY_BUDGET_MODE)
+
+# Сжатие JSON и HTML ответов Brotli или gzip
+if config.COMPRESSION_MIN_SIZE > 0:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.COMPRESSION_MIN_SIZE,
+        gzip_level=config.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=config.COMPRESSION_BROTLI_QUALITY
+    )
+
+# Идентификатор запроса и корневой span трассы (внешний слой, чтобы охватить остальные middleware)
+app.add_middleware(RequestContextMiddleware)
+
+# Метрики /metrics (долгоживущий SSE поток исказил бы гистограммы длительности)
+instrumentator = Instrumentator(excluded_handlers=["/api/v1/events/requests"])
 instrumentator.instrument(app).expose(app)
 
 # Админка
@@ -8,9 +8,14 @@ from wtforms.validators import InputRequired, ValidationError
 from web_app.src.models import Department
 from web_app.src.utils import validate_phone_list
 from web_app.src.crud import sql_delete_role_users_by_department_id
+from web_app.src.utils import REFERENCE_DEPARTMENTS, REFERENCE_JUDGES
+from web_app.src.admin.reference import ReferenceInvalidationMixin
 
 
-class DepartmentAdmin(ModelView, model=Department):
+class DepartmentAdmin(ReferenceInvalidationMixin, ModelView, model=Department):
+    # Название участка входит и в справочник судей
+    reference_names = (REFERENCE_DEPARTMENTS, REFERENCE_JUDGES)
+
     column_list = [
         Department.id,
         Department.code,
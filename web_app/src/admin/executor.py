@@ -8,9 +8,13 @@ from wtforms.validators import ValidationError
 from web_app.src.models import Executor, UserRole
 from web_app.src.crud import (sql_chek_update_role_by_user_id, sql_get_users_without_role,
                               sql_update_role_by_user_id)
+from web_app.src.utils import REFERENCE_EXECUTORS
+from web_app.src.admin.reference import ReferenceInvalidationMixin
 
 
-class ExecutorAdmin(ModelView, model=Executor):
+class ExecutorAdmin(ReferenceInvalidationMixin, ModelView, model=Executor):
+    reference_names = (REFERENCE_EXECUTORS,)
+
     column_list = [
         Executor.id,
         Executor.user,
@@ -8,9 +8,13 @@ from wtforms.validators import ValidationError
 from web_app.src.models import ExecutorOrganization, UserRole
 from web_app.src.crud import (sql_chek_update_role_by_user_id, sql_get_users_without_role,
                               sql_update_role_by_user_id)
+from web_app.src.utils import REFERENCE_EXECUTOR_ORGANIZATIONS
+from web_app.src.admin.reference import ReferenceInvalidationMixin
 
 
-class ExecutorOrganizationAdmin(ModelView, model=ExecutorOrganization):
+class ExecutorOrganizationAdmin(ReferenceInvalidationMixin, ModelView, model=ExecutorOrganization):
+    reference_names = (REFERENCE_EXECUTOR_ORGANIZATIONS,)
+
     column_list = [
         ExecutorOrganization.id,
         ExecutorOrganization.user,
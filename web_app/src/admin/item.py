@@ -3,7 +3,8 @@ from sqladmin import ModelView
 from wtforms.validators import ValidationError
 # Внутренние модули
 from web_app.src.models import Item
-from web_app.src.crud import sql_chek_existing_item_by_serial, sql_get_categories_choices
+from web_app.src.crud import (sql_chek_existing_item_by_serial, sql_get_categories_choices,
+                              sql_refresh_request_list_view, sql_get_request_ids_by_item)
 
 
 class ItemAdmin(ModelView, model=Item):
@@ -92,4 +93,19 @@ class ItemAdmin(ModelView, model=Item):
                 if existing:
                     raise ValidationError(f"Серийный номер '{data['serial_number']}' уже существует")
 
-        return await super().on_model_change(data, model, is_created, request)
\ No newline at end of file
+        return await super().on_model_change(data, model, is_created, request)
+
+    # Название предмета входит в строки проекции списков заявок
+    async def after_model_change(self, data, model, is_created, request):
+        if not is_created:
+            await sql_refresh_request_list_view(item_id=model.id)
+
+    # Заявки с предметом запоминаем до удаления: после него связи удалены каскадом
+    async def on_model_delete(self, model, request):
+        request.state.list_view_request_ids = await sql_get_request_ids_by_item(item_id=model.id)
+
+        return await super().on_model_delete(model, request)
+
+    # Пересобираем строки проекции только для заявок, в которых был удаленный предмет
+    async def after_model_delete(self, model, request):
+        await sql_refresh_request_list_view(request_ids=request.state.list_view_request_ids)
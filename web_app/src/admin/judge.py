@@ -8,9 +8,13 @@ from wtforms.validators import ValidationError
 from web_app.src.models import Judge, UserRole
 from web_app.src.crud import (sql_chek_update_role_by_user_id, sql_get_users_without_role,
                               sql_update_role_by_user_id)
+from web_app.src.utils import REFERENCE_JUDGES
+from web_app.src.admin.reference import ReferenceInvalidationMixin
 
 
-class JudgeAdmin(ModelView, model=Judge):
+class JudgeAdmin(ReferenceInvalidationMixin, ModelView, model=Judge):
+    reference_names = (REFERENCE_JUDGES,)
+
     column_list = [
         Judge.id,
         Judge.user,
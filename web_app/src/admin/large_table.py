@@ -0,0 +1,72 @@
+# Внешние зависимости
+from typing import Any, AsyncGenerator, List, Optional, Union
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from sqladmin.helpers import Writer, secure_filename, stream_to_csv
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+# Внутренние модули
+from web_app.src.core import config
+
+
+class LargeTableMixin:
+    """
+    Список админки для больших таблиц:
+    - без фильтра количество строк берется из статистики планировщика (pg_class.reltuples),
+      если оно больше порога, а при поиске точный подсчет останавливается на пороге;
+    - поиск ILIKE по колонкам без приведения к строке, чтобы работали триграммные GIN индексы;
+    - выгрузка CSV читает строки серверным курсором пачками, а не загружает таблицу целиком
+    """
+
+    estimated_count_threshold: int = config.ADMIN_ESTIMATED_COUNT_THRESHOLD
+    export_batch_size: int = config.ADMIN_EXPORT_BATCH_SIZE
+
+    async def count(self, request: Request, stmt: Optional[sa.Select] = None) -> int:
+        if stmt is None:
+            estimate = await self._run_query(
+                sa.select(sa.text("reltuples::bigint"))
+                .select_from(sa.text("pg_class"))
+                .where(sa.text("oid = CAST(:table_name AS regclass)").bindparams(table_name=self.model.__tablename__))
+            )
+            # До первого ANALYZE reltuples равен -1
+            if estimate and estimate[0] >= self.estimated_count_threshold:
+                return estimate[0]
+
+            return await super().count(request)
+
+        # Подсчет результатов поиска: sqladmin оборачивает запрос списка в select count(*)
+        search = stmt.get_final_froms()[0].element.order_by(None).limit(self.estimated_count_threshold)
+        return await super().count(request, sa.select(sa.func.count()).select_from(search.subquery()))
+
+    def search_query(self, stmt: sa.Select, term: str) -> sa.Select:
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return stmt.where(sa.or_(*(getattr(self.model, field).ilike(pattern) for field in self._search_fields)))
+
+    async def get_model_objects(self, request: Request, limit: Union[int, None] = 0) -> Any:
+        # Выгрузка читает строки потоком в export_data, здесь строится только запрос
+        stmt = self.list_query(request).order_by(*self.pk_columns)
+        for relation in self._list_relations:
+            stmt = stmt.options(so.selectinload(relation))
+
+        return stmt.limit(limit) if limit else stmt
+
+    async def export_data(self, data: Any, export_type: str = "csv") -> StreamingResponse:
+        if export_type != "csv":
+            rows: List[Any] = await self._run_query(data)
+            return await super().export_data(rows, export_type=export_type)
+
+        async def generate(writer: Writer) -> AsyncGenerator[Any, None]:
+            yield writer.writerow(self._export_prop_names)
+
+            async with self.session_maker(expire_on_commit=False) as session:
+                rows = await session.stream_scalars(data.execution_options(yield_per=self.export_batch_size))
+                async for row in rows:
+                    yield writer.writerow([str(await self.get_prop_value(row, name))
+                                           for name in self._export_prop_names])
+
+        filename = secure_filename(self.get_export_name(export_type="csv"))
+        return StreamingResponse(
+            content=stream_to_csv(generate),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f"attachment;filename={filename}"}
+        )
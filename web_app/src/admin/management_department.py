@@ -8,9 +8,13 @@ from wtforms.validators import ValidationError
 from web_app.src.models import ManagementDepartment, UserRole
 from web_app.src.crud import (sql_chek_update_role_by_user_id, sql_get_users_without_role,
                               sql_update_role_by_user_id)
+from web_app.src.utils import REFERENCE_MANAGEMENT_DEPARTMENTS
+from web_app.src.admin.reference import ReferenceInvalidationMixin
 
 
-class ManagementDepartmentAdmin(ModelView, model=ManagementDepartment):
+class ManagementDepartmentAdmin(ReferenceInvalidationMixin, ModelView, model=ManagementDepartment):
+    reference_names = (REFERENCE_MANAGEMENT_DEPARTMENTS,)
+
     column_list = [
         ManagementDepartment.id,
         ManagementDepartment.user,
@@ -0,0 +1,21 @@
+# Внешние зависимости
+from typing import Tuple
+# Внутренние модули
+from web_app.src.utils import reference_cache
+
+
+class ReferenceInvalidationMixin:
+    """
+    Сброс кэша справочников после изменения записи в админке.
+    Хуки after_* вызываются после фиксации транзакции: раньше воркеры могли бы загрузить старые данные
+    """
+
+    reference_names: Tuple[str, ...] = ()
+
+    async def after_model_change(self, data, model, is_created, request):
+        await super().after_model_change(data, model, is_created, request)
+        await reference_cache.invalidate(*self.reference_names)
+
+    async def after_model_delete(self, model, request):
+        await super().after_model_delete(model, request)
+        await reference_cache.invalidate(*self.reference_names)
@@ -1,11 +1,15 @@
 # Внешние зависимости
 from markupsafe import Markup
+from starlette.requests import Request as HTTPRequest
 from sqladmin import ModelView
+import sqlalchemy as sa
+import sqlalchemy.orm as so
 # Внутренние модули
 from web_app.src.models import Request
+from web_app.src.admin.large_table import LargeTableMixin
 
 
-class RequestAdmin(ModelView, model=Request):
+class RequestAdmin(LargeTableMixin, ModelView, model=Request):
     column_list = [
         Request.id,
         Request.registration_number,
@@ -68,6 +72,17 @@ class RequestAdmin(ModelView, model=Request):
         items_list = "<br>".join(items_links)
         return Markup(f"<div>{items_list}</div>")
 
+    # Карточка заявки: связи загружаются вместе с заявкой, а не по одной при выводе полей
+    def details_query(self, request: HTTPRequest) -> sa.Select:
+        return self._stmt_by_identifier(request.path_params["pk"]).options(
+            so.joinedload(Request.department),
+            so.joinedload(Request.secretary),
+            so.joinedload(Request.judge),
+            so.joinedload(Request.management),
+            so.joinedload(Request.management_department),
+            so.selectinload(Request.item_associations)
+        )
+
 
     column_details_list = [
         Request.id,
@@ -9,11 +9,19 @@ from web_app.src.models import User, ROLE_MAPPING
 from web_app.src.crud import (sql_chek_existing_user_by_name, sql_chek_existing_user_by_email,
                               sql_get_user_by_username)
 from web_app.src.utils import validate_phone_from_form
-from web_app.src.utils import get_password_hash
+from web_app.src.utils import get_password_hash_async
 from web_app.src.utils import token_service
+from web_app.src.utils import (REFERENCE_EXECUTORS, REFERENCE_EXECUTOR_ORGANIZATIONS, REFERENCE_JUDGES,
+                               REFERENCE_MANAGEMENT_DEPARTMENTS)
+from web_app.src.admin.reference import ReferenceInvalidationMixin
+from web_app.src.admin.large_table import LargeTableMixin
 
 
-class UserAdmin(ModelView, model=User):
+class UserAdmin(ReferenceInvalidationMixin, LargeTableMixin, ModelView, model=User):
+    # ФИО пользователя входит в справочники судей и исполнителей
+    reference_names = (REFERENCE_JUDGES, REFERENCE_EXECUTORS, REFERENCE_EXECUTOR_ORGANIZATIONS,
+                       REFERENCE_MANAGEMENT_DEPARTMENTS)
+
     column_list = [
         User.id,
         User.username,
@@ -173,7 +181,7 @@ class UserAdmin(ModelView, model=User):
         if 'password_hash' in data and data['password_hash']:
             password = data['password_hash']
             # Сохраняем хэш
-            data['password_hash'] = get_password_hash(password)
+            data['password_hash'] = await get_password_hash_async(password)
 
         elif not is_created and 'password_hash' in data and not data['password_hash']:
             # При редактировании, если пароль не указан - оставляем старый
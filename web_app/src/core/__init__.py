@@ -1,4 +1,5 @@
 from web_app.src.core.config import get_config
-from web_app.src.core.database import setup_database, connection, engine
+from web_app.src.core.database import check_database_revision, get_alembic_config, connection, engine
+from web_app.src.core.tracing import span, traced, trace_methods, get_trace_exporter
 
 config = get_config()
\ No newline at end of file
@@ -35,6 +35,93 @@ class Config:
     USER_DOCUMENTS: str = "web_app/src/static/user_documents"
     PDF_REQUESTS: str = "web_app/src/static/pdf_requests"
 
+    # Встраивание фильтров и первой страницы списка в HTML (без отдельных запросов браузера при загрузке)
+    EMBED_INITIAL_DATA: bool = field(
+        default_factory=lambda: os.getenv("EMBED_INITIAL_DATA", "true").lower() in ("1", "true", "yes")
+    )
+
+    # Детали заявки содержат только последние записи истории, остальное отдается страницами по курсору
+    DETAIL_HISTORY_LIMIT: int = field(default_factory=lambda: int(os.getenv("DETAIL_HISTORY_LIMIT", 10)))
+    MAX_CURSOR_PAGE_SIZE: int = field(default_factory=lambda: int(os.getenv("MAX_CURSOR_PAGE_SIZE", 100)))
+
+    # Архив: завершенные и отмененные заявки старше ARCHIVE_AFTER_DAYS исключаются из списков и счетчиков
+    ARCHIVE_AFTER_DAYS: int = field(default_factory=lambda: int(os.getenv("ARCHIVE_AFTER_DAYS", 365)))
+    ARCHIVE_BATCH_SIZE: int = field(default_factory=lambda: int(os.getenv("ARCHIVE_BATCH_SIZE", 1000)))
+    # Сколько годовых секций request_history создавать заранее после текущего года
+    HISTORY_PARTITIONS_AHEAD: int = field(default_factory=lambda: int(os.getenv("HISTORY_PARTITIONS_AHEAD", 1)))
+
+    # Статика: исходники и собранные build_static.py файлы с хешем содержимого в имени
+    STATIC_DIR: str = "web_app/src/static"
+    STATIC_URL: str = "/u8ufy1/static"
+    STATIC_BUILD_DIR: str = "dist"
+    STATIC_MANIFEST: str = "web_app/src/static/dist/manifest.json"
+    # Сколько прошлых сборок хранить: открытые страницы и закэшированный HTML ссылаются на их файлы
+    STATIC_KEEP_BUILDS: int = field(default_factory=lambda: int(os.getenv("STATIC_KEEP_BUILDS", 2)))
+
+    # Проверка ревизии миграций при старте: strict (остановка), warn или off
+    DB_REVISION_CHECK: str = field(default_factory=lambda: os.getenv("DB_REVISION_CHECK", "strict"))
+
+    # Очистка хранилища от осиротевших и временных файлов
+    STORAGE_SWEEP_INTERVAL: int = field(default_factory=lambda: int(os.getenv("STORAGE_SWEEP_INTERVAL", 3600)))
+    STORAGE_SWEEP_BATCH_SIZE: int = field(default_factory=lambda: int(os.getenv("STORAGE_SWEEP_BATCH_SIZE", 500)))
+    STORAGE_TEMP_TTL: int = field(default_factory=lambda: int(os.getenv("STORAGE_TEMP_TTL", 24 * 3600)))
+    STORAGE_ORPHAN_GRACE: int = field(default_factory=lambda: int(os.getenv("STORAGE_ORPHAN_GRACE", 3600)))
+
+    # Планировщик сроков: просыпается к ближайшему сроку или напоминанию, но не реже MAX_SLEEP секунд
+    # (новые сроки, назначенные во время сна, подхватываются не позже чем через MAX_SLEEP)
+    DEADLINE_REMINDER_LEAD: int = field(default_factory=lambda: int(os.getenv("DEADLINE_REMINDER_LEAD", 24 * 3600)))
+    DEADLINE_BATCH_SIZE: int = field(default_factory=lambda: int(os.getenv("DEADLINE_BATCH_SIZE", 500)))
+    DEADLINE_MIN_SLEEP: float = field(default_factory=lambda: float(os.getenv("DEADLINE_MIN_SLEEP", 5)))
+    DEADLINE_MAX_SLEEP: float = field(default_factory=lambda: float(os.getenv("DEADLINE_MAX_SLEEP", 60)))
+
+    # Хеширование паролей вне event loop
+    PASSWORD_HASH_WORKERS: int = field(default_factory=lambda: int(os.getenv("PASSWORD_HASH_WORKERS", 4)))
+    PASSWORD_HASH_CONCURRENCY: int = field(default_factory=lambda: int(os.getenv("PASSWORD_HASH_CONCURRENCY", 32)))
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = field(default_factory=lambda: float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", 5)))
+
+    # Ограничение попыток входа
+    # С одного IP (NAT суда) входит много пользователей, поэтому по IP считаются только неудачные попытки
+    LOGIN_IP_MAX_FAILURES: int = field(default_factory=lambda: int(os.getenv("LOGIN_IP_MAX_FAILURES", 30)))
+    LOGIN_IP_WINDOW: int = field(default_factory=lambda: int(os.getenv("LOGIN_IP_WINDOW", 60)))
+    LOGIN_USER_MAX_FAILURES: int = field(default_factory=lambda: int(os.getenv("LOGIN_USER_MAX_FAILURES", 5)))
+    LOGIN_USER_WINDOW: int = field(default_factory=lambda: int(os.getenv("LOGIN_USER_WINDOW", 15 * 60)))
+
+    # Контроль количества SQL запросов на HTTP запрос: off, warn или strict (для тестов)
+    QUERY_BUDGET_MODE: str = field(default_factory=lambda: os.getenv("QUERY_BUDGET_MODE", "off"))
+
+    # Сжатие ответов (Brotli или gzip): минимальный размер тела в байтах, 0 - сжатие выключено
+    COMPRESSION_MIN_SIZE: int = field(default_factory=lambda: int(os.getenv("COMPRESSION_MIN_SIZE", 1024)))
+    COMPRESSION_GZIP_LEVEL: int = field(default_factory=lambda: int(os.getenv("COMPRESSION_GZIP_LEVEL", 6)))
+    COMPRESSION_BROTLI_QUALITY: int = field(default_factory=lambda: int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4)))
+
+    # События изменения заявок: канал Redis pub/sub и SSE потоки
+    EVENTS_CHANNEL: str = field(default_factory=lambda: os.getenv("EVENTS_CHANNEL", "request_events"))
+    EVENTS_QUEUE_SIZE: int = field(default_factory=lambda: int(os.getenv("EVENTS_QUEUE_SIZE", 100)))
+    EVENTS_RECONNECT_DELAY: float = field(default_factory=lambda: float(os.getenv("EVENTS_RECONNECT_DELAY", 1)))
+    # Комментарий-пинг держит соединение через прокси, по истечении срока жизни клиент переподключается
+    # и заново проходит проверку токена
+    SSE_HEARTBEAT: float = field(default_factory=lambda: float(os.getenv("SSE_HEARTBEAT", 15)))
+    SSE_MAX_LIFETIME: float = field(default_factory=lambda: float(os.getenv("SSE_MAX_LIFETIME", 15 * 60)))
+
+    # Админка для больших таблиц: порог, выше которого количество строк берется из статистики,
+    # и размер пачки серверного курсора при выгрузке CSV
+    ADMIN_ESTIMATED_COUNT_THRESHOLD: int = field(
+        default_factory=lambda: int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", 100000))
+    )
+    ADMIN_EXPORT_BATCH_SIZE: int = field(default_factory=lambda: int(os.getenv("ADMIN_EXPORT_BATCH_SIZE", 1000)))
+
+    # Кэш справочников в памяти воркера: канал сброса и страховочный срок жизни снимка в секундах
+    REFERENCE_CHANNEL: str = field(default_factory=lambda: os.getenv("REFERENCE_CHANNEL", "reference_invalidation"))
+    REFERENCE_CACHE_TTL: float = field(default_factory=lambda: float(os.getenv("REFERENCE_CACHE_TTL", 600)))
+
+    # Трассировка запросов в локальный файл: off, chrome или otlp (к имени файла добавляется pid процесса)
+    TRACE_EXPORT: str = field(default_factory=lambda: os.getenv("TRACE_EXPORT", "off"))
+    TRACE_FILE: str = field(
+        default_factory=lambda: os.getenv("TRACE_FILE", f"{os.getenv('LOG_DIR', 'logs')}/traces.json")
+    )
+    # Записываются только трассы не короче порога (мс)
+    TRACE_SLOW_MS: float = field(default_factory=lambda: float(os.getenv("TRACE_SLOW_MS", 0)))
+
     ALLOWED_MIME_TYPES: Dict[str, List[str]] = field(default_factory=lambda: {
         'image': [
             'image/jpeg',
@@ -67,15 +154,14 @@ class Config:
         self.logger = setup_logger(
             level=os.getenv("LOG_LEVEL", "INFO"),
             log_dir=os.getenv("LOG_DIR", "logs"),
-            log_file=os.getenv("LOG_FILE", "web_log")
+            log_file=os.getenv("LOG_FILE", "web_log"),
+            log_format=os.getenv("LOG_FORMAT", "json"),
+            log_to_file=os.getenv("LOG_TO_FILE", "true").lower() in ("1", "true", "yes")
         )
 
         self.validate()
         self.logger.info("Configuration initialized")
 
-        self.active_session_tokens = dict()
-        self.blacklisted_tokens = set()
-
     # Валидация конфигурации
     def validate(self):
         if not self._database_url:
@@ -92,6 +178,10 @@ class Config:
     def REDIS_URL(self) -> str:
         return self._redis_url
 
+    @property
+    def TRACE_ENABLED(self) -> bool:
+        return self.TRACE_EXPORT in ("chrome", "otlp")
+
     def __str__(self) -> str:
         return f"Config(database={self._database_url}, log_level={self.logger.level})"
 
@@ -0,0 +1,11 @@
+# Внешние зависимости
+from typing import Optional
+from contextvars import ContextVar
+
+
+# Идентификатор текущего HTTP запроса (заголовок X-Request-ID)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+# Пользователь, выполнивший вход (выставляется при проверке токена)
+user_id_var: ContextVar[Optional[int]] = ContextVar("user_id", default=None)
+# Метод и путь текущего HTTP запроса
+route_var: ContextVar[Optional[str]] = ContextVar("route", default=None)
@@ -1,8 +1,15 @@
 # Внешние зависимости
+from typing import Optional, Dict, Set
+from contextvars import ContextVar
+import os
+import time
+from sqlalchemy import event, text
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 # Внутренние модули
 from web_app.src.core.config import get_config
-from web_app.src.models import Base
+from web_app.src.core.metrics import DB_SESSION_SECONDS, DB_STATEMENTS, DB_ROWS
+from web_app.src.core.tracing import span
 
 
 # Получаем конфиг
@@ -10,12 +17,71 @@ config = get_config()
 engine = create_async_engine(config.DATABASE_URL)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
-# Инициализируем таблицы
-async def setup_database():
-    config.logger.info("Инициализируем таблицы")
+ALEMBIC_INI = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "alembic.ini"
+)
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+# Статистика запросов текущего вызова функции с @connection
+_call_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar("db_call_stats", default=None)
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _call_stats.get()
+    if stats is None:
+        return
+
+    stats["statements"] += 1
+    if cursor.rowcount and cursor.rowcount > 0:
+        stats["rows"] += cursor.rowcount
+
+
+# Конфигурация Alembic с адресом БД приложения
+def get_alembic_config():
+    from alembic.config import Config as AlembicConfig
+
+    alembic_config = AlembicConfig(ALEMBIC_INI)
+    alembic_config.set_main_option("sqlalchemy.url", config.DATABASE_URL.replace("%", "%%"))
+    return alembic_config
+
+
+# Ревизии миграций, до которых должна быть обновлена база
+def get_migration_heads() -> Set[str]:
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory.from_config(get_alembic_config()).get_heads())
+
+
+# Проверяем, что схема БД обновлена миграциями до ревизии кода (вместо create_all при каждом старте)
+async def check_database_revision():
+    if config.DB_REVISION_CHECK == "off":
+        return
+
+    heads = get_migration_heads()
+
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = set(result.scalars().all())
+
+    except ProgrammingError:
+        current = set()
+
+    if current == heads:
+        config.logger.info("Database revision: %s", ", ".join(sorted(current)))
+        return
+
+    message = (
+        f"Database revision {', '.join(sorted(current)) or 'none'} does not match migrations head "
+        f"{', '.join(sorted(heads))}: run 'python init_db.py'"
+    )
+    if config.DB_REVISION_CHECK == "warn":
+        config.logger.warning(message)
+        return
+
+    config.logger.critical(message)
+    raise RuntimeError(message)
 
 
 # Декоратор подключения к базе данных
@@ -24,15 +90,29 @@ def connection(method):
         if kwargs.pop('no_decor', False):
             return await method(*args, **kwargs)
 
-        async with AsyncSessionLocal() as session:
+        stats = {"statements": 0, "rows": 0}
+        stats_token = _call_stats.set(stats)
+        started_at = time.perf_counter()
+
+        with span(f"db.{method.__name__}", kind="client") as db_span:
             try:
-                return await method(*args, session=session, **kwargs)
+                async with AsyncSessionLocal() as session:
+                    try:
+                        return await method(*args, session=session, **kwargs)
+
+                    except Exception as e:
+                        await session.rollback()
+                        raise e
 
-            except Exception as e:
-                await session.rollback()
-                raise e
+                    finally:
+                        await session.close()
 
             finally:
-                await session.close()
+                _call_stats.reset(stats_token)
+                DB_SESSION_SECONDS.labels(function=method.__name__).observe(time.perf_counter() - started_at)
+                DB_STATEMENTS.labels(function=method.__name__).observe(stats["statements"])
+                DB_ROWS.labels(function=method.__name__).observe(stats["rows"])
+                db_span.set_attribute("db.statements", stats["statements"])
+                db_span.set_attribute("db.rows", stats["rows"])
 
     return wrapper
\ No newline at end of file
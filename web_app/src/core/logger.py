@@ -1,16 +1,119 @@
 # Внешние зависимости
+from typing import Optional, List
+from datetime import datetime, UTC
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import os
 import sys
+import json
+import queue
+import atexit
+# Внутренние модули
+from web_app.src.core.context import request_id_var, user_id_var, route_var
+
+
+class ContextFilter(logging.Filter):
+    """Переносит request id, user id и маршрут из контекста запроса в запись лога"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.user_id = user_id_var.get()
+        record.route = route_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна запись - одна строка JSON (разбирается promtail стадией json)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "user_id": getattr(record, "user_id", None),
+            "route": getattr(record, "route", None),
+        }
+
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler, который в вызывающем потоке только подставляет args в сообщение и переводит
+    трейсбек в текст: args (ORM объекты, словари) к моменту записи могут измениться или отсоединиться
+    от сессии. Форматирование в JSON и запись выполняются в потоке QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_log_queue: Optional[queue.SimpleQueue] = None
+_queue_handler: Optional[LazyQueueHandler] = None
+_handlers: List[logging.Handler] = []
+
+
+# Запуск фонового потока записи логов (повторно вызывается в дочернем процессе после fork)
+def start_log_listener():
+    global _listener
+    if _listener is not None or _log_queue is None:
+        return
+
+    _listener = QueueListener(_log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+
+
+# Остановка потока записи логов с дописыванием очереди
+def stop_log_listener():
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+
+# Поток записи не переживает fork: в дочернем процессе (воркер gunicorn) создаем очередь и поток заново
+def _restart_log_listener_after_fork():
+    global _listener, _log_queue
+    if _listener is None:
+        return
+
+    _log_queue = queue.SimpleQueue()
+    _queue_handler.queue = _log_queue
+    _listener = None
+    start_log_listener()
+
+
+os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
 
 
 def setup_logger(
         name: str = __name__,
         level: str = "INFO",
-        format_str: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format_str: str = '%(asctime)s - %(name)s - %(levelname)s - %(request_id)s - %(message)s',
         log_dir: str = 'logs',
-        log_file: str = 'web_log'
+        log_file: str = 'web_log',
+        log_format: str = 'json',
+        log_to_file: bool = True
 ) -> logging.Logger:
+    global _log_queue, _queue_handler
     logger = logging.getLogger(name)
 
     if logger.handlers:
@@ -21,21 +124,32 @@ def setup_logger(
     logger.setLevel(numeric_level)
 
     # Форматтер
-    formatter = logging.Formatter(format_str)
+    formatter = JsonFormatter() if log_format == "json" else logging.Formatter(format_str)
 
     # Обработчик для stdout
     stdout_handler = logging.StreamHandler(sys.stdout)
     stdout_handler.setFormatter(formatter)
-    logger.addHandler(stdout_handler)
+    _handlers.append(stdout_handler)
+
+    # Ротация RotatingFileHandler не согласована между процессами: при нескольких воркерах только stdout
+    if log_to_file:
+        file_handler = RotatingFileHandler(
+            filename=f'{log_dir}/{log_file}.log',
+            maxBytes=10 * 1024 * 1024,  # 10 MB
+            backupCount=5,  # храним 5 backup файлов
+            encoding='utf-8'
+        )
+
+        file_handler.setFormatter(formatter)
+        _handlers.append(file_handler)
 
-    file_handler = RotatingFileHandler(
-        filename=f'{log_dir}/{log_file}.log',
-        maxBytes=10 * 1024 * 1024,  # 10 MB
-        backupCount=5,  # храним 5 backup файлов
-        encoding='utf-8'
-    )
+    # Event loop только кладет запись в очередь, форматирование и запись идут в отдельном потоке
+    _log_queue = queue.SimpleQueue()
+    _queue_handler = LazyQueueHandler(_log_queue)
+    _queue_handler.addFilter(ContextFilter())
+    logger.addHandler(_queue_handler)
 
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    start_log_listener()
+    atexit.register(stop_log_listener)
 
-    return logger
\ No newline at end of file
+    return logger
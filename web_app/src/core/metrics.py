@@ -0,0 +1,89 @@
+# Внешние зависимости
+from prometheus_client import Counter, Histogram, Gauge
+
+
+# Очистка хранилища
+STORAGE_RECLAIMED_BYTES = Counter(
+    "storage_sweeper_reclaimed_bytes_total",
+    "Освобождено байт при очистке хранилища",
+    ["directory"]
+)
+STORAGE_DELETED_FILES = Counter(
+    "storage_sweeper_deleted_files_total",
+    "Удалено файлов при очистке хранилища",
+    ["directory", "reason"]
+)
+STORAGE_DELETE_ERRORS = Counter(
+    "storage_delete_errors_total",
+    "Ошибки удаления файлов"
+)
+STORAGE_SWEEP_DURATION = Histogram(
+    "storage_sweeper_duration_seconds",
+    "Длительность прохода очистки хранилища",
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900)
+)
+
+# Хеширование паролей
+PASSWORD_HASH_QUEUE_SECONDS = Histogram(
+    "password_hash_queue_seconds",
+    "Время ожидания хеширования пароля в очереди",
+    ["operation"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Длительность хеширования пароля",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+LOGIN_THROTTLED = Counter(
+    "login_throttled_total",
+    "Отклонено попыток входа из-за ограничения частоты",
+    ["scope"]
+)
+
+# Функции работы с базой данных (декоратор @connection)
+DB_SESSION_SECONDS = Histogram(
+    "db_session_duration_seconds",
+    "Время жизни сессии базы данных",
+    ["function"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+DB_STATEMENTS = Histogram(
+    "db_session_statements",
+    "Количество SQL запросов за сессию",
+    ["function"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+DB_ROWS = Histogram(
+    "db_session_rows",
+    "Количество строк, возвращенных или измененных за сессию",
+    ["function"],
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000)
+)
+
+# Планировщик сроков
+DEADLINE_ITEMS_OVERDUE = Counter(
+    "deadline_items_overdue_total",
+    "Предметов заявок, отмеченных просроченными"
+)
+DEADLINE_REMINDERS_SENT = Counter(
+    "deadline_reminders_sent_total",
+    "Отправлено напоминаний о сроках исполнителям"
+)
+
+# События изменения заявок (Redis pub/sub + SSE)
+EVENTS_PUBLISHED = Counter(
+    "request_events_published_total",
+    "Опубликовано событий изменения заявок",
+    ["event"]
+)
+EVENTS_DROPPED = Counter(
+    "request_events_dropped_total",
+    "Событий отброшено из-за переполненной очереди SSE соединения"
+)
+SSE_CONNECTIONS = Gauge(
+    "sse_connections",
+    "Открытые SSE соединения",
+    multiprocess_mode="livesum"
+)
@@ -0,0 +1,321 @@
+# Внешние зависимости
+from typing import Optional, Dict, List, Any, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import os
+import re
+import json
+import time
+import uuid
+import queue
+import random
+import inspect
+import functools
+import threading
+# Внутренние модули
+from web_app.src.core.config import get_config
+from web_app.src.core.context import request_id_var
+
+
+# Получаем конфиг
+config = get_config()
+
+TRACE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    kind: str = "internal"
+    start_ns: int = 0
+    end_ns: int = 0
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def rename(self, name: str):
+        self.name = name
+
+
+class _NoopSpan:
+    """Заглушка span при выключенной трассировке"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def rename(self, name: str):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# Открытый span и законченные span текущей трассы
+_current_span: ContextVar[Optional[Span]] = ContextVar("tracing_current_span", default=None)
+_trace_spans: ContextVar[Optional[List[Span]]] = ContextVar("tracing_trace_spans", default=None)
+
+
+class _SpanContext:
+    def __init__(self, name: str, kind: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.span: Optional[Span] = None
+        self.tokens = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        spans = _trace_spans.get()
+
+        # Span без родителя начинает новую трассу, для HTTP запроса id трассы берется из X-Request-ID
+        if parent is None or spans is None:
+            request_id = request_id_var.get()
+            trace_id = request_id if request_id and TRACE_ID_PATTERN.match(request_id) else uuid.uuid4().hex
+            spans = []
+            spans_token = _trace_spans.set(spans)
+            parent_id = None
+        else:
+            trace_id = parent.trace_id
+            spans_token = None
+            parent_id = parent.span_id
+
+        self.span = Span(
+            name=self.name,
+            trace_id=trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            kind=self.kind,
+            thread_id=threading.get_ident(),
+            attributes=self.attributes
+        )
+
+        request_id = request_id_var.get()
+        if request_id:
+            self.span.attributes["request.id"] = request_id
+
+        self.tokens = (_current_span.set(self.span), spans_token)
+        self.span.start_ns = time.time_ns()
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.end_ns = time.time_ns()
+        if exc_type is not None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+
+        span_token, spans_token = self.tokens
+        spans = _trace_spans.get()
+        spans.append(self.span)
+        _current_span.reset(span_token)
+
+        if spans_token is not None:
+            _trace_spans.reset(spans_token)
+            if (self.span.end_ns - self.span.start_ns) / 1_000_000 >= config.TRACE_SLOW_MS:
+                get_trace_exporter().export(spans)
+
+        return False
+
+
+# Контекстный менеджер span: with span("pdf.render", pages=3) as s: ...
+def span(name: str, kind: str = "internal", **attributes):
+    if not config.TRACE_ENABLED:
+        return _NOOP_SPAN
+
+    return _SpanContext(name, kind, attributes)
+
+
+# Декоратор, оборачивающий вызов функции (синхронной или асинхронной) в span
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable:
+    def decorator(func: Callable) -> Callable:
+        # При выключенной трассировке функция остается без обертки
+        if not config.TRACE_ENABLED:
+            return func
+
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _SpanContext(span_name, kind, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _SpanContext(span_name, kind, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Декоратор класса: все публичные асинхронные методы оборачиваются в span "<prefix>.<метод>"
+def trace_methods(prefix: str, kind: str = "client") -> Callable:
+    def decorator(cls):
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith("_") or not inspect.iscoroutinefunction(attr):
+                continue
+
+            setattr(cls, attr_name, traced(f"{prefix}.{attr_name}", kind=kind)(attr))
+
+        return cls
+
+    return decorator
+
+
+class TraceExporter:
+    """
+    Запись законченных трасс в локальный файл в фоновом потоке.
+    Формат chrome открывается в chrome://tracing и Perfetto, формат otlp - строки OTLP-JSON
+    (ExportTraceServiceRequest), которые принимает OpenTelemetry Collector.
+    """
+
+    def __init__(self, file_path: str, trace_format: str):
+        self.pid = os.getpid()
+        # Каждый воркер gunicorn пишет в свой файл: дозапись из нескольких процессов перемешивает строки
+        root, ext = os.path.splitext(file_path)
+        self.file_path = f"{root}.{self.pid}{ext}"
+        self.trace_format = trace_format
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self.thread.start()
+
+        self.queue.put(spans)
+
+    def close(self):
+        if self.thread is None:
+            return
+
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+        self.thread = None
+
+    def _run(self):
+        # Chrome допускает массив событий без закрывающей скобки, поэтому файл можно дописывать
+        if self.trace_format == "chrome" and not os.path.exists(self.file_path):
+            with open(self.file_path, mode="w", encoding="utf-8") as file:
+                file.write("[\n")
+
+        while True:
+            spans = self.queue.get()
+            if spans is None:
+                return
+
+            try:
+                lines = self.to_chrome(spans) if self.trace_format == "chrome" else [self.to_otlp(spans)]
+                with open(self.file_path, mode="a", encoding="utf-8") as file:
+                    file.writelines(lines)
+
+            except Exception as err:
+                config.logger.error("Error exporting trace: %s", err)
+
+    def to_chrome(self, spans: List[Span]) -> List[str]:
+        # Каждая трасса выводится отдельной дорожкой, чтобы параллельные запросы не накладывались
+        root = spans[-1]
+        track_id = int(root.trace_id[:8], 16)
+        events = [{
+            "name": "thread_name", "ph": "M", "pid": self.pid, "tid": track_id,
+            "args": {"name": f"{root.name} [{root.attributes.get('request.id', root.trace_id)}]"}
+        }]
+
+        for item in spans:
+            args = dict(item.attributes)
+            if item.error:
+                args["error"] = item.error
+
+            events.append({
+                "name": item.name,
+                "cat": "http" if item.kind == "server" else item.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": item.start_ns / 1000,
+                "dur": (item.end_ns - item.start_ns) / 1000,
+                "pid": self.pid,
+                "tid": track_id,
+                "args": args
+            })
+
+        return [json.dumps(event, ensure_ascii=False, default=str) + ",\n" for event in events]
+
+    def to_otlp(self, spans: List[Span]) -> str:
+        otlp_spans = []
+        for item in spans:
+            otlp_span = {
+                "traceId": item.trace_id,
+                "spanId": item.span_id,
+                "name": item.name,
+                "kind": OTLP_SPAN_KINDS.get(item.kind, 1),
+                "startTimeUnixNano": str(item.start_ns),
+                "endTimeUnixNano": str(item.end_ns),
+                "attributes": [
+                    {"key": key, "value": otlp_value(value)} for key, value in item.attributes.items()
+                ],
+                "status": {"code": 2, "message": item.error} if item.error else {}
+            }
+            if item.parent_id:
+                otlp_span["parentSpanId"] = item.parent_id
+
+            otlp_spans.append(otlp_span)
+
+        return json.dumps({
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": config.APP_NAME or "web_app"}},
+                    {"key": "process.pid", "value": {"intValue": str(self.pid)}}
+                ]},
+                "scopeSpans": [{"scope": {"name": "web_app.tracing"}, "spans": otlp_spans}]
+            }]
+        }, ensure_ascii=False) + "\n"
+
+
+# Значение атрибута в представлении OTLP-JSON
+def otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
+
+
+_instance = None
+
+
+# Поток экспорта не переживает fork, дочерний процесс создает свой экспортер
+def _reset_trace_exporter_after_fork():
+    global _instance
+    _instance = None
+
+
+os.register_at_fork(after_in_child=_reset_trace_exporter_after_fork)
+
+
+def get_trace_exporter() -> TraceExporter:
+    global _instance
+    if _instance is None:
+        _instance = TraceExporter(file_path=config.TRACE_FILE, trace_format=config.TRACE_EXPORT)
+
+    return _instance
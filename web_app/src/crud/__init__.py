@@ -4,10 +4,10 @@ from web_app.src.crud.user import (sql_chek_existing_user_by_name, sql_chek_exis
                                    sql_get_users_without_role, sql_update_role_by_user_id,
                                    sql_get_user_by_email, sql_update_password_user_by_id,
                                    sql_check_exists_username, sql_add_user_secretary, sql_add_user_judge,
-                                   sql_add_user)
+                                   sql_add_user, sql_bulk_add_users)
 from web_app.src.crud.item import (sql_chek_existing_item_by_serial, sql_get_categories_choices,
                                    sql_chek_existing_category_by_name, sql_search_items,
-                                   sql_create_category_and_items)
+                                   sql_upsert_category_and_items, sql_get_item_serial_numbers)
 from web_app.src.crud.departament import (sql_get_all_department, sql_create_department,
                                           sql_delete_role_users_by_department_id)
 from web_app.src.crud.request import (sql_create_request, sql_get_requests_by_user, sql_get_request_details,
@@ -19,9 +19,19 @@ from web_app.src.crud.request import (sql_create_request, sql_get_requests_by_us
                                       sql_delete_attachment, sql_get_requests_for_download,
                                       sql_get_planning_for_download, sql_get_count_requests_by_user,
                                       sql_get_count_planning_requests_by_user, sql_check_request_for_sign_by_judge,
-                                      sql_get_data_request_for_sign_by_judge)
+                                      sql_get_data_request_for_sign_by_judge, get_status_filter_for_user,
+                                      sql_get_request_history, sql_get_request_attachments)
 from web_app.src.crud.judge import (sql_get_department_id_by_judge_id, sql_get_all_judges,
                                     sql_get_email_department_from_judge_by_id)
 from web_app.src.crud.executor import sql_get_executors
 from web_app.src.crud.management_department import sql_get_management_departments
-from web_app.src.crud.executor_organization import sql_get_executor_organizations
\ No newline at end of file
+from web_app.src.crud.executor_organization import sql_get_executor_organizations
+from web_app.src.crud.storage import sql_filter_existing_document_paths, sql_filter_existing_pdf_urls
+from web_app.src.crud.request_list_view import sql_refresh_request_list_view, sql_get_request_ids_by_item
+from web_app.src.crud.deadline import (sql_get_next_deadline_event, sql_mark_overdue_items,
+                                     sql_queue_deadline_reminders, sql_get_deadline_reminders,
+                                     sql_delete_deadline_reminders)
+from web_app.src.crud.archive import sql_create_history_partitions, sql_archive_requests
+from web_app.src.crud.bulk import (sql_bulk_finish_requests, sql_bulk_reject_requests,
+                                   sql_bulk_redirect_management_requests, sql_bulk_redirect_executor_requests,
+                                   sql_bulk_redirect_organization_requests)
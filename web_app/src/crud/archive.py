@@ -0,0 +1,137 @@
+# Внешние зависимости
+from typing import List
+from datetime import datetime, timezone
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import Request, RequestHistory, RequestStatus
+from web_app.src.core import connection
+from web_app.src.crud.request_list_view import refresh_request_list_view
+
+
+# Статусы, после которых заявка больше не меняется и может уйти в архив
+ARCHIVE_STATUSES = (RequestStatus.FINISHED, RequestStatus.CANCELLED)
+
+
+# Границы годовой секции истории заявок
+def get_history_partition_bounds(year: int) -> str:
+    return f"FROM ('{year}-01-01 00:00:00+00') TO ('{year + 1}-01-01 00:00:00+00')"
+
+
+# DDL годовой секции истории заявок
+def get_history_partition_ddl(year: int) -> str:
+    table = RequestHistory.__tablename__
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_y{year} PARTITION OF {table} "
+        f"FOR VALUES {get_history_partition_bounds(year)}"
+    )
+
+
+# Создаем годовую секцию; строки этого года, попавшие в секцию по умолчанию, переносим в нее
+async def create_history_partition(session: AsyncSession, year: int):
+    table = RequestHistory.__tablename__
+    default_table = f"{table}_default"
+
+    if await session.scalar(sa.text(f"SELECT to_regclass('{table}_y{year}') IS NOT NULL")):
+        return
+
+    year_condition = (
+        f"created_at >= '{year}-01-01 00:00:00+00' AND created_at < '{year + 1}-01-01 00:00:00+00'"
+    )
+    has_default_rows = await session.scalar(sa.text(
+        f"SELECT to_regclass('{default_table}') IS NOT NULL "
+        f"AND EXISTS (SELECT 1 FROM {table} WHERE tableoid = to_regclass('{default_table}') AND {year_condition})"
+    ))
+
+    if not has_default_rows:
+        await session.execute(sa.text(get_history_partition_ddl(year)))
+        return
+
+    # Postgres не создаст секцию, пока такие строки лежат в секции по умолчанию:
+    # отсоединяем ее, создаем секцию, переносим строки через родительскую таблицу и присоединяем обратно
+    config.logger.warning("Moving %s rows of %s from default partition", table, year)
+    await session.execute(sa.text(f"ALTER TABLE {table} DETACH PARTITION {default_table}"))
+    await session.execute(sa.text(get_history_partition_ddl(year)))
+    await session.execute(sa.text(
+        f"WITH moved AS (DELETE FROM {default_table} WHERE {year_condition} RETURNING *) "
+        f"INSERT INTO {table} SELECT * FROM moved"
+    ))
+    await session.execute(sa.text(f"ALTER TABLE {table} ATTACH PARTITION {default_table} DEFAULT"))
+
+
+# Создаем секции истории на текущий и следующие годы (и секцию по умолчанию на случай сбоя расписания)
+@connection
+async def sql_create_history_partitions(
+    session: AsyncSession,
+    years_ahead: int = 1
+) -> List[str]:
+    try:
+        table = RequestHistory.__tablename__
+        current_year = datetime.now(timezone.utc).year
+        years = range(current_year, current_year + years_ahead + 1)
+
+        for year in years:
+            await create_history_partition(session, year)
+
+        await session.execute(sa.text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+        await session.commit()
+
+        return [f"{table}_y{year}" for year in years]
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error create history partitions: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error create history partitions: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Переносим в архив одну пачку завершенных и отмененных заявок, закрытых раньше older_than
+@connection
+async def sql_archive_requests(
+    session: AsyncSession,
+    older_than: datetime,
+    batch_size: int = 1000
+) -> int:
+    try:
+        closed_at = sa.func.coalesce(Request.completed_at, Request.update_at, Request.created_at)
+        batch = (
+            sa.select(Request.id)
+            .where(
+                Request.archived_at.is_(None),
+                Request.status.in_(ARCHIVE_STATUSES),
+                closed_at < older_than
+            )
+            .order_by(Request.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await session.execute(
+            sa.update(Request)
+            .where(Request.id.in_(batch))
+            # update_at не трогаем: архивирование не изменение заявки
+            .values(archived_at=sa.func.now(), update_at=Request.update_at)
+            .returning(Request.id)
+            .execution_options(synchronize_session=False)
+        )
+        archived_ids = result.scalars().all()
+
+        if archived_ids:
+            await refresh_request_list_view(session, Request.id.in_(archived_ids))
+
+        await session.commit()
+
+        return len(archived_ids)
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error archive requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error archive requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
@@ -0,0 +1,429 @@
+# Внешние зависимости
+from typing import List, Dict, Set, Tuple, Optional, Callable
+import asyncio
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import (Request, RequestItem, RequestHistory, RequestAction, RequestStatus,
+                                RequestItemStatus, User, Executor, ExecutorOrganization, ManagementDepartment)
+from web_app.src.core import connection
+from web_app.src.schemas import (BulkRequest, BulkCommentRequest, BulkRedirectRequest,
+                                 BulkRedirectRequestWithDeadline, BulkItemResult, BulkResponse)
+from web_app.src.crud.request import get_request_audience, publish_request_event
+from web_app.src.crud.request_list_view import refresh_request_list_view
+from web_app.src.crud.deadline import get_overdue_after_deadline_change
+
+
+# Ошибки отдельных заявок в ответе массового действия
+NOT_FOUND = (status.HTTP_404_NOT_FOUND, "Request not found")
+FORBIDDEN = (status.HTTP_403_FORBIDDEN, "Not enough rights")
+
+
+# Заявки пачки с блокировкой строк до конца транзакции (в порядке id, чтобы параллельные пачки не взаимоблокировались)
+async def select_requests_for_update(
+    session: AsyncSession,
+    registration_numbers: List[str],
+    with_items: bool = False
+) -> Dict[str, Request]:
+    query = (
+        sa.select(Request)
+        .where(Request.registration_number.in_(registration_numbers))
+        .order_by(Request.id)
+        .with_for_update(of=Request)
+    )
+    if with_items:
+        query = query.options(so.selectinload(Request.item_associations))
+
+    requests_result = await session.execute(query)
+    return {request.registration_number: request for request in requests_result.scalars()}
+
+
+# Разделение пачки на подходящие заявки и ошибки; check возвращает ошибку заявки или None.
+# Проверки прав повторяют одиночные действия crud/request.py, чтобы пачка не разрешала больше или меньше
+def split_requests(
+    registration_numbers: List[str],
+    requests: Dict[str, Request],
+    check: Callable[[Request], Optional[Tuple[int, str]]]
+) -> Tuple[List[Request], Dict[str, Tuple[int, str]]]:
+    eligible, errors = [], {}
+    for registration_number in registration_numbers:
+        request = requests.get(registration_number)
+        error = NOT_FOUND if request is None else check(request)
+        if error is None:
+            eligible.append(request)
+        else:
+            errors[registration_number] = error
+
+    return eligible, errors
+
+
+# Одна многострочная вставка истории, фиксация и события по измененным заявкам
+async def commit_bulk_action(
+    session: AsyncSession,
+    requests: List[Request],
+    action: RequestAction,
+    user_id: int,
+    description: str,
+    previous_audiences: Optional[Dict[int, Set[str]]] = None
+) -> None:
+    if requests:
+        await session.execute(
+            sa.insert(RequestHistory).values([
+                {
+                    "action": action,
+                    "request_id": request.id,
+                    "user_id": user_id,
+                    "description": description
+                }
+                for request in requests
+            ])
+        )
+        await refresh_request_list_view(session, Request.id.in_([request.id for request in requests]))
+
+    await session.commit()
+
+    previous_audiences = previous_audiences or {}
+    await asyncio.gather(*(
+        publish_request_event(request, action, previous_audience=previous_audiences.get(request.id))
+        for request in requests
+    ))
+
+
+# Ответ массового действия в порядке номеров из запроса
+def get_bulk_response(
+    action: RequestAction,
+    registration_numbers: List[str],
+    errors: Dict[str, Tuple[int, str]]
+) -> BulkResponse:
+    results = [
+        BulkItemResult(
+            registration_number=registration_number,
+            code=errors[registration_number][0],
+            detail=errors[registration_number][1]
+        ) if registration_number in errors else
+        BulkItemResult(registration_number=registration_number, code=status.HTTP_200_OK)
+        for registration_number in registration_numbers
+    ]
+
+    config.logger.info("Bulk %s: %s succeeded, %s failed",
+                       action.name, len(registration_numbers) - len(errors), len(errors))
+    return BulkResponse(
+        succeeded=len(registration_numbers) - len(errors),
+        failed=len(errors),
+        results=results
+    )
+
+
+# Массовое подтверждение выполнения (управление отдела) или завершение (управление) заявок
+@connection
+async def sql_bulk_finish_requests(
+    data: BulkRequest,
+    user: User,
+    session: AsyncSession
+) -> BulkResponse:
+    try:
+        # Как sql_finish_request: решают роль и статус заявки
+        if user.is_management_department:
+            from_status, to_status = RequestStatus.COMPLETED, RequestStatus.ENDING_COMPLETED
+            action, description = RequestAction.ENDING_COMPLETED, "Выполнение заявки подтверждено"
+
+        elif user.is_management:
+            from_status, to_status = RequestStatus.ENDING_COMPLETED, RequestStatus.FINISHED
+            action, description = RequestAction.FINISHED, "Заявка завершена"
+
+        else:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        registration_numbers = list(dict.fromkeys(data.registration_numbers))
+        requests = await select_requests_for_update(session, registration_numbers)
+        eligible, errors = split_requests(
+            registration_numbers,
+            requests,
+            lambda r: FORBIDDEN if r.status != from_status else None
+        )
+
+        if eligible:
+            await session.execute(
+                sa.update(Request)
+                .where(Request.id.in_([request.id for request in eligible]))
+                .values(status=to_status)
+                .execution_options(synchronize_session="fetch")
+            )
+
+        await commit_bulk_action(session, eligible, action, user.id, description)
+        return get_bulk_response(action, registration_numbers, errors)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk finish requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error bulk finish requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Массовое отклонение заявок (судья или управление)
+@connection
+async def sql_bulk_reject_requests(
+    data: BulkCommentRequest,
+    user: User,
+    session: AsyncSession
+) -> BulkResponse:
+    try:
+        # Как sql_reject_request: судья отклоняет свои заявки, управление - назначенные им
+        if user.is_judge:
+            in_scope = lambda r: r.judge_id == user.judge_profile.id
+
+        elif user.is_management:
+            in_scope = lambda r: r.management_id == user.management_profile.id
+
+        else:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        registration_numbers = list(dict.fromkeys(data.registration_numbers))
+        requests = await select_requests_for_update(session, registration_numbers)
+        eligible, errors = split_requests(
+            registration_numbers,
+            requests,
+            lambda r: NOT_FOUND if not in_scope(r) else
+            FORBIDDEN if r.status in (RequestStatus.COMPLETED, RequestStatus.CANCELLED) else None
+        )
+
+        previous_audiences = {request.id: get_request_audience(request) for request in eligible}
+        if eligible:
+            await session.execute(
+                sa.update(Request)
+                .where(Request.id.in_([request.id for request in eligible]))
+                .values(status=RequestStatus.CANCELLED)
+                .execution_options(synchronize_session="fetch")
+            )
+
+        comment = f"Причина: {data.comment}" if data.comment else ''
+        await commit_bulk_action(session, eligible, RequestAction.CANCELLED, user.id,
+                                 f"Заявка отклонена\n{comment}", previous_audiences)
+        return get_bulk_response(RequestAction.CANCELLED, registration_numbers, errors)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk reject requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error bulk reject requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Массовое назначение сотрудника управления отдела
+@connection
+async def sql_bulk_redirect_management_requests(
+    data: BulkRedirectRequest,
+    user: User,
+    session: AsyncSession
+) -> BulkResponse:
+    try:
+        # Как sql_redirect_management_request: назначает любой сотрудник управления (роль проверяет роутер),
+        # заявка должна быть подписана и не отменена
+        if not user.is_management:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        management_department_user = await session.scalar(
+            sa.select(User)
+            .join(ManagementDepartment, ManagementDepartment.user_id == User.id)
+            .where(ManagementDepartment.id == data.user_role_id)
+        )
+
+        if management_department_user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Management not found")
+
+        registration_numbers = list(dict.fromkeys(data.registration_numbers))
+        requests = await select_requests_for_update(session, registration_numbers)
+        eligible, errors = split_requests(
+            registration_numbers,
+            requests,
+            lambda r: FORBIDDEN if r.status in (RequestStatus.REGISTERED, RequestStatus.CANCELLED) else None
+        )
+
+        previous_audiences = {request.id: get_request_audience(request) for request in eligible}
+        if eligible:
+            await session.execute(
+                sa.update(Request)
+                .where(Request.id.in_([request.id for request in eligible]))
+                .values(
+                    status=RequestStatus.IN_PROGRESS,
+                    management_id=user.management_profile.id,
+                    management_department_id=data.user_role_id,
+                    description_management_department=data.description
+                )
+                .execution_options(synchronize_session="fetch")
+            )
+
+        await commit_bulk_action(
+            session, eligible, RequestAction.IN_PROGRESS, user.id,
+            f"Заявке назначен сотрудник управления отдела\nИсполнитель: {management_department_user.full_name}",
+            previous_audiences
+        )
+        return get_bulk_response(RequestAction.IN_PROGRESS, registration_numbers, errors)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk redirect management requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error bulk redirect management requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Массовое назначение исполнителя на все предметы заявок, у которых исполнителя еще нет
+@connection
+async def sql_bulk_redirect_executor_requests(
+    data: BulkRedirectRequestWithDeadline,
+    user: User,
+    session: AsyncSession
+) -> BulkResponse:
+    try:
+        # Как sql_redirect_executor_request: сотрудник отдела назначает только исполнителей своего отдела
+        if not (user.is_management_department or user.is_management):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        executor = await session.scalar(
+            sa.select(Executor)
+            .where(Executor.id == data.user_role_id)
+            .options(so.joinedload(Executor.user))
+        )
+
+        if executor is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Executor not found")
+
+        if user.is_management_department and executor.management_department_id != user.management_department_profile.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        # Переназначение отдельных предметов остается одиночным действием: у него свой item_id
+        already_assigned = (status.HTTP_409_CONFLICT, "Executor already assigned")
+
+        registration_numbers = list(dict.fromkeys(data.registration_numbers))
+        requests = await select_requests_for_update(session, registration_numbers, with_items=True)
+        eligible, errors = split_requests(
+            registration_numbers,
+            requests,
+            lambda r: FORBIDDEN if r.status in (RequestStatus.REGISTERED, RequestStatus.CANCELLED) else
+            already_assigned if any(a.executor_id is not None for a in r.item_associations) else None
+        )
+
+        previous_audiences = {request.id: get_request_audience(request) for request in eligible}
+        if eligible:
+            await session.execute(
+                sa.update(RequestItem)
+                .where(RequestItem.request_id.in_([request.id for request in eligible]))
+                .values(
+                    executor_id=data.user_role_id,
+                    description_executor=data.description,
+                    deadline_executor=data.deadline,
+                    is_overdue=get_overdue_after_deadline_change("deadline_executor", data.deadline),
+                    is_reminded=False
+                )
+                .execution_options(synchronize_session="fetch")
+            )
+
+        await commit_bulk_action(
+            session, eligible, RequestAction.APPOINTED, user.id,
+            (f"Заявки отправлены на выполнение\nИсполнитель для всех заявок: {executor.user.full_name}\n"
+             f"Срок: {data.deadline.strftime("%d.%m.%Y")}"),
+            previous_audiences
+        )
+        return get_bulk_response(RequestAction.APPOINTED, registration_numbers, errors)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk redirect executor requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error bulk redirect executor requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Массовая передача организации-исполнителю незавершенных предметов исполнителя
+@connection
+async def sql_bulk_redirect_organization_requests(
+    data: BulkRedirectRequestWithDeadline,
+    user: User,
+    session: AsyncSession
+) -> BulkResponse:
+    try:
+        if not user.is_executor:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+        org_user = await session.scalar(
+            sa.select(User)
+            .join(ExecutorOrganization, ExecutorOrganization.user_id == User.id)
+            .where(ExecutorOrganization.id == data.user_role_id)
+        )
+
+        if org_user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization executor not found")
+
+        # Как sql_redirect_organization_request: исполнитель передает только свои предметы
+        executor_id = user.executor_profile.id
+        closed_statuses = (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED)
+
+        registration_numbers = list(dict.fromkeys(data.registration_numbers))
+        requests = await select_requests_for_update(session, registration_numbers, with_items=True)
+        eligible, errors = split_requests(
+            registration_numbers,
+            requests,
+            lambda r: NOT_FOUND if all(a.executor_id != executor_id for a in r.item_associations) else
+            FORBIDDEN if all(a.status in closed_statuses for a in r.item_associations
+                             if a.executor_id == executor_id) else None
+        )
+
+        previous_audiences = {request.id: get_request_audience(request) for request in eligible}
+        if eligible:
+            await session.execute(
+                sa.update(RequestItem)
+                .where(
+                    RequestItem.request_id.in_([request.id for request in eligible]),
+                    RequestItem.executor_id == executor_id,
+                    RequestItem.status.not_in(closed_statuses)
+                )
+                .values(
+                    executor_organization_id=data.user_role_id,
+                    description_organization=data.description,
+                    deadline_organization=data.deadline,
+                    is_overdue=get_overdue_after_deadline_change("deadline_organization", data.deadline),
+                    is_reminded=False
+                )
+                .execution_options(synchronize_session="fetch")
+            )
+
+        await commit_bulk_action(
+            session, eligible, RequestAction.APPOINTED, user.id,
+            (f"Заявка отправлена на выполнение\nИсполнитель: {org_user.full_name}\n"
+             f"Срок: {data.deadline.strftime("%d.%m.%Y")}"),
+            previous_audiences
+        )
+        return get_bulk_response(RequestAction.APPOINTED, registration_numbers, errors)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk redirect organization requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error bulk redirect organization requests: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
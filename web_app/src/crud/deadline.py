@@ -0,0 +1,241 @@
+# Внешние зависимости
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import Request, Item, request_item, ITEM_DEADLINE, RequestItemStatus, DeadlineReminder
+from web_app.src.core import connection
+from web_app.src.crud.request_list_view import refresh_request_list_view
+
+
+DEADLINE_COLUMNS = (
+    request_item.c.deadline_executor,
+    request_item.c.deadline_organization,
+    request_item.c.deadline_planning
+)
+
+# Предметы в этих статусах отмечаются напомненными без отправки напоминания
+CLOSED_ITEM_STATUSES = (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED)
+
+
+# Просрочка предмета после смены одного из сроков: считается в том же UPDATE,
+# остальные сроки берутся из строки (в SET видны значения до изменения, а они не меняются)
+def get_overdue_after_deadline_change(column_name: str, deadline: datetime) -> sa.ColumnElement:
+    deadlines = [
+        sa.literal(deadline, sa.DateTime(timezone=True)) if column.name == column_name else column
+        for column in DEADLINE_COLUMNS
+    ]
+    return sa.func.coalesce(sa.func.least(*deadlines) < sa.func.now(), False)
+
+
+# Пачка предметов для планировщика: ближайшие сроки первыми, занятые другим процессом строки пропускаются
+def select_pending_items(condition: sa.ColumnElement, batch_size: int) -> sa.Select:
+    return (
+        sa.select(request_item.c.request_id, request_item.c.item_id)
+        .where(condition)
+        .order_by(ITEM_DEADLINE)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+
+# Время следующего события планировщика: ближайший срок непросроченного предмета,
+# ближайшее напоминание (оба минимума читаются по частичным индексам на ITEM_DEADLINE)
+# или неотправленное напоминание из очереди (повтор доставки)
+@connection
+async def sql_get_next_deadline_event(
+    session: AsyncSession,
+    reminder_lead: timedelta
+) -> Optional[datetime]:
+    try:
+        next_overdue = (
+            sa.select(sa.func.min(ITEM_DEADLINE))
+            .where(~request_item.c.is_overdue)
+            .scalar_subquery()
+        )
+        next_reminder = (
+            sa.select(sa.func.min(ITEM_DEADLINE))
+            .where(~request_item.c.is_reminded)
+            .scalar_subquery()
+        )
+
+        next_delivery = sa.select(sa.func.min(DeadlineReminder.created_at)).scalar_subquery()
+
+        result = await session.execute(
+            sa.select(sa.func.least(next_overdue, next_reminder - reminder_lead, next_delivery))
+        )
+        return result.scalar()
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error get next deadline event: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error get next deadline event: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Отмечаем просроченными одну пачку предметов, срок которых прошел, и обновляем проекцию их заявок
+@connection
+async def sql_mark_overdue_items(
+    session: AsyncSession,
+    batch_size: int = 500
+) -> int:
+    try:
+        batch = select_pending_items(
+            sa.and_(~request_item.c.is_overdue, ITEM_DEADLINE < sa.func.now()),
+            batch_size
+        )
+        result = await session.execute(
+            sa.update(request_item)
+            .where(sa.tuple_(request_item.c.request_id, request_item.c.item_id).in_(batch))
+            .values(is_overdue=True)
+            .returning(request_item.c.request_id)
+        )
+        request_ids = result.scalars().all()
+
+        if request_ids:
+            await refresh_request_list_view(session, Request.id.in_(set(request_ids)))
+
+        await session.commit()
+
+        return len(request_ids)
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error mark overdue items: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error mark overdue items: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Аудитория напоминания: назначенные на предмет исполнитель и организация
+def get_reminder_audience(reminder: Dict[str, Any]) -> List[str]:
+    audience = []
+    if reminder["executor_id"] is not None:
+        audience.append(f"executor:{reminder['executor_id']}")
+
+    if reminder["executor_organization_id"] is not None:
+        audience.append(f"executor_organization:{reminder['executor_organization_id']}")
+
+    return audience
+
+
+# Ставим в очередь одну пачку напоминаний о сроках: предметы отмечаются напомненными
+# в той же транзакции, в которой напоминания записываются в outbox, поэтому ни одно не теряется
+@connection
+async def sql_queue_deadline_reminders(
+    session: AsyncSession,
+    reminder_lead: timedelta,
+    batch_size: int = 500
+) -> int:
+    try:
+        batch = select_pending_items(
+            sa.and_(~request_item.c.is_reminded, ITEM_DEADLINE <= sa.func.now() + reminder_lead),
+            batch_size
+        )
+        taken = (
+            sa.update(request_item)
+            .where(sa.tuple_(request_item.c.request_id, request_item.c.item_id).in_(batch))
+            .values(is_reminded=True)
+            .returning(
+                request_item.c.request_id,
+                request_item.c.item_id,
+                request_item.c.status,
+                request_item.c.executor_id,
+                request_item.c.executor_organization_id,
+                ITEM_DEADLINE.label("deadline")
+            )
+            .cte("taken")
+        )
+
+        result = await session.execute(
+            sa.select(
+                taken,
+                Request.registration_number,
+                Request.human_registration_number,
+                Item.name.label("item_name")
+            )
+            .join(Request, Request.id == taken.c.request_id)
+            .join(Item, Item.id == taken.c.item_id)
+        )
+        rows = result.mappings().all()
+
+        # Закрытые предметы и предметы без исполнителя отмечаются напомненными без напоминания
+        reminders = [
+            {
+                "request_id": row["request_id"],
+                "item_id": row["item_id"],
+                "audience": get_reminder_audience(row),
+                "data": {
+                    "registration_number": row["registration_number"],
+                    "human_registration_number": row["human_registration_number"],
+                    "item_id": row["item_id"],
+                    "item_name": row["item_name"],
+                    "deadline": row["deadline"].isoformat()
+                }
+            }
+            for row in rows
+            if row["status"] not in CLOSED_ITEM_STATUSES and get_reminder_audience(row)
+        ]
+        if reminders:
+            await session.execute(sa.insert(DeadlineReminder), reminders)
+
+        await session.commit()
+
+        return len(rows)
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error queue deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error queue deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Пачка неотправленных напоминаний в порядке постановки в очередь
+@connection
+async def sql_get_deadline_reminders(
+    session: AsyncSession,
+    batch_size: int = 500
+) -> List[Dict[str, Any]]:
+    try:
+        result = await session.execute(
+            sa.select(DeadlineReminder.id, DeadlineReminder.audience, DeadlineReminder.data)
+            .order_by(DeadlineReminder.id)
+            .limit(batch_size)
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error get deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error get deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Удаляем из очереди доставленные напоминания
+@connection
+async def sql_delete_deadline_reminders(
+    session: AsyncSession,
+    reminder_ids: List[int]
+) -> None:
+    try:
+        await session.execute(sa.delete(DeadlineReminder).where(DeadlineReminder.id.in_(reminder_ids)))
+        await session.commit()
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error delete deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error delete deadline reminders: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
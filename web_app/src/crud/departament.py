@@ -25,11 +25,11 @@ async def sql_get_all_department(session: AsyncSession) -> List[Dict[str, Any]]:
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading all departament: {e}")
+        config.logger.error("Database error reading all departament: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading all departament: {e}")
+        config.logger.error("Unexpected error reading all departament: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -53,11 +53,11 @@ async def sql_create_department(
         await session.commit()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error create departament: {e}")
+        config.logger.error("Database error create departament: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error create departament: {e}")
+        config.logger.error("Unexpected error create departament: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -88,9 +88,9 @@ async def sql_delete_role_users_by_department_id(
         await session.commit()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error delete role users by department_id: {e}")
+        config.logger.error("Database error delete role users by department_id: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error delete role users by department_id: {e}")
+        config.logger.error("Unexpected error delete role users by department_id: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
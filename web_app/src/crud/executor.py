@@ -30,9 +30,9 @@ async def sql_get_executors(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error get all executors: {e}")
+        config.logger.error("Database error get all executors: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error get all executors: {e}")
+        config.logger.error("Unexpected error get all executors: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
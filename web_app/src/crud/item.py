@@ -1,6 +1,7 @@
 # Внешние зависимости
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Set
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
@@ -8,41 +9,107 @@ from fastapi import HTTPException, status
 from web_app.src.core import config
 from web_app.src.models import Item, Category
 from web_app.src.core import connection
+from web_app.src.crud.request_list_view import refresh_request_list_view, get_requests_with_items_condition
 
 
-# Создаем категории и товары из данных
+# Добавляем или обновляем пачку категорий и товаров, возвращаем сводку изменений
 @connection
-async def sql_create_category_and_items(
-    data: Dict[str, Dict[int, str]],
+async def sql_upsert_category_and_items(
+    rows: List[Tuple[str, str, str, str]],
     session: AsyncSession
-) -> None:
+) -> Dict[str, int]:
     try:
-        for category, items in data.items():
-            new_category = Category(
-                name=category
+        # Повторы внутри пачки недопустимы для ON CONFLICT, оставляем последнюю строку
+        items = {serial_number: (category, name, description) for category, serial_number, name, description in rows}
+        category_names = {category for category, _, _ in items.values()}
+
+        categories_result = await session.execute(
+            insert(Category)
+            .values([{"name": name} for name in category_names])
+            .on_conflict_do_nothing(index_elements=[Category.name])
+            .returning(Category.id)
+        )
+        created_categories = len(categories_result.all())
+
+        category_ids_result = await session.execute(
+            sa.select(Category.name, Category.id)
+            .where(Category.name.in_(category_names))
+        )
+        category_ids = dict(category_ids_result.all())
+
+        stmt = insert(Item).values([
+            {
+                "serial_number": serial_number,
+                "name": name,
+                "description": description,
+                "category_id": category_ids[category]
+            }
+            for serial_number, (category, name, description) in items.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Item.serial_number],
+            set_={
+                "name": stmt.excluded.name,
+                "description": stmt.excluded.description,
+                "category_id": stmt.excluded.category_id,
+                "update_at": sa.func.now()
+            },
+            # Не трогаем строки, которые не изменились
+            where=sa.or_(
+                Item.name.is_distinct_from(stmt.excluded.name),
+                Item.description.is_distinct_from(stmt.excluded.description),
+                Item.category_id.is_distinct_from(stmt.excluded.category_id)
             )
-            session.add(new_category)
-            await session.flush()
-            
-            for item_id, item in items.items():
-                new_item = Item(
-                    serial_number=str(item_id),
-                    name=item[0],
-                    description=item[1],
-                    category_id=new_category.id
-                )
-                session.add(new_item)
+        ).returning(Item.id, sa.literal_column("xmax = 0").label("inserted"))
+
+        items_result = await session.execute(stmt)
+        upserted = items_result.all()
+
+        # Названия обновленных предметов входят в строки проекции списков заявок
+        updated_ids = [item_id for item_id, is_inserted in upserted if not is_inserted]
+        if updated_ids:
+            await refresh_request_list_view(session, get_requests_with_items_condition(updated_ids))
+
         await session.commit()
-        
+
+        inserted = len(upserted) - len(updated_ids)
+        updated = len(updated_ids)
+
+        return {
+            "categories_created": created_categories,
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": len(items) - inserted - updated
+        }
+
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error create category and items: {e}")
+        config.logger.error("Database error upsert category and items: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error create category and items: {e}")
+        config.logger.error("Unexpected error upsert category and items: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
-        
-        
+
+
+# Получаем все серийные номера товаров
+@connection
+async def sql_get_item_serial_numbers(session: AsyncSession) -> Set[str]:
+    try:
+        items_result = await session.execute(
+            sa.select(Item.serial_number)
+        )
+
+        return set(items_result.scalars())
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error reading item serial numbers: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error reading item serial numbers: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
 # Проверяем, существует ли товар с таким номером
 @connection
 async def sql_chek_existing_item_by_serial(serial_number: str, session: AsyncSession) -> bool:
@@ -55,11 +122,11 @@ async def sql_chek_existing_item_by_serial(serial_number: str, session: AsyncSes
         return bool(item_result.scalar_one_or_none())
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading item by serial_number {serial_number}: {e}")
+        config.logger.error("Database error reading item by serial_number %s: %s", serial_number, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading item by serial_number {serial_number}: {e}")
+        config.logger.error("Unexpected error reading item by serial_number %s: %s", serial_number, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -75,11 +142,11 @@ async def sql_chek_existing_category_by_name(name: str, session: AsyncSession) -
         return bool(category_result.scalar_one_or_none())
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading category by name {name}: {e}")
+        config.logger.error("Database error reading category by name %s: %s", name, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading category by name {name}: {e}")
+        config.logger.error("Unexpected error reading category by name %s: %s", name, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -94,11 +161,11 @@ async def sql_get_categories_choices(session: AsyncSession) -> List[Tuple[str, s
         return [(str(cat.id), cat.name) for cat in categories_result.all()]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading all categories: {e}")
+        config.logger.error("Database error reading all categories: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading all categories: {e}")
+        config.logger.error("Unexpected error reading all categories: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -117,9 +184,9 @@ async def sql_search_items(search: str, session: AsyncSession) -> List[Dict[str,
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error search items: {e}")
+        config.logger.error("Database error search items: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error search items: {e}")
+        config.logger.error("Unexpected error search items: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
@@ -28,15 +28,15 @@ async def sql_get_department_id_by_judge_id(
         return department_id
 
     except NoResultFound:
-        config.logger.info(f"Judge not found by ID: {judge_id}")
+        config.logger.info("Judge not found by ID: %s", judge_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Judge not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading judge by ID {judge_id}: {e}")
+        config.logger.error("Database error reading judge by ID %s: %s", judge_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading judge by ID {judge_id}: {e}")
+        config.logger.error("Unexpected error reading judge by ID %s: %s", judge_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -64,11 +64,11 @@ async def sql_get_all_judges(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error get all judges: {e}")
+        config.logger.error("Database error get all judges: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error get all judges: {e}")
+        config.logger.error("Unexpected error get all judges: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -93,13 +93,13 @@ async def sql_get_email_department_from_judge_by_id(
         return judge.user.email, judge.user.full_name, judge.department.name
 
     except NoResultFound:
-        config.logger.info(f"Judge not found by ID: {judge_id}")
+        config.logger.info("Judge not found by ID: %s", judge_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Judge not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error get email and department from judge: {e}")
+        config.logger.error("Database error get email and department from judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error get email and department from judge: {e}")
+        config.logger.error("Unexpected error get email and department from judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
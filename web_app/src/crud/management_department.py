@@ -25,9 +25,9 @@ async def sql_get_management_departments(session: AsyncSession) -> List[Dict[str
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error get all management_departments: {e}")
+        config.logger.error("Database error get all management_departments: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error get all management_departments: {e}")
+        config.logger.error("Unexpected error get all management_departments: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
@@ -1,7 +1,7 @@
 # Внешние зависимости
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime
 import uuid
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -15,16 +15,20 @@ from web_app.src.models import (Request, TYPE_ID_MAPPING, request_item, RequestI
                                 STATUS_MAPPING, User, Secretary, Judge, Management, Executor, Item, UserRole,
                                 ManagementDepartment, ExecutorOrganization, RequestItemStatus,
                                 STATUS_ID_MAPPING, REQUEST_ITEM_STATUS_ID_MAPPING, REQUEST_ITEM_STATUS_MAPPING,
-                                Department)
+                                Department, RequestListView)
 from web_app.src.core import connection
 from web_app.src.schemas import (CreateRequest, RequestResponse, RequestDetailResponse,
-                                 RequestHistoryResponse, RequestDataResponse, RightsResponse,
+                                 RequestHistoryResponse, RequestDataResponse,
                                  RedirectRequest, UserResponse, AttachmentsRequest, ItemsNameRequest,
                                  ItemsNameRequestFull, RedirectRequestWithDeadline, RequestExecutorResponse,
                                  PlanningRequest, ActualStatusRequest, ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS,
-                                 ACTUAL_STATUS_MAPPING_FOR_REQUEST_ITEM_STATUS, DocumentData, DocumentItem)
-from web_app.src.utils import delete_files, generate_pdf
+                                 ACTUAL_STATUS_MAPPING_FOR_REQUEST_ITEM_STATUS, DocumentData, DocumentItem,
+                                 RIGHTS_BY_REQUEST_STATUS, RIGHTS_BY_REQUEST_ITEM_STATUS,
+                                 RequestHistoryPageResponse, AttachmentsPageResponse)
+from web_app.src.utils import delete_files, generate_pdf, event_service, reference_cache, REFERENCE_DEPARTMENTS
 from web_app.src.crud.departament import sql_get_all_department
+from web_app.src.crud.request_list_view import refresh_request_list_view, get_overdue_expression
+from web_app.src.crud.deadline import get_overdue_after_deadline_change
 
 
 # Вспомогательная функция для получения прав для взаимодействия с предметом
@@ -45,39 +49,72 @@ def get_right_for_item_by_role(
     return False
 
 
-# Вспомогательная функция для получения просрочки заявке для управляющих
-def get_overdue_request_for_management(
-    role: UserRole,
-    request: Request
-) -> bool:
-    
-    if (role not in (UserRole.MANAGEMENT, UserRole.MANAGEMENT_DEPARTMENT) or
-        request.status == RequestStatus.FINISHED):
-        return False
-        
-    now = datetime.now(timezone.utc)
-    for association in request.item_associations:
-        if ((association.deadline_executor and association.deadline_executor < now) or
-            (association.deadline_organization and association.deadline_organization < now) or
-            (association.deadline_planning and association.deadline_planning < now)):
-            return True
+# Статусы фильтра, доступные роли пользователя, в порядке отображения (первый выбран по умолчанию)
+def get_status_filter_for_user(user: User) -> Tuple[Tuple[Any, ...], List[Dict[str, Any]]]:
+    if user.role in (UserRole.EXECUTOR, UserRole.EXECUTOR_ORGANIZATION):
+        return tuple(REQUEST_ITEM_STATUS_MAPPING.values()), REQUEST_ITEM_STATUS_ID_MAPPING
 
-    return False
+    if user.is_secretary or user.is_judge:
+        return tuple(STATUS_MAPPING.values()), STATUS_ID_MAPPING
 
+    if user.is_management:
+        return tuple(STATUS_MAPPING.values())[1:], STATUS_ID_MAPPING[1:]
+
+    if user.is_management_department:
+        return tuple(STATUS_MAPPING.values())[2:], STATUS_ID_MAPPING[2:]
+
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+
+# Аудитория события заявки: ее участники и исполнители предметов
+def get_request_audience(request: Request) -> Set[str]:
+    audience = {f"secretary:{request.secretary_id}", f"judge:{request.judge_id}"}
+
+    # Утвержденная заявка видна всем сотрудникам управления, пока ее не взяли в работу
+    if request.status == RequestStatus.CONFIRMED:
+        audience.add("management:*")
+
+    if request.management_id is not None:
+        audience.add(f"management:{request.management_id}")
+
+    if request.management_department_id is not None:
+        audience.add(f"management_department:{request.management_department_id}")
+
+    # Предметы не подгружаются отдельно: они уже загружены во всех изменениях, затрагивающих исполнителей
+    if "item_associations" not in sa.inspect(request).unloaded:
+        for association in request.item_associations:
+            if association.executor_id is not None:
+                audience.add(f"executor:{association.executor_id}")
+
+            if association.executor_organization_id is not None:
+                audience.add(f"executor_organization:{association.executor_organization_id}")
+
+    return audience
+
+
+# Публикация изменения заявки подписчикам (SSE) после фиксации транзакции.
+# previous_audience - аудитория до изменения: те, из чьих списков заявка пропадает
+async def publish_request_event(
+    request: Request,
+    action: RequestAction,
+    previous_audience: Optional[Set[str]] = None,
+    item_id: Optional[int] = None
+) -> None:
+    await event_service.publish(
+        event="request",
+        data={
+            "registration_number": request.registration_number,
+            "status": {
+                "name": request.status.name,
+                "value": request.status.value
+            },
+            "action": action.name,
+            "item_id": item_id
+        },
+        audience=get_request_audience(request) | (previous_audience or set())
+    )
 
-# Вспомогательная функция для получения просрочки заявке для исполнителей
-def get_overdue_request_for_executor(
-    association: RequestItem
-) -> bool:        
-    now = datetime.now(timezone.utc)
-    if ((association.deadline_executor and association.deadline_executor < now) or
-        (association.deadline_organization and association.deadline_organization < now) or
-        (association.deadline_planning and association.deadline_planning < now)):
-        return True
 
-    return False
-    
-    
 # Создаем новую заявку
 @connection
 async def sql_create_request(
@@ -210,18 +247,21 @@ async def sql_create_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == new_request.id)
         await session.commit()
+        await publish_request_event(new_request, RequestAction.REGISTERED)
+
         return new_request.registration_number
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error while creating request: {e}")
+        config.logger.error("Database error while creating request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error while creating request: {e}")
+        config.logger.error("Unexpected error while creating request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -237,33 +277,32 @@ async def sql_get_requests_by_user(
         page_size: int = 10
 ) -> List[RequestResponse]:
     try:
+        # Строки списка читаются из проекции одним запросом, просрочка считается в том же запросе.
+        # Архивные заявки в списки не попадают и доступны только по ссылке на детали
         query = (
-            sa.select(Request)
-        ).offset((page - 1) * page_size).limit(page_size).order_by(Request.created_at.desc())
+            sa.select(RequestListView, get_overdue_expression(user.role).label("is_overdue"))
+            .where(RequestListView.archived_at.is_(None))
+        ).offset((page - 1) * page_size).limit(page_size).order_by(RequestListView.created_at.desc())
 
         if user.is_secretary:
-            query = query.where(Request.secretary_id == user.secretary_profile.id)
+            query = query.where(RequestListView.secretary_id == user.secretary_profile.id)
 
         elif user.is_judge:
-            query = query.where(Request.judge_id == user.judge_profile.id)
+            query = query.where(RequestListView.judge_id == user.judge_profile.id)
 
         elif user.is_management:
-            query = (query.where(
-                Request.status != RequestStatus.REGISTERED
+            query = query.where(
+                RequestListView.status != RequestStatus.REGISTERED
             ).where(
                 sa.or_(
-                    Request.status == RequestStatus.CONFIRMED,
-                    Request.management_id == user.management_profile.id
+                    RequestListView.status == RequestStatus.CONFIRMED,
+                    RequestListView.management_id == user.management_profile.id
                 )
-            ).options(
-                so.selectinload(Request.item_associations)
-            ))
+            )
 
         elif user.is_management_department:
             query = query.where(
-                Request.management_department_id == user.management_department_profile.id
-            ).options(
-                so.selectinload(Request.item_associations)
+                RequestListView.management_department_id == user.management_department_profile.id
             )
 
         else:
@@ -275,10 +314,10 @@ async def sql_get_requests_by_user(
                 None
             )
             if STATUS_MAPPING.get(status_filter):
-                query = query.where(Request.status == STATUS_MAPPING[status_filter])
+                query = query.where(RequestListView.status == STATUS_MAPPING[status_filter])
 
         else:
-            query = query.where(Request.status == RequestStatus.REGISTERED)
+            query = query.where(RequestListView.status == RequestStatus.REGISTERED)
 
         if isinstance(type_filter_id, int):
             type_filter = next(
@@ -286,16 +325,16 @@ async def sql_get_requests_by_user(
                 None
             )
             if TYPE_MAPPING.get(type_filter):
-                query = query.where(Request.request_type == TYPE_MAPPING[type_filter])
+                query = query.where(RequestListView.request_type == TYPE_MAPPING[type_filter])
 
         if isinstance(department_filter_id, int):
-            query = query.where(Request.department_id == department_filter_id)
+            query = query.where(RequestListView.department_id == department_filter_id)
 
         requests_result = await session.execute(query)
-        requests = requests_result.scalars()
 
+        # Данные из БД уже корректны: строки собираются без повторной валидации
         return [
-            RequestResponse(
+            RequestResponse.model_construct(
                 registration_number=request.registration_number,
                 human_registration_number=request.human_registration_number,
                 request_type={
@@ -308,38 +347,22 @@ async def sql_get_requests_by_user(
                 },
                 is_emergency=request.is_emergency,
                 created_at=request.created_at,
-                rights=RightsResponse(
-                    view=True,
-                    edit=request.status == RequestStatus.REGISTERED,
-                    approve=request.status == RequestStatus.REGISTERED,
-                    reject_before=request.status == RequestStatus.REGISTERED,
-                    reject_after=request.status not in (RequestStatus.FINISHED,
-                                                        RequestStatus.CANCELLED),
-                    redirect_management_department=request.status not in (RequestStatus.CANCELLED,
-                                                                          RequestStatus.FINISHED),
-                    redirect_executor=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                    redirect_org=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                    deadline=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                    planning=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                    ready=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                    confirm_management_department=request.status == RequestStatus.COMPLETED,
-                    confirm_management=request.status == RequestStatus.ENDING_COMPLETED
-                ),
-                actual_status=(ActualStatusRequest.OVERDUE if get_overdue_request_for_management(user.role, request)
+                rights=RIGHTS_BY_REQUEST_STATUS[request.status],
+                actual_status=(ActualStatusRequest.OVERDUE if is_overdue
                                else ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS[request.status])
             )
-            for request in requests
+            for request, is_overdue in requests_result
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view requests: {e}")
+        config.logger.error("Database error view requests: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view requests: {e}")
+        config.logger.error("Unexpected error view requests: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -362,7 +385,7 @@ async def sql_get_requests_for_executor(
             ).offset((page - 1) * page_size).limit(page_size).order_by(Request.created_at.desc())
         )
 
-        conditions = []
+        conditions = [Request.archived_at.is_(None)]
 
         if user.is_executor:
             request_item_conditions = [
@@ -421,11 +444,12 @@ async def sql_get_requests_for_executor(
         requests_result = await session.execute(query)
         requests = requests_result.scalars().all()
 
+        # Данные из БД уже корректны: строки собираются без повторной валидации
         return [
-            RequestExecutorResponse(
+            RequestExecutorResponse.model_construct(
                 registration_number=request.registration_number,
                 human_registration_number=request.human_registration_number,
-                item=ItemsNameRequest(
+                item=ItemsNameRequest.model_construct(
                     id=association.item.id,
                     name=association.item.name,
                     quantity=association.count,
@@ -441,23 +465,8 @@ async def sql_get_requests_for_executor(
                 is_emergency=request.is_emergency,
                 created_at=request.created_at,
                 deadline=association.deadline_executor if user.is_executor else association.deadline_organization,
-                rights=RightsResponse(
-                    view=True,
-                    edit=False,
-                    approve=False,
-                    reject_before=False,
-                    reject_after=False,
-                    redirect_management_department=False,
-                    redirect_executor=False,
-                    redirect_org=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    deadline=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    planning=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED,
-                                                        RequestItemStatus.PLANNED),
-                    ready=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    confirm_management_department=False,
-                    confirm_management=False
-                ),
-                actual_status=(ActualStatusRequest.OVERDUE if get_overdue_request_for_executor(association)
+                rights=RIGHTS_BY_REQUEST_ITEM_STATUS[association.status],
+                actual_status=(ActualStatusRequest.OVERDUE if association.is_overdue
                                else ACTUAL_STATUS_MAPPING_FOR_REQUEST_ITEM_STATUS[association.status])
             )
             for request in requests
@@ -466,14 +475,14 @@ async def sql_get_requests_for_executor(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view requests for executor: {e}")
+        config.logger.error("Database error view requests for executor: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view requests for executor: {e}")
+        config.logger.error("Unexpected error view requests for executor: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -497,7 +506,7 @@ async def sql_get_planning_requests(
         if isinstance(department_filter_id, int):
             query = query.where(Request.department_id == department_filter_id)
 
-        conditions = []
+        conditions = [Request.archived_at.is_(None)]
 
         if user.is_management:
             conditions.append(Request.management_id == user.management_profile.id)
@@ -551,11 +560,12 @@ async def sql_get_planning_requests(
         requests_result = await session.execute(query)
         requests = requests_result.scalars().all()
 
+        # Данные из БД уже корректны: строки собираются без повторной валидации
         return [
-            RequestExecutorResponse(
+            RequestExecutorResponse.model_construct(
                 registration_number=request.registration_number,
                 human_registration_number=request.human_registration_number,
-                item=ItemsNameRequest(
+                item=ItemsNameRequest.model_construct(
                     id=association.item.id,
                     name=association.item.name,
                     quantity=association.count,
@@ -571,23 +581,8 @@ async def sql_get_planning_requests(
                 is_emergency=request.is_emergency,
                 created_at=request.created_at,
                 deadline=association.deadline_planning,
-                rights=RightsResponse(
-                    view=True,
-                    edit=False,
-                    approve=False,
-                    reject_before=False,
-                    reject_after=False,
-                    redirect_management_department=False,
-                    redirect_executor=False,
-                    redirect_org=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    deadline=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    planning=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED,
-                                                        RequestItemStatus.PLANNED),
-                    ready=association.status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED),
-                    confirm_management_department=False,
-                    confirm_management=False
-                ),
-                actual_status=(ActualStatusRequest.OVERDUE if get_overdue_request_for_executor(association)
+                rights=RIGHTS_BY_REQUEST_ITEM_STATUS[association.status],
+                actual_status=(ActualStatusRequest.OVERDUE if association.is_overdue
                                else ActualStatusRequest.PLANNED)
             )
             for request in requests
@@ -596,17 +591,86 @@ async def sql_get_planning_requests(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view requests for planning: {e}")
+        config.logger.error("Database error view requests for planning: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view requests for planning: {e}")
+        config.logger.error("Unexpected error view requests for planning: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
+# Ответ записи истории заявки
+def get_history_response(history: RequestHistory) -> RequestHistoryResponse:
+    return RequestHistoryResponse(
+        created_at=history.created_at,
+        action={
+            "name": history.action.name,
+            "value": history.action.value
+        },
+        description=history.description,
+        user=UserResponse(
+            id=history.user.id,
+            name=history.user.full_name if history.user else None
+        )
+    )
+
+
+# Ответ вложения заявки
+def get_attachment_response(attachment: RequestDocument) -> AttachmentsRequest:
+    return AttachmentsRequest(
+        file_name=attachment.file_name,
+        content_type=attachment.document_type,
+        file_path=f"/u8ufy1{attachment.file_path.replace("web_app/src", "")}",
+        size=attachment.size
+    )
+
+
+# Подзапрос id заявки по регистрационному номеру
+def request_id_by_number(registration_number: str) -> sa.ScalarSelect:
+    return (
+        sa.select(Request.id)
+        .where(Request.registration_number == registration_number)
+        .scalar_subquery()
+    )
+
+
+# Страница истории от новых записей к старым: курсор - id последней записи предыдущей страницы
+async def select_history_page(
+    session: AsyncSession,
+    request_id: Any,
+    limit: int,
+    cursor: Optional[int] = None
+) -> Tuple[List[RequestHistoryResponse], Optional[int]]:
+    query = (
+        sa.select(RequestHistory)
+        .where(RequestHistory.request_id == request_id)
+        .options(so.joinedload(RequestHistory.user))
+        .order_by(RequestHistory.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(RequestHistory.id < cursor)
+
+    rows = (await session.execute(query)).scalars().all()
+    # Лишняя запись только показывает, что есть следующая страница
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return [get_history_response(h) for h in rows[:limit]], next_cursor
+
+
+# Пустая первая страница: 404, если заявки нет
+async def ensure_request_exists(session: AsyncSession, registration_number: str):
+    request_id = await session.scalar(
+        sa.select(Request.id)
+        .where(Request.registration_number == registration_number)
+    )
+    if request_id is None:
+        config.logger.info("Request not found by registration_number: %s", registration_number)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
+
+
 # Выводим подробную информацию о заявке
 @connection
 async def sql_get_request_details(
@@ -617,8 +681,20 @@ async def sql_get_request_details(
     try:
         role = user.role
 
+        # Количество записей истории и вложений считается в том же запросе, сами записи не загружаются
+        history_count = (
+            sa.select(sa.func.count(RequestHistory.id))
+            .where(RequestHistory.request_id == Request.id)
+            .scalar_subquery()
+        )
+        attachments_count = (
+            sa.select(sa.func.count(RequestDocument.id))
+            .where(RequestDocument.request_id == Request.id)
+            .scalar_subquery()
+        )
+
         request_result = await session.execute(
-            sa.select(Request)
+            sa.select(Request, history_count, attachments_count)
             .where(Request.registration_number == registration_number)
             .options(
                 so.selectinload(Request.item_associations)
@@ -631,13 +707,17 @@ async def sql_get_request_details(
                 so.joinedload(Request.judge).joinedload(Judge.user),
                 so.joinedload(Request.management).joinedload(Management.user),
                 so.joinedload(Request.management_department).joinedload(ManagementDepartment.user),
-                so.joinedload(Request.department),
-                so.selectinload(Request.related_documents),
-                so.selectinload(Request.history).joinedload(RequestHistory.user)
+                so.joinedload(Request.department)
             )
         )
 
-        request = request_result.scalar_one()
+        request, history_count, attachments_count = request_result.one()
+        history, history_next_cursor = await select_history_page(
+            session=session,
+            request_id=request.id,
+            limit=config.DETAIL_HISTORY_LIMIT
+        )
+
         items = []
         for association in request.item_associations:
             right_item = get_right_for_item_by_role(
@@ -705,60 +785,95 @@ async def sql_get_request_details(
             completed_at=request.completed_at,
             is_emergency=request.is_emergency,
             pdf_request=f"{request.pdf_signed_request_url if request.pdf_signed_request_url else request.pdf_request_url}".replace("/src/", ""),
-            attachments=[
-                AttachmentsRequest(
-                    file_name=attachment.file_name,
-                    content_type=attachment.document_type,
-                    file_path=f"/u8ufy1{attachment.file_path.replace("web_app/src", "")}",
-                    size=attachment.size
-                )
-                for attachment in request.related_documents
-            ],
-            history=[
-                RequestHistoryResponse(
-                    created_at=h.created_at,
-                    action={
-                        "name": h.action.name,
-                        "value": h.action.value
-                    },
-                    description=h.description,
-                    user=UserResponse(
-                        id=h.user.id,
-                        name=h.user.full_name if h.user else None
-                    )
-                )
-                for h in request.history
-            ],
-            rights=RightsResponse(
-                view=True,
-                edit=request.status == RequestStatus.REGISTERED,
-                approve=request.status == RequestStatus.REGISTERED,
-                reject_before=request.status == RequestStatus.REGISTERED,
-                reject_after=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                redirect_management_department=request.status not in (RequestStatus.FINISHED,
-                                                                      RequestStatus.CANCELLED),
-                redirect_executor=request.status not in (RequestStatus.FINISHED,
-                                                         RequestStatus.CANCELLED),
-                redirect_org=request.status not in (RequestStatus.FINISHED,
-                                                    RequestStatus.CANCELLED),
-                deadline=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                planning=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                ready=request.status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED),
-                confirm_management_department=request.status == RequestStatus.COMPLETED,
-                confirm_management=request.status == RequestStatus.ENDING_COMPLETED
-            )
+            attachments_count=attachments_count,
+            history=history,
+            history_count=history_count,
+            history_next_cursor=history_next_cursor,
+            rights=RIGHTS_BY_REQUEST_STATUS[request.status]
         )
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view detail request: {e}")
+        config.logger.error("Database error view detail request: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error view detail request: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# История заявки страницами по курсору
+@connection
+async def sql_get_request_history(
+    session: AsyncSession,
+    registration_number: str,
+    limit: int,
+    cursor: Optional[int] = None
+) -> RequestHistoryPageResponse:
+    try:
+        history, next_cursor = await select_history_page(
+            session=session,
+            request_id=request_id_by_number(registration_number),
+            limit=limit,
+            cursor=cursor
+        )
+
+        if not history and cursor is None:
+            await ensure_request_exists(session, registration_number)
+
+        return RequestHistoryPageResponse(history=history, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error view request history: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error view request history: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Вложения заявки страницами по курсору (в порядке добавления)
+@connection
+async def sql_get_request_attachments(
+    session: AsyncSession,
+    registration_number: str,
+    limit: int,
+    cursor: Optional[int] = None
+) -> AttachmentsPageResponse:
+    try:
+        query = (
+            sa.select(RequestDocument)
+            .where(RequestDocument.request_id == request_id_by_number(registration_number))
+            .order_by(RequestDocument.id)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            query = query.where(RequestDocument.id > cursor)
+
+        rows = (await session.execute(query)).scalars().all()
+        if not rows and cursor is None:
+            await ensure_request_exists(session, registration_number)
+
+        return AttachmentsPageResponse(
+            attachments=[get_attachment_response(attachment) for attachment in rows[:limit]],
+            next_cursor=rows[limit - 1].id if len(rows) > limit else None
+        )
+
+    except HTTPException:
+        raise
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error view request attachments: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view detail request: {e}")
+        config.logger.error("Unexpected error view request attachments: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -796,15 +911,15 @@ async def sql_get_request_data(
         )
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view data request: {e}")
+        config.logger.error("Database error view data request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view data request: {e}")
+        config.logger.error("Unexpected error view data request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1049,14 +1164,15 @@ async def sql_edit_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error edit data request: {e}")
+        config.logger.error("Database error edit data request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
@@ -1065,7 +1181,7 @@ async def sql_edit_request(
     except Exception as e:
         import traceback
         traceback.print_exc()
-        config.logger.error(f"Unexpected error edit data request: {e}")
+        config.logger.error("Unexpected error edit data request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1101,18 +1217,20 @@ async def sql_approve_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.CONFIRMED)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error approve request: {e}")
+        config.logger.error("Database error approve request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error approve request: {e}")
+        config.logger.error("Unexpected error approve request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1145,6 +1263,7 @@ async def sql_reject_request(
         if request.status in (RequestStatus.COMPLETED, RequestStatus.CANCELLED):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
+        previous_audience = get_request_audience(request)
         request.status = RequestStatus.CANCELLED
 
         comment = f"Причина: {comment}" if comment else ''
@@ -1156,21 +1275,23 @@ async def sql_reject_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.CANCELLED, previous_audience=previous_audience)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reject request: {e}")
+        config.logger.error("Database error reject request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reject request: {e}")
+        config.logger.error("Unexpected error reject request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1210,6 +1331,7 @@ async def sql_redirect_executor_request(
             executor.management_department_id != user.management_department_profile.id):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
+        previous_audience = get_request_audience(request)
         exists_executor_flag = next((True for obj in request.item_associations if obj.executor_id is not None), False)
         if exists_executor_flag:
             request_item = next((obj for obj in request.item_associations if obj.item_id == data.item_id), None)
@@ -1223,6 +1345,8 @@ async def sql_redirect_executor_request(
             request_item.executor_id = data.user_role_id
             request_item.description_executor = data.description
             request_item.deadline_executor = data.deadline
+            request_item.is_overdue = get_overdue_after_deadline_change("deadline_executor", data.deadline)
+            request_item.is_reminded = False
 
             description = (f"Заявка отправлена на выполнение\nИсполнитель: {executor.user.full_name}\n"
                            f"Срок: {data.deadline.strftime("%d.%m.%Y")}")
@@ -1232,6 +1356,8 @@ async def sql_redirect_executor_request(
                 obj.executor_id = data.user_role_id
                 obj.description_executor = data.description
                 obj.deadline_executor = data.deadline
+                obj.is_overdue = get_overdue_after_deadline_change("deadline_executor", data.deadline)
+                obj.is_reminded = False
 
             description = (f"Заявки отправлены на выполнение\nИсполнитель для всех заявок: {executor.user.full_name}\n"
                            f"Срок: {data.deadline.strftime("%d.%m.%Y")}")
@@ -1244,21 +1370,24 @@ async def sql_redirect_executor_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.APPOINTED, previous_audience=previous_audience,
+                                    item_id=data.item_id)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error redirect executor request: {e}")
+        config.logger.error("Database error redirect executor request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error redirect executor request: {e}")
+        config.logger.error("Unexpected error redirect executor request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1303,9 +1432,12 @@ async def sql_redirect_organization_request(
                 (user.role == UserRole.EXECUTOR and user.executor_profile.id != request_item.executor_id):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
+        previous_audience = get_request_audience(request)
         request_item.executor_organization_id = data.user_role_id
         request_item.description_organization = data.description
         request_item.deadline_organization = data.deadline
+        request_item.is_overdue = get_overdue_after_deadline_change("deadline_organization", data.deadline)
+        request_item.is_reminded = False
 
         new_history = RequestHistory(
             action=RequestAction.APPOINTED,
@@ -1316,21 +1448,24 @@ async def sql_redirect_organization_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.APPOINTED, previous_audience=previous_audience,
+                                    item_id=data.item_id)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error redirect executor request: {e}")
+        config.logger.error("Database error redirect executor request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error redirect executor request: {e}")
+        config.logger.error("Unexpected error redirect executor request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1366,6 +1501,7 @@ async def sql_redirect_management_request(
         if request.status in (RequestStatus.REGISTERED, RequestStatus.CANCELLED):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
+        previous_audience = get_request_audience(request)
         request.status = RequestStatus.IN_PROGRESS
         request.management_id = management_id
         request.management_department_id = data.user_role_id
@@ -1380,21 +1516,23 @@ async def sql_redirect_management_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.IN_PROGRESS, previous_audience=previous_audience)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error redirect management request: {e}")
+        config.logger.error("Database error redirect management request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error redirect management request: {e}")
+        config.logger.error("Unexpected error redirect management request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1458,21 +1596,23 @@ async def sql_execute_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.COMPLETED, item_id=item_id)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error execute request: {e}")
+        config.logger.error("Database error execute request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error execute request: {e}")
+        config.logger.error("Unexpected error execute request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1507,6 +1647,10 @@ async def sql_planning_request(
 
         request.item_associations[association_num].status = RequestItemStatus.PLANNED
         request.item_associations[association_num].deadline_planning = data.deadline
+        request.item_associations[association_num].is_overdue = get_overdue_after_deadline_change(
+            "deadline_planning", data.deadline
+        )
+        request.item_associations[association_num].is_reminded = False
         
         sum_items_completed_and_planned = sum(
             1 for item in request.item_associations
@@ -1527,21 +1671,23 @@ async def sql_planning_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, RequestAction.PLANNED, item_id=data.item_id)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error planning request: {e}")
+        config.logger.error("Database error planning request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error planning request: {e}")
+        config.logger.error("Unexpected error planning request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1583,21 +1729,23 @@ async def sql_finish_request(
         )
         session.add(new_history)
 
+        await refresh_request_list_view(session, Request.id == request.id)
         await session.commit()
+        await publish_request_event(request, action)
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error finish request: {e}")
+        config.logger.error("Database error finish request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error finish request: {e}")
+        config.logger.error("Unexpected error finish request: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1646,18 +1794,18 @@ async def sql_delete_attachment(
         await session.commit()
 
     except NoResultFound:
-        config.logger.info(f"Request not found by registration_number: {registration_number}")
+        config.logger.info("Request not found by registration_number: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error delete file: {e}")
+        config.logger.error("Database error delete file: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error delete file: {e}")
+        config.logger.error("Unexpected error delete file: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1672,19 +1820,15 @@ async def sql_get_requests_for_download(
         date_filter_until: Optional[datetime] = None
 ) -> List[Dict[str, Any]]:
     try:
-        query = (
-            sa.select(Request)
-            .options(
-                so.selectinload(Request.item_associations).joinedload(RequestItem.item)
-            )
-        )
+        # Предметы уже собраны в строку в проекции: выгрузка не загружает связи заявок
+        query = sa.select(RequestListView).order_by(RequestListView.created_at)
 
         status_filter = next(
             (status_["name"].lower() for status_ in STATUS_ID_MAPPING if status_["id"] == status_filter_id),
             None
         )
         if STATUS_MAPPING.get(status_filter):
-            query = query.where(Request.status == STATUS_MAPPING[status_filter])
+            query = query.where(RequestListView.status == STATUS_MAPPING[status_filter])
 
         else:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Status not found")
@@ -1695,26 +1839,25 @@ async def sql_get_requests_for_download(
                 None
             )
             if TYPE_MAPPING.get(type_filter):
-                query = query.where(Request.request_type == TYPE_MAPPING[type_filter])
+                query = query.where(RequestListView.request_type == TYPE_MAPPING[type_filter])
 
         if isinstance(department_filter_id, int):
-            query = query.where(Request.department_id == department_filter_id)
+            query = query.where(RequestListView.department_id == department_filter_id)
 
         if date_filter_from:
-            query = query.where(Request.created_at >= date_filter_from)
+            query = query.where(RequestListView.created_at >= date_filter_from)
 
         if date_filter_until:
-            query = query.where(Request.created_at <= date_filter_until)
+            query = query.where(RequestListView.created_at <= date_filter_until)
 
         requests_result = await session.execute(query)
         requests = requests_result.scalars()
 
         return [
             {
-                "Индентификатор": request.id,
+                "Индентификатор": request.request_id,
                 "Номер": request.registration_number,
-                "Предметы": "\n".join(f"{association.item.name} ({association.count}шт.)" \
-                                      for association in request.item_associations),
+                "Предметы": request.items_text,
                 "Тип": request.request_type.value,
                 "Статус": request.status.value,
                 "Аварийность": "Да" if request.is_emergency else "Нет",
@@ -1724,14 +1867,14 @@ async def sql_get_requests_for_download(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view requests for download: {e}")
+        config.logger.error("Database error view requests for download: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view requests for download: {e}")
+        config.logger.error("Unexpected error view requests for download: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1769,11 +1912,11 @@ async def sql_get_planning_for_download(
         ]
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view planning for download: {e}")
+        config.logger.error("Database error view planning for download: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view planning for download: {e}")
+        config.logger.error("Unexpected error view planning for download: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1786,58 +1929,56 @@ async def sql_get_count_requests_by_user(
     session: AsyncSession
 ) -> List[Dict[str, Any]]:
     try:
+        status_mapping, status_mapping_id = get_status_filter_for_user(user)
+
         if user.role in (UserRole.EXECUTOR, UserRole.EXECUTOR_ORGANIZATION):
+            source = Request
             query = sa.select(
                 RequestItem.status,
                 sa.func.count(RequestItem.status).label('count')
             ).join(
                 Request, RequestItem.request_id == Request.id
+            ).where(
+                Request.archived_at.is_(None)
             ).group_by(RequestItem.status)
 
-            status_mapping = tuple(REQUEST_ITEM_STATUS_MAPPING.values())
-            status_mapping_id = REQUEST_ITEM_STATUS_ID_MAPPING
-
             if user.is_executor:
                 query = query.where(RequestItem.executor_id == user.executor_profile.id)
 
             else:
                 query = query.where(RequestItem.executor_organization_id == user.executor_organization_profile.id)
+
         else:
+            # Счетчики по заявкам считаются по проекции списков теми же индексами, что и сами списки
+            source = RequestListView
             query = sa.select(
-                Request.status,
-                sa.func.count(Request.status).label('count')
-            ).group_by(Request.status)
+                RequestListView.status,
+                sa.func.count(RequestListView.status).label('count')
+            ).where(
+                RequestListView.archived_at.is_(None)
+            ).group_by(RequestListView.status)
 
             if user.is_secretary:
-                status_mapping = tuple(STATUS_MAPPING.values())
-                status_mapping_id = STATUS_ID_MAPPING
-                query = query.where(Request.secretary_id == user.secretary_profile.id)
+                query = query.where(RequestListView.secretary_id == user.secretary_profile.id)
 
             elif user.is_judge:
-                status_mapping = tuple(STATUS_MAPPING.values())
-                status_mapping_id = STATUS_ID_MAPPING
-                query = query.where(Request.judge_id == user.judge_profile.id)
+                query = query.where(RequestListView.judge_id == user.judge_profile.id)
 
             elif user.is_management:
-                status_mapping = tuple(STATUS_MAPPING.values())[1:]
-                status_mapping_id = STATUS_ID_MAPPING[1:]
                 query = query.where(
                     sa.or_(
-                        Request.status == RequestStatus.CONFIRMED,
-                        Request.management_id == user.management_profile.id
+                        RequestListView.status == RequestStatus.CONFIRMED,
+                        RequestListView.management_id == user.management_profile.id
                     )
                 )
 
             elif user.is_management_department:
-                status_mapping = tuple(STATUS_MAPPING.values())[2:]
-                status_mapping_id = STATUS_ID_MAPPING[2:]
-                query = query.where(Request.management_department_id == user.management_department_profile.id)
-
-            else:
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+                query = query.where(
+                    RequestListView.management_department_id == user.management_department_profile.id
+                )
 
         if current_department is not None:
-            query = query.where(Request.department_id == current_department)
+            query = query.where(source.department_id == current_department)
 
         if current_type is not None:
             type_name = next(
@@ -1845,7 +1986,7 @@ async def sql_get_count_requests_by_user(
                 None
             )
             if type_name is not None:
-                query = query.where(Request.request_type == TYPE_MAPPING[type_name])
+                query = query.where(source.request_type == TYPE_MAPPING[type_name])
 
         requests_status_result = await session.execute(query)
         requests_status = requests_status_result.all()
@@ -1862,14 +2003,14 @@ async def sql_get_count_requests_by_user(
         return result
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view count requests: {e}")
+        config.logger.error("Database error view count requests: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view count requests: {e}")
+        config.logger.error("Unexpected error view count requests: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1886,7 +2027,7 @@ async def sql_get_count_planning_requests_by_user(
                 sa.func.count(Request.department_id).label('count')
             )
             .join(RequestItem, Request.id == RequestItem.request_id)
-            .where(RequestItem.status == RequestItemStatus.PLANNED)
+            .where(RequestItem.status == RequestItemStatus.PLANNED, Request.archived_at.is_(None))
             .group_by(Request.department_id)
         )
 
@@ -1909,7 +2050,7 @@ async def sql_get_count_planning_requests_by_user(
         planning_department = planning_department_result.all()
         planning_count = defaultdict(int, {dept_id: count for dept_id, count in planning_department})
 
-        department = await sql_get_all_department(session=session, no_decor=True)
+        department = await reference_cache.get_data(REFERENCE_DEPARTMENTS, sql_get_all_department)
 
         result = []
 
@@ -1922,14 +2063,14 @@ async def sql_get_count_planning_requests_by_user(
         return result
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error view count planning: {e}")
+        config.logger.error("Database error view count planning: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error view count planning: {e}")
+        config.logger.error("Unexpected error view count planning: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -1951,14 +2092,14 @@ async def sql_check_request_for_sign_by_judge(
         return request_result.scalar()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error check request by judge: {e}")
+        config.logger.error("Database error check request by judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error check request by judge: {e}")
+        config.logger.error("Unexpected error check request by judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -2004,16 +2145,16 @@ async def sql_get_data_request_for_sign_by_judge(
         )
 
     except NoResultFound:
-        config.logger.info(f"Request not found for sign by judge: {registration_number}")
+        config.logger.info("Request not found for sign by judge: %s", registration_number)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error for sign by judge: {e}")
+        config.logger.error("Database error for sign by judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except HTTPException:
         raise
 
     except Exception as e:
-        config.logger.error(f"Unexpected error for sign by judge: {e}")
+        config.logger.error("Unexpected error for sign by judge: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
\ No newline at end of file
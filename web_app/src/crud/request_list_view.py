@@ -0,0 +1,142 @@
+# Внешние зависимости
+from typing import Optional, List
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import (Request, RequestListView, RequestStatus, UserRole, request_item, Item,
+                                ITEM_DEADLINE)
+from web_app.src.core import connection
+
+
+# Колонки проекции, которые переписываются при каждом обновлении строки
+VIEW_COLUMNS = (
+    "request_id", "registration_number", "human_registration_number", "request_type", "status",
+    "is_emergency", "department_id", "secretary_id", "judge_id", "management_id",
+    "management_department_id", "items_text", "next_deadline", "is_overdue", "created_at", "archived_at"
+)
+
+
+# Строки проекции для заявок, подходящих под условие: предметы и сроки агрегируются по каждой заявке
+def select_request_list_rows(condition: sa.ColumnElement) -> sa.Select:
+    items = (
+        sa.select(
+            sa.func.coalesce(
+                sa.func.string_agg(
+                    Item.name + " (" + sa.cast(request_item.c.count, sa.String) + "шт.)",
+                    postgresql.aggregate_order_by(sa.literal("\n"), request_item.c.item_id)
+                ),
+                ""
+            ).label("items_text"),
+            sa.func.min(ITEM_DEADLINE).label("next_deadline"),
+            sa.func.coalesce(sa.func.bool_or(request_item.c.is_overdue), False).label("is_overdue")
+        )
+        .select_from(request_item.join(Item, Item.id == request_item.c.item_id))
+        .where(request_item.c.request_id == Request.id)
+        .lateral("request_items")
+    )
+
+    return (
+        sa.select(
+            Request.id, Request.registration_number, Request.human_registration_number, Request.request_type,
+            Request.status, Request.is_emergency, Request.department_id, Request.secretary_id, Request.judge_id,
+            Request.management_id, Request.management_department_id, items.c.items_text, items.c.next_deadline,
+            items.c.is_overdue, Request.created_at, Request.archived_at
+        )
+        .select_from(Request)
+        .join(items, sa.true())
+        .where(condition)
+    )
+
+
+# Запрос пересборки строк проекции для заявок, подходящих под условие
+def get_request_list_view_upsert(condition: sa.ColumnElement) -> sa.Insert:
+    stmt = postgresql.insert(RequestListView).from_select(VIEW_COLUMNS, select_request_list_rows(condition))
+    return stmt.on_conflict_do_update(
+        index_elements=[RequestListView.request_id],
+        set_={column: stmt.excluded[column] for column in VIEW_COLUMNS if column != "request_id"}
+    )
+
+
+# Обновление проекции в текущей транзакции: вызывается перед commit в каждом изменении заявки
+async def refresh_request_list_view(session: AsyncSession, condition: sa.ColumnElement) -> None:
+    # Изменения ORM должны попасть в БД до пересборки строк проекции
+    await session.flush()
+
+    await session.execute(get_request_list_view_upsert(condition))
+
+
+# Признак просрочки строки списка для роли: для управления - просрочен хотя бы один предмет
+def get_overdue_expression(role: UserRole) -> sa.ColumnElement:
+    if role not in (UserRole.MANAGEMENT, UserRole.MANAGEMENT_DEPARTMENT):
+        return sa.false()
+
+    return sa.and_(
+        RequestListView.status != RequestStatus.FINISHED,
+        RequestListView.is_overdue
+    )
+
+
+# Условие на заявки, в которых есть предметы
+def get_requests_with_items_condition(item_ids: sa.ColumnElement) -> sa.ColumnElement:
+    return Request.id.in_(
+        sa.select(request_item.c.request_id).where(request_item.c.item_id.in_(item_ids))
+    )
+
+
+# Заявки с предметом: запоминаются до удаления предмета, пока связи еще не удалены каскадом
+@connection
+async def sql_get_request_ids_by_item(
+    item_id: int,
+    session: AsyncSession
+) -> List[int]:
+    try:
+        request_ids_result = await session.execute(
+            sa.select(request_item.c.request_id).where(request_item.c.item_id == item_id).distinct()
+        )
+
+        return list(request_ids_result.scalars())
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error get request ids by item: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error get request ids by item: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
+
+
+# Пересобираем проекцию для заявок с предметом (после переименования в админке), для указанных заявок
+# или целиком
+@connection
+async def sql_refresh_request_list_view(
+    session: AsyncSession,
+    item_id: Optional[int] = None,
+    request_ids: Optional[List[int]] = None
+) -> None:
+    try:
+        if item_id is not None:
+            condition = get_requests_with_items_condition([item_id])
+
+        elif request_ids is not None:
+            if not request_ids:
+                return
+
+            condition = Request.id.in_(request_ids)
+
+        else:
+            condition = sa.true()
+
+        await refresh_request_list_view(session, condition)
+        await session.commit()
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error refresh request list view: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
+
+    except Exception as e:
+        config.logger.error("Unexpected error refresh request list view: %s", e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
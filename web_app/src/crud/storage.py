@@ -0,0 +1,50 @@
+# Внешние зависимости
+from typing import List, Set
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import Request, RequestDocument
+from web_app.src.core import connection
+
+
+# Отбираем пути вложений, которые есть в базе данных
+@connection
+async def sql_filter_existing_document_paths(
+    file_paths: List[str],
+    session: AsyncSession
+) -> Set[str]:
+    try:
+        documents_result = await session.execute(
+            sa.select(RequestDocument.file_path)
+            .where(RequestDocument.file_path.in_(file_paths))
+        )
+
+        return set(documents_result.scalars())
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error filter existing document paths: %s", e)
+        raise
+
+
+# Отбираем ссылки на pdf файлы заявок, которые есть в базе данных
+@connection
+async def sql_filter_existing_pdf_urls(
+    file_urls: List[str],
+    signed: bool,
+    session: AsyncSession
+) -> Set[str]:
+    try:
+        column = Request.pdf_signed_request_url if signed else Request.pdf_request_url
+
+        requests_result = await session.execute(
+            sa.select(column)
+            .where(column.in_(file_urls))
+        )
+
+        return set(requests_result.scalars())
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error filter existing pdf urls: %s", e)
+        raise
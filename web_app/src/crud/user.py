@@ -1,6 +1,7 @@
 # Внешние зависимости
-from typing import Optional, Tuple, Sequence
+from typing import Optional, Tuple, Sequence, List, Dict, Any
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
 import sqlalchemy.orm as so
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, NoResultFound
@@ -10,7 +11,7 @@ from web_app.src.core import config
 from web_app.src.models import User, UserRole, Secretary, Judge, Department
 from web_app.src.core import connection
 from web_app.src.schemas import UserInfoResponse, CreateSecretaryRequest
-from web_app.src.utils.work_with_password import get_password_hash
+from web_app.src.utils.work_with_password import get_password_hash_async
 
 
 # Проверяем, существует ли пользователь с таким именем
@@ -25,11 +26,11 @@ async def sql_chek_existing_user_by_name(username: str, session: AsyncSession) -
         return user_result.scalar_one_or_none()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by username {username}: {e}")
+        config.logger.error("Database error reading user by username %s: %s", username, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by username {username}: {e}")
+        config.logger.error("Unexpected error reading user by username %s: %s", username, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -45,11 +46,11 @@ async def sql_chek_existing_user_by_email(email: str, session: AsyncSession) ->
         return user_result.scalar_one_or_none()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by email {email}: {e}")
+        config.logger.error("Database error reading user by email %s: %s", email, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by email {email}: {e}")
+        config.logger.error("Unexpected error reading user by email %s: %s", email, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -78,15 +79,15 @@ async def sql_chek_update_role_by_user_id(
         return False
 
     except NoResultFound:
-        config.logger.info(f"User not found by ID: {user_id}")
+        config.logger.info("User not found by ID: %s", user_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by user_id {user_id}: {e}")
+        config.logger.error("Database error reading user by user_id %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by user_id {user_id}: {e}")
+        config.logger.error("Unexpected error reading user by user_id %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -109,15 +110,15 @@ async def sql_update_role_by_user_id(
         await session.commit()
 
     except NoResultFound:
-        config.logger.info(f"User not found by ID: {user_id}")
+        config.logger.info("User not found by ID: %s", user_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error update role by user_id {user_id}: {e}")
+        config.logger.error("Database error update role by user_id %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error update role by user_id {user_id}: {e}")
+        config.logger.error("Unexpected error update role by user_id %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -149,15 +150,15 @@ async def sql_get_user_by_id(
         return user
 
     except NoResultFound:
-        config.logger.info(f"User not found by ID: {user_id}")
+        config.logger.info("User not found by ID: %s", user_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by ID {user_id}: {e}")
+        config.logger.error("Database error reading user by ID %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by ID {user_id}: {e}")
+        config.logger.error("Unexpected error reading user by ID %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -173,15 +174,15 @@ async def sql_get_user_by_username(
         return user
 
     except NoResultFound:
-        config.logger.info(f"User not found by username: {username}")
+        config.logger.info("User not found by username: %s", username)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by username {username}: {e}")
+        config.logger.error("Database error reading user by username %s: %s", username, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by username {username}: {e}")
+        config.logger.error("Unexpected error reading user by username %s: %s", username, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -206,15 +207,15 @@ async def sql_get_info_user_by_id(
         )
 
     except NoResultFound:
-        config.logger.info(f"User not found by ID: {user_id}")
+        config.logger.info("User not found by ID: %s", user_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error reading user by ID {user_id}: {e}")
+        config.logger.error("Database error reading user by ID %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error reading user by ID {user_id}: {e}")
+        config.logger.error("Unexpected error reading user by ID %s: %s", user_id, e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -233,11 +234,11 @@ async def sql_get_users_without_role(
         return users
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error found user by without role: {e}")
+        config.logger.error("Database error found user by without role: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error found user by without role: {e}")
+        config.logger.error("Unexpected error found user by without role: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -261,11 +262,11 @@ async def sql_get_user_by_email(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error found user by without role: {e}")
+        config.logger.error("Database error found user by without role: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error found user by without role: {e}")
+        config.logger.error("Unexpected error found user by without role: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -276,6 +277,9 @@ async def sql_update_password_user_by_id(
     password: str,
     session: AsyncSession
 ) -> str:
+    # Хешируем до обращения к базе, чтобы не держать соединение во время вычисления
+    password_hash = await get_password_hash_async(password)
+
     try:
         user_result = await session.execute(
             sa.select(User)
@@ -283,7 +287,7 @@ async def sql_update_password_user_by_id(
         )
         user = user_result.scalar_one()
 
-        user.password_hash = get_password_hash(password)
+        user.password_hash = password_hash
         await session.commit()
 
         return user.username
@@ -293,11 +297,11 @@ async def sql_update_password_user_by_id(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error update password user: {e}")
+        config.logger.error("Database error update password user: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error update password user: {e}")
+        config.logger.error("Unexpected error update password user: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -316,11 +320,11 @@ async def sql_check_exists_username(
         return exists_result.scalar()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error update password user: {e}")
+        config.logger.error("Database error update password user: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error update password user: {e}")
+        config.logger.error("Unexpected error update password user: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -359,15 +363,15 @@ async def sql_add_user_secretary(
         await session.commit()
 
     except NoResultFound:
-        config.logger.info(f"Judge not found by ID: {data.judge_id}")
+        config.logger.info("Judge not found by ID: %s", data.judge_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Judge not found")
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error add user_secretary: {e}")
+        config.logger.error("Database error add user_secretary: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error")
 
     except Exception as e:
-        config.logger.error(f"Unexpected error add user_secretary: {e}")
+        config.logger.error("Unexpected error add user_secretary: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unexpected server error")
 
 
@@ -404,13 +408,13 @@ async def sql_add_user_judge(
         await session.commit()
 
     except NoResultFound:
-        config.logger.info(f"Department not found by code: {department_code}")
+        config.logger.info("Department not found by code: %s", department_code)
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error add user_judge: {e}")
+        config.logger.error("Database error add user_judge: %s", e)
 
     except Exception as e:
-        config.logger.error(f"Unexpected error add user_judge: {e}")
+        config.logger.error("Unexpected error add user_judge: %s", e)
 
 
 # Добавляем нового пользователя
@@ -431,7 +435,76 @@ async def sql_add_user(
         await session.commit()
 
     except SQLAlchemyError as e:
-        config.logger.error(f"Database error add user: {e}")
+        config.logger.error("Database error add user: %s", e)
 
     except Exception as e:
-        config.logger.error(f"Unexpected error add user: {e}")
+        config.logger.error("Unexpected error add user: %s", e)
+
+
+# Добавляем пользователей пачкой, судьям создаем профиль по коду участка
+@connection
+async def sql_bulk_add_users(
+    users: List[dict],
+    session: AsyncSession
+) -> Dict[str, Any]:
+    try:
+        department_codes = {user["department_code"] for user in users if user.get("department_code") is not None}
+        department_ids = {}
+        if department_codes:
+            departments_result = await session.execute(
+                sa.select(Department.code, Department.id)
+                .where(Department.code.in_(department_codes))
+            )
+            department_ids = dict(departments_result.all())
+
+        valid_users = []
+        for user in users:
+            department_code = user.get("department_code")
+            if department_code is not None and department_code not in department_ids:
+                config.logger.info("Department not found by code: %s", department_code)
+                continue
+
+            valid_users.append(user)
+
+        if not valid_users:
+            return {"created": [], "skipped": len(users)}
+
+        users_result = await session.execute(
+            insert(User)
+            .values([
+                {
+                    "username": user["username"],
+                    "email": user["email"],
+                    "full_name": user["full_name"],
+                    "password_hash": user["password_hash"],
+                    "role": UserRole.JUDGE if user.get("department_code") is not None else None
+                }
+                for user in valid_users
+            ])
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User.id, User.username)
+        )
+        created_ids = dict((username, user_id) for user_id, username in users_result.all())
+
+        judges = [
+            {
+                "user_id": created_ids[user["username"]],
+                "department_id": department_ids[user["department_code"]]
+            }
+            for user in valid_users
+            if user["username"] in created_ids and user.get("department_code") is not None
+        ]
+        if judges:
+            await session.execute(
+                insert(Judge)
+                .values(judges)
+                .on_conflict_do_nothing(index_elements=[Judge.user_id])
+            )
+
+        await session.commit()
+
+        return {"created": list(created_ids.keys()), "skipped": len(users) - len(created_ids)}
+
+    except SQLAlchemyError as e:
+        config.logger.error("Database error bulk add users: %s", e)
+        raise
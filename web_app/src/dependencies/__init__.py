@@ -1,2 +1,2 @@
 from web_app.src.dependencies.depends import (get_current_user, authenticate_user, create_access_token,
-                                              get_current_user_with_role)
\ No newline at end of file
+                                              get_current_user_with_role, get_client_ip)
\ No newline at end of file
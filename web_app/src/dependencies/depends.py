@@ -2,12 +2,13 @@
 from typing import Optional, Tuple
 from datetime import datetime, timedelta, UTC
 from jose import JWTError, jwt
-from fastapi import HTTPException, status, Cookie
+from fastapi import HTTPException, status, Cookie, Request
 # Внутренние модули
 from web_app.src.core import config
+from web_app.src.core.context import user_id_var
 from web_app.src.models import UserRole, User
 from web_app.src.crud import sql_get_user_by_id, sql_get_user_by_username
-from web_app.src.utils import verify_password
+from web_app.src.utils import verify_password_async
 from web_app.src.utils import token_service
 
 
@@ -15,11 +16,20 @@ async def authenticate_user(username: str, password: str):
     user = await sql_get_user_by_username(username=username)
     if not user:
         return False
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         return False
     return user
 
 
+def get_client_ip(request: Request) -> str:
+    """IP клиента с учетом заголовка, который выставляет nginx"""
+    real_ip = request.headers.get("X-Real-IP")
+    if real_ip:
+        return real_ip
+
+    return request.client.host if request.client else "unknown"
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -58,6 +68,7 @@ async def get_current_user(
 
         # Преобразуем в int для базы данных
         user_id = int(user_id_str)
+        user_id_var.set(user_id)
 
     except JWTError:
         raise credentials_exception
@@ -100,6 +111,7 @@ def get_current_user_with_role(roles: Optional[Tuple[UserRole]] = None):
                 raise credentials_exception
 
             user_id = int(user_id_str)
+            user_id_var.set(user_id)
 
         except JWTError:
             raise credentials_exception
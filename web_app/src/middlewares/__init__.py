@@ -1 +1,4 @@
-from web_app.src.middlewares.authentication import AuthenticationMiddleware
\ No newline at end of file
+from web_app.src.middlewares.authentication import AuthenticationMiddleware
+from web_app.src.middlewares.query_stats import QueryBudgetMiddleware, QueryBudgetExceeded, query_budget
+from web_app.src.middlewares.request_context import RequestContextMiddleware
+from web_app.src.middlewares.compression import CompressionMiddleware
\ No newline at end of file
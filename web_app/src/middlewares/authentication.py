@@ -58,5 +58,5 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             raise exc
 
         except Exception as exc:
-            config.logger.error(f"Unexpected error: {exc}")
+            config.logger.error("Unexpected error: %s", exc)
             raise exc
\ No newline at end of file
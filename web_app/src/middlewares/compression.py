@@ -0,0 +1,177 @@
+# Внешние зависимости
+from typing import Optional, Tuple, Iterable
+import zlib
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+
+# Уже сжатые форматы и потоковые ответы, которые сжимать бессмысленно или вредно
+DEFAULT_EXCLUDED_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument",
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+)
+
+
+# Выбор кодировки по заголовку Accept-Encoding с учетом q-значений (br предпочтительнее gzip)
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        weights[name.strip()] = quality
+
+    for encoding in ("br", "gzip"):
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > 0:
+            return encoding
+
+    return None
+
+
+# Vary: Accept-Encoding без повтора, если заголовок уже выставил эндпоинт
+def add_vary_accept_encoding(headers: MutableHeaders):
+    vary = {value.strip().lower() for value in headers.get("vary", "").split(",")}
+    if "accept-encoding" not in vary and "*" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+# Сжатое тело отличается от исходного побайтно: сильный ETag становится слабым (как делает nginx)
+def weaken_etag(headers: MutableHeaders):
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _Compressor:
+    """Потоковый компрессор: каждый кусок тела сжимается и сбрасывается сразу, без буферизации ответа"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self.compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self.compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self.compressor.process(data) + self.compressor.flush()
+
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self.compressor.process(data) + self.compressor.finish()
+
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    Сжатие ответов Brotli или gzip по Accept-Encoding клиента.
+    Ответы меньше minimum_size и исключенные типы (PDF, видео, xlsx, SSE) передаются без изменений.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 4,
+            excluded_types: Iterable[str] = DEFAULT_EXCLUDED_TYPES
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_types: Tuple[str, ...] = tuple(excluded_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if not self.is_compressible(message["status"], headers):
+                    passthrough = True
+                    await send(message)
+                    return
+
+                # Заголовки отправляются вместе с первым куском тела, когда известен его размер
+                start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(scope=start_message)
+
+            if compressor is None:
+                # Маленький ответ целиком: сжатие не окупается
+                if not more_body and len(body) < self.minimum_size:
+                    add_vary_accept_encoding(headers)
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers["Content-Encoding"] = encoding
+                add_vary_accept_encoding(headers)
+                weaken_etag(headers)
+
+                if more_body:
+                    # Потоковый ответ: итоговая длина неизвестна
+                    del headers["Content-Length"]
+                    body = compressor.compress(body)
+                else:
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            body = compressor.compress(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def is_compressible(self, status_code: int, headers: Headers) -> bool:
+        if status_code < 200 or status_code in (204, 304) or "content-encoding" in headers:
+            return False
+
+        content_type = headers.get("content-type", "").lower()
+        if not content_type:
+            return False
+
+        return not content_type.startswith(self.excluded_types)
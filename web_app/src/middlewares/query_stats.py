@@ -0,0 +1,120 @@
+# Внешние зависимости
+from typing import Optional, List, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.orm import Session, ORMExecuteState
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+# Внутренние модули
+from web_app.src.core import config, engine
+
+
+class QueryBudgetExceeded(Exception):
+    """Эндпоинт выполнил больше SQL запросов, чем заявлено, или вызвал ленивую загрузку"""
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    lazy_loads: List[str] = field(default_factory=list)
+
+
+# Статистика запросов текущего HTTP запроса
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_budget_stats", default=None)
+
+
+# Декоратор для объявления допустимого количества SQL запросов эндпоинта (с учетом зависимостей)
+def query_budget(max_queries: int) -> Callable:
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+
+    return decorator
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+
+
+def _detect_lazy_load(orm_execute_state: ORMExecuteState):
+    # lazy_loaded_from есть только у SELECT: для INSERT/UPDATE/DELETE свойство выбрасывает исключение
+    if not orm_execute_state.is_select:
+        return
+
+    stats = _request_stats.get()
+    if stats is None or orm_execute_state.lazy_loaded_from is None:
+        return
+
+    # Ленивая загрузка связи, которой не было в опциях eager-загрузки запроса
+    path = orm_execute_state.loader_strategy_path.path
+    stats.lazy_loads.append(f"{path[-2].class_.__name__}.{path[-1].key}")
+
+
+_listeners_installed = False
+
+
+def _install_listeners():
+    global _listeners_installed
+    if _listeners_installed:
+        return
+
+    event.listen(engine.sync_engine, "after_cursor_execute", _count_statement)
+    event.listen(Session, "do_orm_execute", _detect_lazy_load)
+    _listeners_installed = True
+
+
+class QueryBudgetMiddleware:
+    """
+    Подсчет SQL запросов и ленивых загрузок на каждый HTTP запрос.
+    Режим warn пишет предупреждение в лог, режим strict выбрасывает QueryBudgetExceeded (для тестов).
+    """
+
+    def __init__(self, app: ASGIApp, mode: str = "warn"):
+        self.app = app
+        self.strict = mode == "strict"
+        _install_listeners()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        stats_token = _request_stats.set(stats)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Query-Count", str(stats.statements))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(stats_token)
+
+        self.check(scope, stats)
+
+    def check(self, scope: Scope, stats: QueryStats):
+        endpoint = scope.get("endpoint")
+        budget = getattr(endpoint, "__query_budget__", None)
+        route = f"{scope['method']} {scope['path']}"
+        problems = []
+
+        if budget is not None and stats.statements > budget:
+            problems.append(f"{stats.statements} SQL statements, budget {budget}")
+
+        if stats.lazy_loads:
+            problems.append(f"lazy loads: {', '.join(stats.lazy_loads)}")
+
+        if not problems:
+            return
+
+        message = f"Query budget violated for {route}: {'; '.join(problems)}"
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+
+        config.logger.warning(message)
@@ -0,0 +1,62 @@
+# Внешние зависимости
+import re
+import uuid
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+# Внутренние модули
+from web_app.src.core import span
+from web_app.src.core.context import request_id_var, route_var
+
+
+REQUEST_ID_PATTERN = re.compile(r"^[\w\-.:]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """
+    Присваивает HTTP запросу идентификатор (входящий X-Request-ID или новый) и возвращает его в ответе.
+    Идентификатор и маршрут попадают в каждую запись JSON лога, выполненную в рамках запроса.
+    Все span запроса (БД, Redis, PDF, файлы, SMTP) собираются в одну трассу с этим идентификатором.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+
+        if not request_id or not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        request_id_token = request_id_var.set(request_id)
+        route_token = route_var.set(f"{scope['method']} {scope['path']}")
+
+        with span(f"HTTP {scope['method']}", kind="server", **{
+            "http.method": scope["method"], "http.target": scope["path"]
+        }) as http_span:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Request-ID", request_id)
+                    http_span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+
+            finally:
+                request_id_var.reset(request_id_token)
+                route_var.reset(route_token)
+
+                # Шаблон маршрута известен только после роутинга
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    http_span.set_attribute("http.route", route)
+                    http_span.rename(f"{scope['method']} {route}")
@@ -4,7 +4,8 @@ from web_app.src.models.user import (UserRole, ROLE_MAPPING, User, Secretary,
 from web_app.src.models.product import Category, Item
 from web_app.src.models.request import (Request, RequestType, RequestStatus, STATUS_MAPPING,
                                         TYPE_MAPPING, STATUS_ID_MAPPING, TYPE_ID_MAPPING,
-                                        RequestHistory, RequestDocument, RequestAction)
+                                        RequestHistory, RequestDocument, RequestAction, RequestListView,
+                                        DeadlineReminder)
 from web_app.src.models.table import (RequestItem, request_item, RequestItemStatus, REQUEST_ITEM_STATUS_ID_MAPPING,
-                                      REQUEST_ITEM_STATUS_MAPPING)
+                                      REQUEST_ITEM_STATUS_MAPPING, ITEM_DEADLINE)
 from web_app.src.models.organization import Department
\ No newline at end of file
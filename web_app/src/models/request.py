@@ -65,6 +65,11 @@ TYPE_ID_MAPPING = [{"id": i, "name": name.capitalize()} for i, name in enumerate
 # Модель Заявки
 class Request(Base):
     __tablename__ = "requests"
+    # Поиск по части номера в админке (ILIKE '%...%') идет по триграммному индексу
+    __table_args__ = (
+        sa.Index("ix_requests_registration_number_trgm", "registration_number", postgresql_using="gin",
+                 postgresql_ops={"registration_number": "gin_trgm_ops"}),
+    )
 
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
     registration_number: so.Mapped[str] = so.mapped_column(
@@ -120,6 +125,11 @@ class Request(Base):
         sa.DateTime(timezone=True),
         nullable=True
     )
+    # Завершенные и отмененные заявки старше ARCHIVE_AFTER_DAYS: доступны в деталях, но не в списках
+    archived_at: so.Mapped[Optional[datetime]] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True
+    )
 
     # Внешние ключи
     secretary_id: so.Mapped[int] = so.mapped_column(
@@ -201,6 +211,9 @@ class Request(Base):
 # Модель документа
 class RequestDocument(Base):
     __tablename__ = "request_documents"
+    __table_args__ = (
+        sa.Index("ix_request_documents_request_id_id", "request_id", "id"),
+    )
 
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
     document_type: so.Mapped[str] = so.mapped_column(
@@ -228,8 +241,7 @@ class RequestDocument(Base):
     request_id: so.Mapped[int] = so.mapped_column(
         sa.Integer,
         sa.ForeignKey("requests.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Связи
@@ -248,8 +260,15 @@ class RequestDocument(Base):
 # Модель истории заявок
 class RequestHistory(Base):
     __tablename__ = "request_history"
+    # Страницы по курсору внутри заявки читаются по индексу без сортировки.
+    # Таблица секционирована по годам created_at (секции создает sql_create_history_partitions),
+    # поэтому created_at входит в первичный ключ
+    __table_args__ = (
+        sa.Index("ix_request_history_request_id_id", "request_id", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"}
+    )
 
-    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True, autoincrement=True)
     action: so.Mapped[RequestAction] = so.mapped_column(
         sa.Enum(RequestAction),
         nullable=False
@@ -260,15 +279,15 @@ class RequestHistory(Base):
     )
     created_at: so.Mapped[datetime] = so.mapped_column(
         sa.DateTime(timezone=True),
-        server_default=sa.func.now()
+        server_default=sa.func.now(),
+        primary_key=True
     )
 
     # Внешние ключи
     request_id: so.Mapped[int] = so.mapped_column(
         sa.Integer,
         sa.ForeignKey("requests.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_id: so.Mapped[int] = so.mapped_column(
         sa.Integer,
@@ -285,4 +304,78 @@ class RequestHistory(Base):
     user: so.Mapped["User"] = so.relationship("User")
 
     def __repr__(self):
-        return f"<RequestHistory(id={self.id}, action='{self.action}', created_at='{self.created_at}')>"
\ No newline at end of file
+        return f"<RequestHistory(id={self.id}, action='{self.action}', created_at='{self.created_at}')>"
+
+
+# Проекция для списков и выгрузок: одна строка на заявку со всем, что нужно строке списка.
+# Обновляется в той же транзакции, что и сама заявка (crud/request_list_view.py)
+class RequestListView(Base):
+    __tablename__ = "request_list_view"
+    # Частичные индексы списков и счетчиков покрывают только заявки вне архива
+    __table_args__ = (
+        sa.Index("ix_request_list_view_active_status_created_at", "status", "created_at",
+                 postgresql_where=sa.text("archived_at IS NULL")),
+        sa.Index("ix_request_list_view_active_secretary_id", "secretary_id", "status", "created_at",
+                 postgresql_where=sa.text("archived_at IS NULL")),
+        sa.Index("ix_request_list_view_active_judge_id", "judge_id", "status", "created_at",
+                 postgresql_where=sa.text("archived_at IS NULL")),
+        sa.Index("ix_request_list_view_active_management_id", "management_id", "status", "created_at",
+                 postgresql_where=sa.text("archived_at IS NULL")),
+        sa.Index("ix_request_list_view_active_management_department_id", "management_department_id",
+                 "status", "created_at", postgresql_where=sa.text("archived_at IS NULL")),
+    )
+
+    request_id: so.Mapped[int] = so.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("requests.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    registration_number: so.Mapped[str] = so.mapped_column(sa.String(128), nullable=False)
+    human_registration_number: so.Mapped[Optional[str]] = so.mapped_column(sa.String(64), nullable=True)
+    request_type: so.Mapped[RequestType] = so.mapped_column(sa.Enum(RequestType), nullable=False)
+    status: so.Mapped[RequestStatus] = so.mapped_column(sa.Enum(RequestStatus), nullable=False)
+    is_emergency: so.Mapped[bool] = so.mapped_column(sa.Boolean, nullable=False)
+    department_id: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False)
+
+    # Участники заявки
+    secretary_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, nullable=True)
+    judge_id: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False)
+    management_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, nullable=True)
+    management_department_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, nullable=True)
+
+    # Предметы одной строкой: "Название (Nшт.)" через перевод строки
+    items_text: so.Mapped[str] = so.mapped_column(sa.Text, nullable=False, server_default="")
+    # Ближайший срок по предметам и признак просрочки хотя бы одного предмета (выставляет планировщик сроков)
+    next_deadline: so.Mapped[Optional[datetime]] = so.mapped_column(sa.DateTime(timezone=True), nullable=True)
+    is_overdue: so.Mapped[bool] = so.mapped_column(sa.Boolean, nullable=False, server_default=sa.false())
+
+    created_at: so.Mapped[datetime] = so.mapped_column(sa.DateTime(timezone=True), nullable=False)
+    archived_at: so.Mapped[Optional[datetime]] = so.mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<RequestListView(request_id={self.request_id}, status='{self.status}')>"
+
+
+# Очередь напоминаний о сроках (outbox): строки добавляются в той же транзакции,
+# что и отметка предмета напомненным, и удаляются после публикации (tasks/deadline_scheduler.py)
+class DeadlineReminder(Base):
+    __tablename__ = "deadline_reminders"
+
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True, autoincrement=True)
+    request_id: so.Mapped[int] = so.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("requests.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    item_id: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False)
+    # Ключи аудитории события и данные напоминания в том виде, в котором они публикуются
+    audience: so.Mapped[list] = so.mapped_column(sa.JSON, nullable=False)
+    data: so.Mapped[dict] = so.mapped_column(sa.JSON, nullable=False)
+    created_at: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now()
+    )
+
+    def __repr__(self):
+        return f"<DeadlineReminder(id={self.id}, request_id={self.request_id}, item_id={self.item_id})>"
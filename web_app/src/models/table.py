@@ -50,12 +50,25 @@ request_item = sa.Table(
     sa.Column("deadline_executor", sa.DateTime(timezone=True), nullable=True),
     sa.Column("deadline_organization", sa.DateTime(timezone=True), nullable=True),
     sa.Column("deadline_planning", sa.DateTime(timezone=True), nullable=True),
+    # Флаги выставляет планировщик сроков (tasks/deadline_scheduler.py), смена срока их сбрасывает
+    sa.Column("is_overdue", sa.Boolean, default=False, server_default=sa.false(), nullable=False),
+    sa.Column("is_reminded", sa.Boolean, default=False, server_default=sa.false(), nullable=False),
     sa.Column("description_executor", sa.Text, nullable=True),
     sa.Column("description_organization", sa.Text, nullable=True),
     sa.Column("description_completed", sa.Text, nullable=True)
 )
 
 
+# Ближайший срок предмета: по нему планировщик находит следующее событие одним запросом по индексу
+ITEM_DEADLINE = sa.func.least(
+    request_item.c.deadline_executor,
+    request_item.c.deadline_organization,
+    request_item.c.deadline_planning
+)
+sa.Index("ix_request_item_pending_overdue", ITEM_DEADLINE, postgresql_where=~request_item.c.is_overdue)
+sa.Index("ix_request_item_pending_reminder", ITEM_DEADLINE, postgresql_where=~request_item.c.is_reminded)
+
+
 # Таблица для many-to-many
 class RequestItem(Base):
     __table__ = request_item
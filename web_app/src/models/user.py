@@ -32,6 +32,11 @@ ROLE_MAPPING = {
 # Модель пользователя
 class User(Base):
     __tablename__ = "users"
+    # Поиск по части ФИО в админке (ILIKE '%...%') идет по триграммному индексу
+    __table_args__ = (
+        sa.Index("ix_users_full_name_trgm", "full_name", postgresql_using="gin",
+                 postgresql_ops={"full_name": "gin_trgm_ops"}),
+    )
 
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
     username: so.Mapped[str] = so.mapped_column(
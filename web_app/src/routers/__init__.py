@@ -9,6 +9,8 @@ from web_app.src.routers.update_router import router as update_router
 from web_app.src.routers.authentication_router import router as authentication_router
 from web_app.src.routers.download_router import router as download_router
 from web_app.src.routers.siganture_router import router as signature_router
+from web_app.src.routers.events_router import router as events_router
+from web_app.src.routers.bulk_router import router as bulk_router
 
 
 router = APIRouter()
@@ -19,4 +21,6 @@ router.include_router(api_router)
 router.include_router(update_router)
 router.include_router(authentication_router)
 router.include_router(download_router)
-router.include_router(signature_router)
\ No newline at end of file
+router.include_router(signature_router)
+router.include_router(events_router)
+router.include_router(bulk_router)
\ No newline at end of file
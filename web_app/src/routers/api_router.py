@@ -1,11 +1,13 @@
 # Внешние зависимости
 from typing import Annotated, List
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from pydantic import Field
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.crud import sql_get_info_user_by_id, sql_get_all_judges, sql_check_exists_username
 from web_app.src.schemas import UserInfoResponse, JudgeResponse, CheckUsernameRequest
+from web_app.src.utils import reference_cache, REFERENCE_JUDGES
 
 
 router = APIRouter(
@@ -19,6 +21,7 @@ router = APIRouter(
     response_model=UserInfoResponse,
     summary="Информация о пользователе"
 )
+@query_budget(1)
 async def get_info_user_by_id(user_id: Annotated[int, Field(ge=1)]):
     user = await sql_get_info_user_by_id(user_id=user_id)
 
@@ -30,10 +33,11 @@ async def get_info_user_by_id(user_id: Annotated[int, Field(ge=1)]):
     response_model=List[JudgeResponse],
     summary="Список всех судей"
 )
-async def get_all_judges():
-    judges = await sql_get_all_judges()
+@query_budget(1)
+async def get_all_judges(request: Request):
+    judges = await reference_cache.get(REFERENCE_JUDGES, sql_get_all_judges)
 
-    return judges
+    return reference_cache.response(judges, request)
 
 
 @router.post(
@@ -41,6 +45,7 @@ async def get_all_judges():
     response_class=JSONResponse,
     summary="Проверка существования имени пользователя"
 )
+@query_budget(1)
 async def check_exists_username(
     data: CheckUsernameRequest
 ):
@@ -1,14 +1,16 @@
 # Внешние зависимости
 from typing import Optional
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Cookie
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import JSONResponse, RedirectResponse
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.core import config
-from web_app.src.dependencies import authenticate_user, create_access_token
+from web_app.src.core.metrics import LOGIN_THROTTLED
+from web_app.src.dependencies import authenticate_user, create_access_token, get_client_ip
 from web_app.src.utils import (token_service, create_secret_token, send_password_reset_email,
-                               send_confirm_create_secretary_email, get_password_hash)
+                               send_confirm_create_secretary_email, get_password_hash_async)
 from web_app.src.crud import (sql_get_user_by_email, sql_get_email_department_from_judge_by_id,
                               sql_add_user_secretary)
 from web_app.src.schemas import PasswordResetRequest, CreateSecretaryRequest, ConfirmCreateRequest
@@ -22,17 +24,42 @@ router = APIRouter()
     response_class=JSONResponse,
     summary="Получение Access Token"
 )
+@query_budget(1)
 async def login_for_access_token(
+    request: Request,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
+    # Ограничиваем частоту попыток до проверки пароля, чтобы не тратить на них хеширование
+    client_ip = get_client_ip(request)
+    retry_after = await token_service.get_login_ip_block(ip=client_ip)
+    if retry_after is not None:
+        LOGIN_THROTTLED.labels(scope="ip").inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    retry_after = await token_service.get_login_block(username=form_data.username)
+    if retry_after is not None:
+        LOGIN_THROTTLED.labels(scope="username").inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(retry_after)},
+        )
+
     user = await authenticate_user(form_data.username, form_data.password)
     if not user:
+        await token_service.register_login_failure(username=form_data.username, ip=client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    await token_service.reset_login_failures(username=form_data.username)
     access_token_expires = timedelta(minutes=config.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": str(user.id)}, expires_delta=access_token_expires
@@ -55,6 +82,7 @@ async def login_for_access_token(
     "/logout",
     summary="Выход из учетной записи"
 )
+@query_budget(0)
 async def logout(
     response: Response,
     access_token: Optional[str] = Cookie(None, alias="access_token")
@@ -74,6 +102,7 @@ async def logout(
     "/logout",
     summary="Выход из учетной записи"
 )
+@query_budget(0)
 async def logout_get(
     access_token: Optional[str] = Cookie(None, alias="access_token")
 ):
@@ -90,6 +119,7 @@ async def logout_get(
     response_class=JSONResponse,
     summary="Токены из черного списка"
 )
+@query_budget(0)
 async def get_black_tokens():
     return await token_service.get_stats()
 
@@ -99,6 +129,7 @@ async def get_black_tokens():
     response_class=JSONResponse,
     summary="Забыли пароль"
 )
+@query_budget(1)
 async def forgot_password(request: PasswordResetRequest):
     # Ищем пользователя по email
     user = await sql_get_user_by_email(email=request.email)
@@ -135,6 +166,7 @@ async def forgot_password(request: PasswordResetRequest):
     response_class=JSONResponse,
     summary="Создание секретаря"
 )
+@query_budget(1)
 async def create_secretary(
     data: CreateSecretaryRequest
 ):
@@ -145,7 +177,7 @@ async def create_secretary(
     confirm_token = create_secret_token()
 
     data_for_redis = data.model_dump(mode="json")
-    data_for_redis["password"] = get_password_hash(data.password)
+    data_for_redis["password"] = await get_password_hash_async(data.password)
 
     await token_service.add_data_secretary(
         token=confirm_token,
@@ -175,6 +207,7 @@ async def create_secretary(
     response_class=JSONResponse,
     summary="Подтверждение создания секретаря"
 )
+@query_budget(4)
 async def confirm_create_secretary(
     data: ConfirmCreateRequest
 ):
@@ -0,0 +1,115 @@
+# Внешние зависимости
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+# Внутренние модули
+from web_app.src.middlewares import query_budget
+from web_app.src.models import User, UserRole
+from web_app.src.dependencies import get_current_user_with_role
+from web_app.src.schemas import (BulkRequest, BulkCommentRequest, BulkRedirectRequest,
+                                 BulkRedirectRequestWithDeadline)
+from web_app.src.crud import (sql_bulk_finish_requests, sql_bulk_reject_requests,
+                              sql_bulk_redirect_management_requests, sql_bulk_redirect_executor_requests,
+                              sql_bulk_redirect_organization_requests)
+
+
+# Массовые действия: одна транзакция на пачку, результат по каждой заявке в results
+router = APIRouter(
+    prefix="/api/v1/request/bulk",
+    tags=["API"],
+)
+
+
+@router.patch(
+    path="/finish",
+    response_class=JSONResponse,
+    summary="Подтвердить выполнение или завершить заявки"
+)
+@query_budget(7)
+async def bulk_finish_requests(
+        data: BulkRequest,
+        current_user: User = Depends(
+            get_current_user_with_role((UserRole.MANAGEMENT, UserRole.MANAGEMENT_DEPARTMENT))
+        )
+):
+    return await sql_bulk_finish_requests(
+        data=data,
+        user=current_user
+    )
+
+
+@router.patch(
+    path="/reject",
+    response_class=JSONResponse,
+    summary="Отклонить заявки"
+)
+@query_budget(7)
+async def bulk_reject_requests(
+        data: BulkCommentRequest,
+        current_user: User = Depends(
+            get_current_user_with_role((UserRole.JUDGE, UserRole.MANAGEMENT))
+        )
+):
+    return await sql_bulk_reject_requests(
+        data=data,
+        user=current_user
+    )
+
+
+@router.patch(
+    path="/redirect/management",
+    response_class=JSONResponse,
+    summary="Назначить сотрудника отдела на заявки"
+)
+@query_budget(8)
+async def bulk_redirect_management_requests(
+        data: BulkRedirectRequest,
+        current_user: User = Depends(
+            get_current_user_with_role((UserRole.MANAGEMENT,))
+        )
+):
+    if not current_user.is_management:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+    return await sql_bulk_redirect_management_requests(
+        data=data,
+        user=current_user
+    )
+
+
+@router.patch(
+    path="/redirect/executor",
+    response_class=JSONResponse,
+    summary="Назначить исполнителя на заявки"
+)
+@query_budget(9)
+async def bulk_redirect_executor_requests(
+        data: BulkRedirectRequestWithDeadline,
+        current_user: User = Depends(
+            get_current_user_with_role((UserRole.MANAGEMENT_DEPARTMENT,))
+        )
+):
+    if not (current_user.is_management_department or current_user.is_management):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+    return await sql_bulk_redirect_executor_requests(
+        data=data,
+        user=current_user
+    )
+
+
+@router.patch(
+    path="/redirect/organization",
+    response_class=JSONResponse,
+    summary="Передать предметы заявок организации-исполнителю"
+)
+@query_budget(9)
+async def bulk_redirect_organization_requests(
+        data: BulkRedirectRequestWithDeadline,
+        current_user: User = Depends(
+            get_current_user_with_role((UserRole.EXECUTOR,))
+        )
+):
+    return await sql_bulk_redirect_organization_requests(
+        data=data,
+        user=current_user
+    )
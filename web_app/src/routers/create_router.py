@@ -1,17 +1,19 @@
 # Внешние зависимости
 from typing import Annotated, Optional, List
 import json
-from fastapi import APIRouter, Depends, Form, File, UploadFile
+from fastapi import APIRouter, Depends, Form, File, UploadFile, Request
 from fastapi.responses import JSONResponse
 from fastapi import HTTPException, status
 from pydantic import Field
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.crud import (sql_search_items, sql_create_request, sql_get_executors, sql_get_management_departments,
                               sql_get_executor_organizations)
 from web_app.src.models import TYPE_ID_MAPPING, User, UserRole
 from web_app.src.schemas import CreateRequest, ItemsRequest
 from web_app.src.dependencies import get_current_user, get_current_user_with_role
-from web_app.src.utils import save_uploaded_files, delete_files
+from web_app.src.utils import (save_uploaded_files, delete_files, reference_cache, REFERENCE_EXECUTORS,
+                               REFERENCE_EXECUTOR_ORGANIZATIONS, REFERENCE_MANAGEMENT_DEPARTMENTS)
 from web_app.src.core import config
 
 
@@ -26,6 +28,7 @@ router = APIRouter(
     response_class=JSONResponse,
     summary="Данные для создания заявки"
 )
+@query_budget(1)
 async def get_info_for_create(current_user: User = Depends(get_current_user)):
     if not (current_user.is_secretary or current_user.is_judge):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
@@ -39,6 +42,7 @@ async def get_info_for_create(current_user: User = Depends(get_current_user)):
     response_class=JSONResponse,
     summary="Поиск предметов"
 )
+@query_budget(2)
 async def search_items(
         search: Annotated[
             str,
@@ -59,15 +63,20 @@ async def search_items(
     response_class=JSONResponse,
     summary="Вывод сотрудников управления отдела"
 )
+@query_budget(2)
 async def get_management_departments(
+        request: Request,
         current_user: User = Depends(get_current_user)
 ):
     if not current_user.is_management:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
-    management_departments = await sql_get_management_departments()
+    management_departments = await reference_cache.get(
+        REFERENCE_MANAGEMENT_DEPARTMENTS,
+        sql_get_management_departments
+    )
 
-    return management_departments
+    return reference_cache.response(management_departments, request)
 
 
 @router.get(
@@ -75,7 +84,9 @@ async def get_management_departments(
     response_class=JSONResponse,
     summary="Вывод исполнителей"
 )
+@query_budget(2)
 async def get_executors(
+        request: Request,
         current_user: User = Depends(
             get_current_user_with_role((UserRole.MANAGEMENT_DEPARTMENT,))
         )
@@ -83,11 +94,15 @@ async def get_executors(
     if not (current_user.is_management or current_user.is_management_department):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
-    executors = await sql_get_executors(
-        management_department_profile=current_user.management_department_profile
+    # Сотрудник отдела видит только исполнителей своего отдела: снимок хранится отдельно для каждого отдела
+    profile = current_user.management_department_profile
+    executors = await reference_cache.get(
+        REFERENCE_EXECUTORS,
+        lambda: sql_get_executors(management_department_profile=profile),
+        key=profile.id if profile is not None else None
     )
 
-    return executors
+    return reference_cache.response(executors, request)
 
 
 @router.get(
@@ -95,16 +110,18 @@ async def get_executors(
     response_class=JSONResponse,
     summary="Вывод организаций-исполнителей"
 )
+@query_budget(2)
 async def get_organizations(
+        request: Request,
         current_user: User = Depends(get_current_user)
 ):
     if not (current_user.is_management or current_user.is_management_department or
             current_user.is_executor):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough rights")
 
-    organizations = await sql_get_executor_organizations()
+    organizations = await reference_cache.get(REFERENCE_EXECUTOR_ORGANIZATIONS, sql_get_executor_organizations)
 
-    return organizations
+    return reference_cache.response(organizations, request)
 
 
 @router.post(
@@ -112,6 +129,7 @@ async def get_organizations(
     response_class=JSONResponse,
     summary="Создание новой заявки"
 )
+@query_budget(10)
 async def create_request(
     items: str = Form(None),
     is_emergency: bool = Form(False),
@@ -174,7 +192,7 @@ async def create_request(
         )
 
     except:
-        delete_files(file_paths=[file.file_path for file in files_info])
+        delete_files(file_paths=[file.file_path for file in files_info or []])
         raise
 
     return {"status": "success", "registration_number": request_id}
\ No newline at end of file
@@ -1,14 +1,15 @@
 # Внешние зависимости
 from typing import Optional
-from io import BytesIO
 from datetime import datetime
-import pandas as pd
+import asyncio
 from fastapi import APIRouter, Depends, Response, HTTPException
 from fastapi import status as status_
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.dependencies import get_current_user
 from web_app.src.models import User, UserRole
 from web_app.src.crud import sql_get_requests_for_download, sql_get_planning_for_download
+from web_app.src.utils import build_xlsx
 
 
 router = APIRouter(
@@ -22,6 +23,7 @@ router = APIRouter(
     response_class=Response,
     summary="Скачивание заявок в xlsx"
 )
+@query_budget(3)
 async def download_requests(
         status: int,
         request_type: Optional[int] = None,
@@ -42,22 +44,14 @@ async def download_requests(
         date_filter_until=date_filter_until
     )
 
-    # Создаем DataFrame
-    df = pd.DataFrame(requests)
-
-    # Создаем Excel файл в памяти
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Заявки', index=False)
-
-    output.seek(0)
+    # Создаем Excel файл в памяти (вне event loop)
+    content = await asyncio.to_thread(build_xlsx, requests, "Заявки")
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"requests_{timestamp}.xlsx"
 
     return Response(
-        content=output.getvalue(),
+        content=content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -68,6 +62,7 @@ async def download_requests(
     response_class=Response,
     summary="Скачивание заявок из планирования в xlsx"
 )
+@query_budget(2)
 async def download_planning(
         department: Optional[int] = None,
         current_user: User = Depends(get_current_user)
@@ -80,22 +75,14 @@ async def download_planning(
         department_filter_id=department
     )
 
-    # Создаем DataFrame
-    df = pd.DataFrame(requests)
-
-    # Создаем Excel файл в памяти
-    output = BytesIO()
-
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Планирование', index=False)
-
-    output.seek(0)
+    # Создаем Excel файл в памяти (вне event loop)
+    content = await asyncio.to_thread(build_xlsx, requests, "Планирование")
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"planning_{timestamp}.xlsx"
 
     return Response(
-        content=output.getvalue(),
+        content=content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
\ No newline at end of file
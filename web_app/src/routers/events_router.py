@@ -0,0 +1,62 @@
+# Внешние зависимости
+from typing import AsyncIterator, FrozenSet
+import json
+import time
+import asyncio
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.models import User, UserRole
+from web_app.src.dependencies import get_current_user_with_role
+from web_app.src.utils import event_service, get_user_audience
+
+
+router = APIRouter(
+    prefix="/api/v1/events",
+    tags=["API"],
+)
+
+
+# Поток событий в формате text/event-stream для одного SSE соединения
+async def stream_events(audience: FrozenSet[str]) -> AsyncIterator[str]:
+    queue = event_service.subscribe(audience)
+    try:
+        # Задержка переподключения EventSource после разрыва
+        yield "retry: 5000\n\n"
+
+        deadline = time.monotonic() + config.SSE_MAX_LIFETIME
+        while time.monotonic() < deadline:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=config.SSE_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+
+            if payload is None:
+                break
+
+            data = json.dumps(payload["data"], ensure_ascii=False)
+            yield f"event: {payload['event']}\ndata: {data}\n\n"
+
+    finally:
+        event_service.unsubscribe(queue)
+
+
+@router.get(
+    path="/requests",
+    response_class=StreamingResponse,
+    summary="Поток изменений заявок пользователя (Server-Sent Events)"
+)
+async def get_request_events(
+    current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
+):
+    return StreamingResponse(
+        stream_events(get_user_audience(current_user)),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx не должен буферизовать поток
+            "X-Accel-Buffering": "no"
+        }
+    )
@@ -1,23 +1,40 @@
 # Внешние зависимости
 from typing import Annotated
+import asyncio
+from markupsafe import Markup
 from pydantic import Field
 from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 # Внутренние модули
+from web_app.src.core import config
+from web_app.src.middlewares import query_budget
 from web_app.src.dependencies import get_current_user, get_current_user_with_role
 from web_app.src.models import User, UserRole
-from web_app.src.utils import token_service, generate_password
+from web_app.src.utils import token_service, generate_password, static_url
 from web_app.src.crud import (sql_update_password_user_by_id, sql_check_request_for_sign_by_judge,
-                              sql_get_email_department_from_judge_by_id)
+                              sql_get_email_department_from_judge_by_id, get_status_filter_for_user)
+from web_app.src.schemas import InitialPageData
+from web_app.src.routers.view_router import build_filter_info, build_requests_page, build_planning_page
 
 
 router = APIRouter()
 templates = Jinja2Templates(directory="web_app/templates")
+templates.env.globals["static_url"] = static_url
+
+# Размер первой страницы списка (совпадает со значением по умолчанию в скриптах страниц)
+INITIAL_PAGE_SIZE = 10
+
+
+# JSON для вставки в <script type="application/json">: экранируются символы, закрывающие тег
+def embed_json(data: InitialPageData) -> Markup:
+    raw = data.model_dump_json()
+    return Markup(raw.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026"))
 
 
 # Страница создания заявки
 @router.get("/create", response_class=HTMLResponse)
+@query_budget(1)
 async def create_page(
         request: Request,
         current_user: User = Depends(get_current_user)
@@ -37,9 +54,10 @@ async def create_page(
 # Страница просмотра списков заявок
 @router.get("/", response_class=HTMLResponse)
 @router.get("/requests", response_class=HTMLResponse)
+@query_budget(5)
 async def requests_page(
         request: Request,
-        current_user: User = Depends(get_current_user)
+        current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
 ):
     context = {
         "request": request,
@@ -62,11 +80,26 @@ async def requests_page(
             "title": "Заявки"
         })
 
+    if config.EMBED_INITIAL_DATA:
+        # Фильтры и первая страница (со статусом, выбранным по умолчанию) считаются параллельно
+        _, status_mapping_id = get_status_filter_for_user(current_user)
+        filter_info, page = await asyncio.gather(
+            build_filter_info(user=current_user),
+            build_requests_page(
+                user=current_user,
+                status=status_mapping_id[0]["id"],
+                page=1,
+                page_size=INITIAL_PAGE_SIZE
+            )
+        )
+        context["initial_data"] = embed_json(InitialPageData.model_construct(filter_info=filter_info, page=page))
+
     return templates.TemplateResponse(html_template, context=context)
 
 
 # Страница детального просмотра заявки
 @router.get("/request/{registration_number}", response_class=HTMLResponse)
+@query_budget(1)
 async def detail_page(
         request: Request,
         current_user: User = Depends(get_current_user)
@@ -85,6 +118,7 @@ async def detail_page(
 
 # Страница редактирования заявки
 @router.get("/request/{registration_number}/edit", response_class=HTMLResponse)
+@query_budget(1)
 async def edit_page(
         request: Request,
         current_user: User = Depends(get_current_user)
@@ -106,6 +140,7 @@ async def edit_page(
 
 # Страница назначение сотрудника управления отдела для заявки
 @router.get("/request/{registration_number}/redirect/management", response_class=HTMLResponse)
+@query_budget(1)
 async def redirect_management_page(
         request: Request,
         current_user: User = Depends(get_current_user)
@@ -127,9 +162,10 @@ async def redirect_management_page(
 
 # Страница просмотра планирования
 @router.get("/planning", response_class=HTMLResponse)
+@query_budget(4)
 async def planning_page(
         request: Request,
-        current_user: User = Depends(get_current_user)
+        current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
 ):
     if not (current_user.is_management or current_user.is_management_department or
             current_user.is_executor or current_user.is_executor_organization):
@@ -144,11 +180,19 @@ async def planning_page(
         "role_value": current_user.role.value.capitalize()
     }
 
+    if config.EMBED_INITIAL_DATA:
+        filter_info, page = await asyncio.gather(
+            build_filter_info(user=current_user, request_type=False, status=False, for_planning=True),
+            build_planning_page(user=current_user, page=1, page_size=INITIAL_PAGE_SIZE)
+        )
+        context["initial_data"] = embed_json(InitialPageData.model_construct(filter_info=filter_info, page=page))
+
     return templates.TemplateResponse('planning.html', context=context)
 
 
 # Страница подписи pdf файла
 @router.get("/signature/{registration_number}", response_class=HTMLResponse)
+@query_budget(2)
 async def signature_page(
     request: Request,
     registration_number: Annotated[str, Field(strict=True)],
@@ -179,6 +223,7 @@ async def signature_page(
 
 # Страница аутентификации
 @router.get("/login", response_class=HTMLResponse)
+@query_budget(0)
 async def login_page(request: Request):
     context = {
         "request": request,
@@ -194,6 +239,7 @@ async def login_page(request: Request):
 
 # Подтверждение смены пароля
 @router.get("/login/forgot-password", response_class=HTMLResponse)
+@query_budget(0)
 async def reset_password(
         request: Request
 ):
@@ -205,6 +251,7 @@ async def reset_password(
 
 # Подтверждение смены пароля
 @router.get("/login/reset-password", response_class=HTMLResponse)
+@query_budget(2)
 async def reset_password(
     request: Request,
     token: Annotated[str, Field(strict=True, strip_whitespace=True)]
@@ -234,6 +281,7 @@ async def reset_password(
 
 # Создание аккаунта секретаря
 @router.get("/create-secretary", response_class=HTMLResponse)
+@query_budget(0)
 async def create_secretary(request: Request):
     context = {"request": request}
     return templates.TemplateResponse('create_secretary.html', context=context)
@@ -241,6 +289,7 @@ async def create_secretary(request: Request):
 
 # Подтверждение создания секретаря
 @router.get("/confirm-create-secretary", response_class=HTMLResponse)
+@query_budget(1)
 async def confirm_create_secretary(
     request: Request,
     token: Annotated[str, Field(strict=True, strip_whitespace=True)]
@@ -3,6 +3,7 @@ from typing import Annotated
 from pydantic import Field
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.models import User, UserRole
 from web_app.src.dependencies import get_current_user_with_role
 from web_app.src.schemas import DocumentResponse, DocumentEmblem
@@ -22,6 +23,7 @@ router = APIRouter(
     response_model=DocumentResponse,
     summary="Генерация pdf файла с эмблемой подписи"
 )
+@query_budget(3)
 async def generate_pdf_with_emblem_request(
         registration_number: Annotated[str, Field(strict=True)],
         data: DocumentEmblem,
@@ -50,6 +52,7 @@ async def generate_pdf_with_emblem_request(
     response_model=DocumentResponse,
     summary="Загрузка pdf файла с подписью и утверждение заявки"
 )
+@query_budget(6)
 async def load_pdf_signed_request(
         registration_number: Annotated[str, Field(strict=True)],
         file: UploadFile,
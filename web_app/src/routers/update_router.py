@@ -5,6 +5,7 @@ from pydantic import Field
 from fastapi import APIRouter, Depends, HTTPException, status, Form, UploadFile, File
 from fastapi.responses import JSONResponse
 # Внутренние модули
+from web_app.src.middlewares import query_budget
 from web_app.src.models import User, UserRole
 from web_app.src.dependencies import get_current_user, get_current_user_with_role
 from web_app.src.schemas import (CreateRequest, RedirectRequest, CommentRequest, ItemsExecuteRequest,
@@ -28,6 +29,7 @@ router = APIRouter(
     response_class=JSONResponse,
     summary="Редактирование заявки"
 )
+@query_budget(14)
 async def edit_request(
         registration_number: Annotated[str, Field(strict=True)],
         items: str = Form(None),
@@ -81,7 +83,7 @@ async def edit_request(
         )
 
     except:
-        delete_files(file_paths=[file.file_path for file in files_info])
+        delete_files(file_paths=[file.file_path for file in files_info or []])
         raise
 
     return {"status": "success"}
@@ -92,6 +94,7 @@ async def edit_request(
     response_class=JSONResponse,
     summary="Отклонить заявку"
 )
+@query_budget(5)
 async def reject_request(
         data: CommentRequest,
         registration_number: Annotated[str, Field(strict=True)],
@@ -121,6 +124,7 @@ async def reject_request(
     response_class=JSONResponse,
     summary="Назначить сотрудника отдела"
 )
+@query_budget(6)
 async def redirect_management_request(
         registration_number: Annotated[str, Field(strict=True)],
         data: RedirectRequest,
@@ -146,6 +150,7 @@ async def redirect_management_request(
     response_class=JSONResponse,
     summary="Назначить исполнителя"
 )
+@query_budget(7)
 async def redirect_executor_request(
         registration_number: Annotated[str, Field(strict=True)],
         data: RedirectRequestWithDeadline,
@@ -171,6 +176,7 @@ async def redirect_executor_request(
     response_class=JSONResponse,
     summary="Назначить организацию-исполнителя"
 )
+@query_budget(7)
 async def redirect_organization_request(
         registration_number: Annotated[str, Field(strict=True)],
         data: RedirectRequestWithDeadline,
@@ -196,6 +202,7 @@ async def redirect_organization_request(
     response_class=JSONResponse,
     summary="Выполнить заявку"
 )
+@query_budget(7)
 async def execute_request(
         registration_number: Annotated[str, Field(strict=True)],
         data: Optional[ItemsExecuteRequest] = None,
@@ -226,6 +233,7 @@ async def execute_request(
     response_class=JSONResponse,
     summary="Добавить предмет в планирование"
 )
+@query_budget(7)
 async def planning_request(
     registration_number: Annotated[str, Field(strict=True)],
     data: PlanningRequest,
@@ -248,6 +256,7 @@ async def planning_request(
     response_class=JSONResponse,
     summary="Удалить прикрепленный файл"
 )
+@query_budget(5)
 async def delete_attachment(
     registration_number: Annotated[str, Field(strict=True)],
     filename: str = Annotated[str, Field(strict=True)],
@@ -1,17 +1,22 @@
 # Внешние зависимости
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Dict, Any
+import asyncio
 from pydantic import Field
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as status_
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 # Внутренние модули
+from web_app.src.core import config
+from web_app.src.middlewares import query_budget
 from web_app.src.models import TYPE_ID_MAPPING, User, UserRole
 from web_app.src.crud import (sql_get_requests_by_user, sql_get_request_details,
                               sql_get_all_department, sql_get_request_data, sql_get_requests_for_executor,
                               sql_get_planning_requests, sql_get_count_requests_by_user,
-                              sql_get_count_planning_requests_by_user)
+                              sql_get_count_planning_requests_by_user, sql_get_request_history,
+                              sql_get_request_attachments)
 from web_app.src.dependencies import get_current_user_with_role
-from web_app.src.utils import get_allowed_rights
+from web_app.src.schemas import RequestsPageResponse, PlanningPageResponse
+from web_app.src.utils import get_allowed_rights, reference_cache, REFERENCE_DEPARTMENTS
 
 
 router = APIRouter(
@@ -20,59 +25,52 @@ router = APIRouter(
 )
 
 
-@router.get(
-    path="/filter/info",
-    response_class=JSONResponse,
-    summary="Данные для фильтрации заявок"
-)
-async def get_filter_info(
+# Данные фильтров: типы, участки и счетчики по статусам (запросы выполняются параллельно)
+async def build_filter_info(
+    user: User,
     request_type: bool = True,
     department: bool = True,
     status: bool = True,
     for_planning: bool = False,
     current_department: Optional[int] = None,
-    current_type: Optional[int] = None,
-    current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
-):
+    current_type: Optional[int] = None
+) -> Dict[str, Any]:
     result = {}
 
     if request_type:
-        result[ "request_type"] = TYPE_ID_MAPPING
+        result["request_type"] = TYPE_ID_MAPPING
 
-    if department and current_user.role not in (UserRole.SECRETARY, UserRole.JUDGE):
+    queries = {}
+
+    if department and user.role not in (UserRole.SECRETARY, UserRole.JUDGE):
         if for_planning:
-            result["department"] = await sql_get_count_planning_requests_by_user(
-                user=current_user
-            )
+            queries["department"] = sql_get_count_planning_requests_by_user(user=user)
         else:
-            result["department"] = await sql_get_all_department()
+            queries["department"] = reference_cache.get_data(REFERENCE_DEPARTMENTS, sql_get_all_department)
 
     if status:
-        result["status"] = await sql_get_count_requests_by_user(
-            user=current_user,
+        queries["status"] = sql_get_count_requests_by_user(
+            user=user,
             current_department=current_department,
             current_type=current_type
         )
 
+    result.update(zip(queries.keys(), await asyncio.gather(*queries.values())))
     return result
 
 
-@router.get(
-    path="/list/requests",
-    response_class=JSONResponse,
-    summary="Список заявок пользователя"
-)
-async def get_requests_by_user(
+# Страница списка заявок вместе с правами пользователя
+async def build_requests_page(
+    user: User,
     status: Optional[int] = None,
     request_type: Optional[int] = None,
     department: Optional[int] = None,
     page: int = 1,
-    page_size: int = 1,
-    current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
-):
-    if current_user.is_executor or current_user.is_executor_organization:
+    page_size: int = 1
+) -> RequestsPageResponse:
+    if user.is_executor or user.is_executor_organization:
         requests = await sql_get_requests_for_executor(
-            user=current_user,
+            user=user,
             status_filter_id=status,
             type_filter_id=request_type,
             department_filter_id=department,
@@ -82,7 +80,7 @@ async def get_requests_by_user(
 
     else:
         requests = await sql_get_requests_by_user(
-            user=current_user,
+            user=user,
             status_filter_id=status,
             type_filter_id=request_type,
             department_filter_id=department,
@@ -90,10 +88,87 @@ async def get_requests_by_user(
             page_size=page_size
         )
 
-    return {
-        "rights": get_allowed_rights(current_user),
-        "requests": requests
-    }
+    return RequestsPageResponse.model_construct(
+        rights=get_allowed_rights(user),
+        requests=requests
+    )
+
+
+# Страница планирования вместе с правами пользователя
+async def build_planning_page(
+    user: User,
+    department: Optional[int] = None,
+    page: int = 1,
+    page_size: int = 1
+) -> PlanningPageResponse:
+    if not (user.is_management or user.is_management_department or
+            user.is_executor or user.is_executor_organization):
+        raise HTTPException(status_code=status_.HTTP_403_FORBIDDEN, detail="Not enough rights")
+
+    planning = await sql_get_planning_requests(
+        user=user,
+        department_filter_id=department,
+        page=page,
+        page_size=page_size
+    )
+
+    return PlanningPageResponse.model_construct(
+        rights=get_allowed_rights(user),
+        planning=planning
+    )
+
+
+@router.get(
+    path="/filter/info",
+    response_class=JSONResponse,
+    summary="Данные для фильтрации заявок"
+)
+@query_budget(3)
+async def get_filter_info(
+    request_type: bool = True,
+    department: bool = True,
+    status: bool = True,
+    for_planning: bool = False,
+    current_department: Optional[int] = None,
+    current_type: Optional[int] = None,
+    current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
+):
+    return await build_filter_info(
+        user=current_user,
+        request_type=request_type,
+        department=department,
+        status=status,
+        for_planning=for_planning,
+        current_department=current_department,
+        current_type=current_type
+    )
+
+
+@router.get(
+    path="/list/requests",
+    response_class=JSONResponse,
+    summary="Список заявок пользователя"
+)
+@query_budget(4)
+async def get_requests_by_user(
+    status: Optional[int] = None,
+    request_type: Optional[int] = None,
+    department: Optional[int] = None,
+    page: int = 1,
+    page_size: int = 1,
+    current_user: User = Depends(get_current_user_with_role(tuple(UserRole)))
+):
+    page_response = await build_requests_page(
+        user=current_user,
+        status=status,
+        request_type=request_type,
+        department=department,
+        page=page,
+        page_size=page_size
+    )
+
+    # Сериализация сразу в JSON ядром pydantic, минуя jsonable_encoder FastAPI
+    return Response(content=page_response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -101,6 +176,7 @@ async def get_requests_by_user(
     response_class=JSONResponse,
     summary="Список планирования заявок пользователя"
 )
+@query_budget(3)
 async def get_planning_requests_by_user(
     department: Optional[int] = None,
     page: int = 1,
@@ -110,21 +186,14 @@ async def get_planning_requests_by_user(
                                     UserRole.EXECUTOR, UserRole.EXECUTOR_ORGANIZATION))
     )
 ):
-    if not (current_user.is_management or current_user.is_management_department or
-            current_user.is_executor or current_user.is_executor_organization):
-        raise HTTPException(status_code=status_.HTTP_403_FORBIDDEN, detail="Not enough rights")
-
-    planning = await sql_get_planning_requests(
+    page_response = await build_planning_page(
         user=current_user,
-        department_filter_id=department,
+        department=department,
         page=page,
         page_size=page_size
     )
 
-    return {
-        "rights": get_allowed_rights(current_user),
-        "planning": planning
-    }
+    return Response(content=page_response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -132,6 +201,7 @@ async def get_planning_requests_by_user(
     response_class=JSONResponse,
     summary="Данные заявки"
 )
+@query_budget(2)
 async def get_request_data(
     registration_number: Annotated[str, Field(strict=True)]
 ):
@@ -147,6 +217,7 @@ async def get_request_data(
     response_class=JSONResponse,
     summary="Детали заявки"
 )
+@query_budget(7)
 async def get_request_details(
     registration_number: Annotated[str, Field(strict=True)],
     current_user: User = Depends(
@@ -161,4 +232,50 @@ async def get_request_details(
     return {
         "rights": get_allowed_rights(current_user),
         "details": details
-    }
\ No newline at end of file
+    }
+
+
+@router.get(
+    path="/detail/{registration_number}/history",
+    response_class=JSONResponse,
+    summary="История заявки (страницы по курсору next_cursor)"
+)
+@query_budget(4)
+async def get_request_history(
+    registration_number: Annotated[str, Field(strict=True)],
+    cursor: Optional[int] = None,
+    limit: Annotated[int, Query(ge=1)] = 20,
+    current_user: User = Depends(
+        get_current_user_with_role((UserRole.EXECUTOR, UserRole.EXECUTOR_ORGANIZATION))
+    )
+):
+    history_page = await sql_get_request_history(
+        registration_number=registration_number,
+        limit=min(limit, config.MAX_CURSOR_PAGE_SIZE),
+        cursor=cursor
+    )
+
+    return Response(content=history_page.model_dump_json(), media_type="application/json")
+
+
+@router.get(
+    path="/detail/{registration_number}/attachments",
+    response_class=JSONResponse,
+    summary="Вложения заявки (страницы по курсору next_cursor)"
+)
+@query_budget(4)
+async def get_request_attachments(
+    registration_number: Annotated[str, Field(strict=True)],
+    cursor: Optional[int] = None,
+    limit: Annotated[int, Query(ge=1)] = 20,
+    current_user: User = Depends(
+        get_current_user_with_role((UserRole.EXECUTOR, UserRole.EXECUTOR_ORGANIZATION))
+    )
+):
+    attachments_page = await sql_get_request_attachments(
+        registration_number=registration_number,
+        limit=min(limit, config.MAX_CURSOR_PAGE_SIZE),
+        cursor=cursor
+    )
+
+    return Response(content=attachments_page.model_dump_json(), media_type="application/json")
@@ -4,7 +4,12 @@ from web_app.src.schemas.request import (CreateRequest, RequestResponse, Request
                                          AttachmentsRequest, ItemsNameRequest, RedirectRequestWithDeadline,
                                          RequestExecutorResponse, ItemsNameRequestFull, PlanningRequest,
                                          ItemsIdRequest, ActualStatusRequest, ACTUAL_STATUS_MAPPING_FOR_REQUEST_STATUS,
-                                         ACTUAL_STATUS_MAPPING_FOR_REQUEST_ITEM_STATUS, ItemsExecuteRequest)
+                                         ACTUAL_STATUS_MAPPING_FOR_REQUEST_ITEM_STATUS, ItemsExecuteRequest,
+                                         RIGHTS_BY_REQUEST_STATUS, RIGHTS_BY_REQUEST_ITEM_STATUS,
+                                         RequestsPageResponse, PlanningPageResponse, InitialPageData,
+                                         RequestHistoryPageResponse, AttachmentsPageResponse, BulkRequest,
+                                         BulkCommentRequest, BulkRedirectRequest, BulkRedirectRequestWithDeadline,
+                                         BulkItemResult, BulkResponse)
 from web_app.src.schemas.user import UserInfoResponse, UserResponse, PasswordResetRequest, CheckUsernameRequest
 from web_app.src.schemas.documents import DocumentResponse, DocumentEmblem, DocumentData, DocumentItem
 from web_app.src.schemas.jude import JudgeResponse
@@ -1,5 +1,5 @@
 # Внешние зависимости
-from typing import Annotated, List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -91,6 +91,55 @@ class RightsResponse(BaseModel):
     confirm_management: bool
 
 
+# Права на действия с заявкой по ее статусу
+def _rights_for_request_status(request_status: RequestStatus) -> RightsResponse:
+    is_registered = request_status == RequestStatus.REGISTERED
+    is_active = request_status not in (RequestStatus.FINISHED, RequestStatus.CANCELLED)
+    return RightsResponse(
+        view=True,
+        edit=is_registered,
+        approve=is_registered,
+        reject_before=is_registered,
+        reject_after=is_active,
+        redirect_management_department=is_active,
+        redirect_executor=is_active,
+        redirect_org=is_active,
+        deadline=is_active,
+        planning=is_active,
+        ready=is_active,
+        confirm_management_department=request_status == RequestStatus.COMPLETED,
+        confirm_management=request_status == RequestStatus.ENDING_COMPLETED
+    )
+
+
+# Права на действия с предметом заявки по его статусу
+def _rights_for_request_item_status(item_status: RequestItemStatus) -> RightsResponse:
+    is_active = item_status not in (RequestItemStatus.COMPLETED, RequestItemStatus.CANCELLED)
+    return RightsResponse(
+        view=True,
+        edit=False,
+        approve=False,
+        reject_before=False,
+        reject_after=False,
+        redirect_management_department=False,
+        redirect_executor=False,
+        redirect_org=is_active,
+        deadline=is_active,
+        planning=is_active and item_status != RequestItemStatus.PLANNED,
+        ready=is_active,
+        confirm_management_department=False,
+        confirm_management=False
+    )
+
+
+# Права зависят только от статуса, поэтому строятся один раз и переиспользуются для всех строк списка
+RIGHTS_BY_REQUEST_STATUS = {request_status: _rights_for_request_status(request_status)
+                            for request_status in RequestStatus}
+
+RIGHTS_BY_REQUEST_ITEM_STATUS = {item_status: _rights_for_request_item_status(item_status)
+                                 for item_status in RequestItemStatus}
+
+
 # Схема ответа информации о заявки
 class RequestResponse(BaseModel):
     registration_number: Annotated[str, Field(strict=True, strip_whitespace=True)]
@@ -119,6 +168,18 @@ class RequestHistoryResponse(BaseModel):
     user: UserResponse
 
 
+# Схема страницы истории заявки: next_cursor передается в следующий запрос, None - записей больше нет
+class RequestHistoryPageResponse(BaseModel):
+    history: List[RequestHistoryResponse]
+    next_cursor: Optional[int] = None
+
+
+# Схема страницы вложений заявки
+class AttachmentsPageResponse(BaseModel):
+    attachments: List[AttachmentsRequest]
+    next_cursor: Optional[int] = None
+
+
 # Схема названия предмета заявки
 class ItemsNameRequest(BaseModel):
     id: Annotated[int, Field(ge=1)]
@@ -158,8 +219,10 @@ class RequestDetailResponse(BaseModel):
     completed_at: Optional[datetime]
     is_emergency: bool
     pdf_request: Annotated[str, Field(strict=True, strip_whitespace=True)]
-    attachments: Optional[List[AttachmentsRequest]] = None
+    attachments_count: Annotated[int, Field(ge=0)]
     history: List[RequestHistoryResponse]
+    history_count: Annotated[int, Field(ge=0)]
+    history_next_cursor: Optional[int] = None
     rights: RightsResponse
 
 
@@ -180,6 +243,48 @@ class CommentRequest(BaseModel):
     comment: Annotated[str, Field(strict=True, strip_whitespace=True)]
 
 
+# Максимум заявок в одном массовом действии
+BULK_MAX_SIZE = 200
+
+
+# Схема массового действия над заявками
+class BulkRequest(BaseModel):
+    registration_numbers: Annotated[
+        List[Annotated[str, Field(strict=True, strip_whitespace=True)]],
+        Field(min_length=1, max_length=BULK_MAX_SIZE)
+    ]
+
+
+# Схема массового отклонения заявок
+class BulkCommentRequest(BulkRequest):
+    comment: Annotated[str, Field(strict=True, strip_whitespace=True)] = ''
+
+
+# Схема массового назначения пользователя
+class BulkRedirectRequest(BulkRequest):
+    user_role_id: Annotated[int, Field(ge=1)]
+    description: Optional[Annotated[str, Field(strict=True, strip_whitespace=True)]] = None
+
+
+# Схема массового назначения пользователя вместе с deadline
+class BulkRedirectRequestWithDeadline(BulkRedirectRequest):
+    deadline: datetime
+
+
+# Результат действия над одной заявкой: code совпадает с HTTP статусом одиночного запроса
+class BulkItemResult(BaseModel):
+    registration_number: str
+    code: int
+    detail: Optional[str] = None
+
+
+# Схема ответа массового действия
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
 # Схема запроса даты и времени
 class ScheduleRequest(BaseModel):
     scheduled_datetime: datetime
@@ -202,4 +307,22 @@ class RequestExecutorResponse(BaseModel):
 # Схема планирования предмета
 class PlanningRequest(BaseModel):
     item_id: Annotated[int, Field(ge=1)]
-    deadline: datetime
\ No newline at end of file
+    deadline: datetime
+
+
+# Схема страницы списка заявок (права пользователя + заявки)
+class RequestsPageResponse(BaseModel):
+    rights: Dict[str, bool]
+    requests: List[Union[RequestResponse, RequestExecutorResponse]]
+
+
+# Схема страницы списка планирования
+class PlanningPageResponse(BaseModel):
+    rights: Dict[str, bool]
+    planning: List[RequestExecutorResponse]
+
+
+# Схема данных, встраиваемых в HTML страницы списка: фильтры и первая страница
+class InitialPageData(BaseModel):
+    filter_info: Dict[str, Any]
+    page: Union[RequestsPageResponse, PlanningPageResponse]
@@ -43,3 +43,69 @@ async function logout() {
         console.error('Logout error:', error);
     }
 }
+
+
+// Подписка на изменения заявок (Server-Sent Events): одно соединение на страницу.
+// События копятся delay мс, чтобы серия изменений приводила к одной перезагрузке данных
+let requestEventsSource = null;
+const requestEventHandlers = [];
+
+function onRequestEvent(handler, delay = 500) {
+    let timer = null;
+    let pending = [];
+
+    requestEventHandlers.push(function(event) {
+        pending.push(event);
+        if (timer) return;
+
+        timer = setTimeout(() => {
+            const events = pending;
+            pending = [];
+            timer = null;
+            handler(events);
+        }, delay);
+    });
+
+    if (!requestEventsSource && window.EventSource) {
+        requestEventsSource = new EventSource('/u8ufy1/api/v1/events/requests');
+        requestEventsSource.addEventListener('request', function(message) {
+            const event = JSON.parse(message.data);
+            requestEventHandlers.forEach(notify => notify(event));
+        });
+        // Напоминание планировщика о приближении срока по предмету
+        requestEventsSource.addEventListener('reminder', function(message) {
+            const reminder = JSON.parse(message.data);
+            showNotification(`Заявка ${reminder.human_registration_number || reminder.registration_number}: ` +
+                             `срок по предмету «${reminder.item_name}» - ${formatDate(reminder.deadline)}`, 'warning');
+        });
+    }
+}
+
+// Обновление счетчиков в фильтре без пересоздания опций, возвращает счетчик выбранной опции
+function updateFilterCounts(selectId, items) {
+    const select = document.getElementById(selectId);
+    if (!select || !items) return null;
+
+    items.forEach(item => {
+        const option = select.querySelector(`option[value="${item.id}"]`);
+        if (option) {
+            option.innerHTML = `<span>${item.name}</span> (<span>${item.count}<span>)`;
+            option.dataset.count = item.count;
+        }
+    });
+
+    const selectedOption = select.options[select.selectedIndex];
+    if (selectedOption && selectedOption.dataset.count !== undefined) {
+        return Number(selectedOption.dataset.count);
+    }
+    return null;
+}
+
+// Данные первой страницы, встроенные сервером в HTML (используются один раз при загрузке)
+function takeInitialData() {
+    const element = document.getElementById('initialData');
+    if (!element) return null;
+
+    element.remove();
+    return JSON.parse(element.textContent);
+}
@@ -120,6 +120,13 @@ document.addEventListener('DOMContentLoaded', function() {
     if (registrationNumber) {
         loadRequestDetails(registrationNumber);
 
+        // Перезагрузка карточки при изменении этой заявки другим пользователем
+        onRequestEvent(events => {
+            if (events.some(event => event.registration_number === registrationNumber)) {
+                loadRequestDetails(registrationNumber);
+            }
+        });
+
     } else {
         showNotification('Номер заявки не указан', 'error');
     }
@@ -341,9 +348,9 @@ document.addEventListener('DOMContentLoaded', function() {
 
             const secretary_button = document.getElementById('secretary_name');
             secretary_button.classList.add('btn-info');
-            secretary_button.addEventListener('click', () => {
+            secretary_button.onclick = () => {
                 openUserModal(request.secretary.id);
-            });
+            };
         } else {
             document.getElementById('secretary_name').style.display = "none";
         }
@@ -366,16 +373,16 @@ document.addEventListener('DOMContentLoaded', function() {
 
         const judge_button = document.getElementById('judge_name');
         judge_button.classList.add('btn-info');
-        judge_button.addEventListener('click', () => {
+        judge_button.onclick = () => {
             openUserModal(request.judge.id);
-        });
+        };
 
         const management_button = document.getElementById('management_name');
         if (request.management) {
             management_button.classList.add('btn-info');
-            management_button.addEventListener('click', () => {
+            management_button.onclick = () => {
                 openUserModal(request.management.id);
-            });
+            };
         } else {
             management_button.classList.add('btn-not-info');
         }
@@ -383,20 +390,20 @@ document.addEventListener('DOMContentLoaded', function() {
         const management_department_button = document.getElementById('management_department_name');
         if (request.management_department) {
             management_department_button.classList.add('btn-info');
-            management_department_button.addEventListener('click', () => {
+            management_department_button.onclick = () => {
                 openUserModal(request.management_department.id);
-            });
+            };
         } else {
             management_department_button.classList.add('btn-not-info');
         }
 
-        if (request.attachments) {
-            displayAttachments(request.attachments);
+        if (request.attachments_count > 0) {
+            loadAttachments(request.registration_number);
         } else {
             document.getElementById('attachments').innerHTML = '<span class="no-attachments">Файлы не прикреплены</span>';
         }
 
-        displayRequestHistory(request.history);
+        displayRequestHistory(request);
     }
 
     function displayItems(items, request_rights, rights) {
@@ -551,17 +558,31 @@ document.addEventListener('DOMContentLoaded', function() {
         itemsContainer.appendChild(itemsList);
     }
 
-    function displayRequestHistory(history) {
+    // Детали содержат последние записи истории, остальные догружаются по курсору
+    function displayRequestHistory(request) {
         const historyBody = document.getElementById('historyBody');
 
-        if (!history || history.length === 0) {
+        if (!request.history || request.history.length === 0) {
             historyBody.innerHTML = '<tr><td colspan="4" style="text-align: center;">История изменений отсутствует</td></tr>';
             return;
         }
 
-        historyBody.innerHTML = history
-        .sort((a, b) => new Date(b.created_at) - new Date(a.created_at))
-        .map(item => `
+        historyBody.innerHTML = renderHistoryRows(request.history);
+        setHistoryMore(
+            request.registration_number,
+            request.history_next_cursor,
+            request.history_count - request.history.length
+        );
+
+        historyBody.onclick = (event) => {
+            if (event.target.classList.contains('history')) {
+                openUserModal(event.target.dataset.userId);
+            }
+        };
+    }
+
+    function renderHistoryRows(history) {
+        return history.map(item => `
             <tr>
                 <td>${formatDate(item.created_at)}</td>
                 <td>
@@ -577,12 +598,72 @@ document.addEventListener('DOMContentLoaded', function() {
                 </td>
             </tr>
         `).join('');
+    }
 
-        historyBody.addEventListener('click', (event) => {
-            if (event.target.classList.contains('history')) {
-                openUserModal(event.target.dataset.userId);
+    // Кнопка догрузки истории в конце таблицы
+    function setHistoryMore(id, cursor, remaining) {
+        const historyBody = document.getElementById('historyBody');
+        const moreRow = historyBody.querySelector('.history-more');
+        if (moreRow) {
+            moreRow.remove();
+        }
+
+        if (cursor == null || remaining <= 0) {
+            return;
+        }
+
+        historyBody.insertAdjacentHTML('beforeend', `
+            <tr class="history-more">
+                <td colspan="4" style="text-align: center;">
+                    <button type="button" class="btn btn-secondary">Показать еще (${remaining})</button>
+                </td>
+            </tr>
+        `);
+        historyBody.querySelector('.history-more button').onclick = () => loadMoreHistory(id, cursor, remaining);
+    }
+
+    async function loadMoreHistory(id, cursor, remaining) {
+        try {
+            const response = await fetch(`${API_URL}/detail/${id}/history?cursor=${cursor}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
             }
-        });
+
+            const data = await response.json();
+            const historyBody = document.getElementById('historyBody');
+            historyBody.querySelector('.history-more').insertAdjacentHTML('beforebegin', renderHistoryRows(data.history));
+            setHistoryMore(id, data.next_cursor, remaining - data.history.length);
+
+        } catch (error) {
+            console.error('Ошибка загрузки истории:', error);
+            showNotification('Ошибка загрузки истории', 'error');
+        }
+    }
+
+    // Вложения запрашиваются отдельно, только если они есть
+    async function loadAttachments(id) {
+        try {
+            const attachments = [];
+            let cursor = null;
+
+            do {
+                const query = cursor == null ? '' : `?cursor=${cursor}`;
+                const response = await fetch(`${API_URL}/detail/${id}/attachments${query}`);
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+
+                const data = await response.json();
+                attachments.push(...data.attachments);
+                cursor = data.next_cursor;
+            } while (cursor != null);
+
+            displayAttachments(attachments);
+
+        } catch (error) {
+            console.error('Ошибка загрузки вложений:', error);
+            showNotification('Ошибка загрузки вложений', 'error');
+        }
     }
 
     function displayAttachments(attachments) {
@@ -103,6 +103,22 @@ async function loadRequestData() {
         }
 
         const data = await response.json();
+        // Вложения не входят в детали заявки и запрашиваются отдельно по курсору
+        data.details.attachments = [];
+        let cursor = null;
+        while (data.details.attachments.length < data.details.attachments_count) {
+            const query = cursor == null ? '' : `?cursor=${cursor}`;
+            const attachmentsResponse = await fetch(`${API_BASE_URL}/view/detail/${registrationNumber}/attachments${query}`);
+            if (!attachmentsResponse.ok) {
+                throw new Error(`Ошибка загрузки вложений заявки: ${attachmentsResponse.status}`);
+            }
+
+            const attachmentsPage = await attachmentsResponse.json();
+            data.details.attachments.push(...attachmentsPage.attachments);
+            cursor = attachmentsPage.next_cursor;
+            if (cursor == null) break;
+        }
+
         currentRequestData = data.details;
         return data.details;;
 
@@ -64,8 +64,14 @@ async function ExecuteRequest() {
 
 async function loadViewInfo() {
     try {
-        const response = await fetch(`${API_URL}/filter/info?request_type=false&status=false&for_planning=true`);
-        const data = await response.json();
+        const initialData = takeInitialData();
+        let data;
+        if (initialData) {
+            data = initialData.filter_info;
+        } else {
+            const response = await fetch(`${API_URL}/filter/info?request_type=false&status=false&for_planning=true`);
+            data = await response.json();
+        }
         const department_data = data.department;
 
         const select_department_filter = document.getElementById('departmentFilter');
@@ -79,7 +85,7 @@ async function loadViewInfo() {
         });
 
         initializeFilterListeners();
-        await loadRequests(1);
+        await loadRequests(1, initialData ? initialData.page : null);
 
     } catch (error) {
         console.error('Ошибка загрузки информации:', error);
@@ -102,10 +108,17 @@ function initializeFilterListeners(page = 1) {
 }
 
 // Загрузка списка заявок
-async function loadRequests(page = 1) {
+async function loadRequests(page = 1, preloaded = null) {
     try {
         currentPage = page;
 
+        // Первая страница уже пришла вместе с HTML
+        if (preloaded) {
+            displayRequests(preloaded);
+            updatePagination(currentPage);
+            return;
+        }
+
         const departmentFilter = document.getElementById('departmentFilter').value || null;
         const params = new URLSearchParams();
         if (departmentFilter) params.append('department', departmentFilter);
@@ -253,8 +266,27 @@ function updatePagination(page = 1) {
     }
 }
 
+// Обновление счетчиков и текущей страницы при изменении заявок (события сервера)
+async function refreshRequests() {
+    try {
+        const response = await fetch(`${API_URL}/filter/info?request_type=false&status=false&for_planning=true`);
+        const data = await response.json();
+
+        const count = updateFilterCounts('departmentFilter', data.department);
+        if (count !== null) {
+            totalItems = count;
+            totalPages = Math.ceil(totalItems / pageSize);
+        }
+
+        await loadRequests(Math.max(1, Math.min(currentPage, totalPages)));
+    } catch (error) {
+        console.error('Ошибка обновления заявок:', error);
+    }
+}
+
 document.addEventListener('DOMContentLoaded', function() {
     loadViewInfo();
+    onRequestEvent(refreshRequests);
 
     document.getElementById('firstPage').addEventListener('click', () => loadRequests(1));
     document.getElementById('prevPage').addEventListener('click', () => loadRequests(currentPage - 1));
@@ -72,8 +72,14 @@ async function loadViewInfo() {
         if (current_department) params.append('current_department', current_department);
         if (current_type) params.append('current_type', current_type);
 
-        const response = await fetch(`${API_URL}/filter/info?${params.toString()}`);
-        const data = await response.json();
+        const initialData = takeInitialData();
+        let data;
+        if (initialData) {
+            data = initialData.filter_info;
+        } else {
+            const response = await fetch(`${API_URL}/filter/info?${params.toString()}`);
+            data = await response.json();
+        }
         const request_type_data = data.request_type;
 		const status_data = data.status;
         const department_data = data.department;
@@ -119,7 +125,7 @@ async function loadViewInfo() {
         } else {
             initializeFilterListeners();
         }
-        await loadRequests(1);
+        await loadRequests(1, initialData ? initialData.page : null);
 
     } catch (error) {
         console.error('Ошибка загрузки информации:', error);
@@ -161,10 +167,17 @@ function initializeFilterListeners() {
 }
 
 // Загрузка списка заявок
-async function loadRequests(page = 1) {
+async function loadRequests(page = 1, preloaded = null) {
     try {
         currentPage = page;
 
+        // Первая страница уже пришла вместе с HTML
+        if (preloaded) {
+            displayRequests(preloaded);
+            updatePagination(currentPage);
+            return;
+        }
+
         const statusFilter = document.getElementById('statusFilter').value || null;
         const typeFilter = document.getElementById('typeFilter').value || null;
         const departmentFilter = document.getElementById('departmentFilter').value || null;
@@ -336,8 +349,31 @@ function updatePagination(page = 1) {
     }
 }
 
+// Обновление счетчиков и текущей страницы при изменении заявок (события сервера)
+async function refreshRequests() {
+    try {
+        const params = new URLSearchParams();
+        if (current_department) params.append('current_department', current_department);
+        if (current_type) params.append('current_type', current_type);
+
+        const response = await fetch(`${API_URL}/filter/info?${params.toString()}`);
+        const data = await response.json();
+
+        const count = updateFilterCounts('statusFilter', data.status);
+        if (count !== null) {
+            totalItems = count;
+            totalPages = Math.ceil(totalItems / pageSize);
+        }
+
+        await loadRequests(Math.max(1, Math.min(currentPage, totalPages)));
+    } catch (error) {
+        console.error('Ошибка обновления заявок:', error);
+    }
+}
+
 document.addEventListener('DOMContentLoaded', function() {
     loadViewInfo();
+    onRequestEvent(refreshRequests);
 
     document.getElementById('firstPage').addEventListener('click', () => loadRequests(1));
     document.getElementById('prevPage').addEventListener('click', () => loadRequests(currentPage - 1));
@@ -0,0 +1,2 @@
+from web_app.src.tasks.storage_sweeper import StorageSweeper, get_storage_sweeper
+from web_app.src.tasks.deadline_scheduler import DeadlineScheduler, get_deadline_scheduler
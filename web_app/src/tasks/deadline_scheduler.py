@@ -0,0 +1,123 @@
+# Внешние зависимости
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta, timezone
+import asyncio
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.core.metrics import DEADLINE_ITEMS_OVERDUE, DEADLINE_REMINDERS_SENT
+from web_app.src.crud import (sql_get_next_deadline_event, sql_mark_overdue_items, sql_queue_deadline_reminders,
+                              sql_get_deadline_reminders, sql_delete_deadline_reminders)
+from web_app.src.utils import token_service, event_service
+
+
+class DeadlineScheduler:
+    """
+    Отмечает просроченные предметы заявок и рассылает напоминания о сроках.
+    Спит до ближайшего события (минимум по индексу на сроках), а не опрашивает таблицу по расписанию.
+    Напоминания сначала записываются в очередь deadline_reminders и удаляются из нее только после публикации
+    """
+
+    def __init__(self):
+        self.reminder_lead = timedelta(seconds=config.DEADLINE_REMINDER_LEAD)
+        self.batch_size = config.DEADLINE_BATCH_SIZE
+        self.min_sleep = config.DEADLINE_MIN_SLEEP
+        self.max_sleep = config.DEADLINE_MAX_SLEEP
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Запуск планировщика сроков"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Остановка планировщика сроков"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                # Проход выполняет только один процесс из всех, остальные лишь ждут следующего события
+                if await token_service.acquire_lock("deadline_scheduler", expire_seconds=int(self.min_sleep) or 1):
+                    await self.process()
+
+                delay = await self.get_delay()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                config.logger.error("Unexpected error deadline scheduler: %s", e)
+                delay = self.max_sleep
+
+            await asyncio.sleep(delay)
+
+    async def get_delay(self) -> float:
+        """Секунды до ближайшего срока или напоминания в пределах [min_sleep, max_sleep]"""
+        next_event = await sql_get_next_deadline_event(reminder_lead=self.reminder_lead)
+        if next_event is None:
+            return self.max_sleep
+
+        delay = (next_event - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, self.min_sleep), self.max_sleep)
+
+    async def process(self) -> int:
+        """Один проход: просрочка и напоминания пачками, возвращает количество отправленных напоминаний"""
+        while True:
+            marked = await sql_mark_overdue_items(batch_size=self.batch_size)
+            DEADLINE_ITEMS_OVERDUE.inc(marked)
+            if marked < self.batch_size:
+                break
+
+        while True:
+            queued = await sql_queue_deadline_reminders(reminder_lead=self.reminder_lead, batch_size=self.batch_size)
+            if queued < self.batch_size:
+                break
+
+        sent = 0
+        while True:
+            reminders = await sql_get_deadline_reminders(batch_size=self.batch_size)
+            delivered = await self._send_reminders(reminders)
+            sent += delivered
+            # Недоставленные остаются в очереди до следующего прохода
+            if len(reminders) < self.batch_size or delivered < len(reminders):
+                break
+
+        if sent:
+            config.logger.info("Deadline reminders sent: %s", sent)
+
+        return sent
+
+    @staticmethod
+    async def _send_reminders(reminders: List[Dict[str, Any]]) -> int:
+        published = await asyncio.gather(*(
+            event_service.publish(event="reminder", data=reminder["data"], audience=reminder["audience"])
+            for reminder in reminders
+        ))
+
+        delivered_ids = [reminder["id"] for reminder, is_published in zip(reminders, published) if is_published]
+        if delivered_ids:
+            await sql_delete_deadline_reminders(reminder_ids=delivered_ids)
+        DEADLINE_REMINDERS_SENT.inc(len(delivered_ids))
+
+        if len(delivered_ids) < len(reminders):
+            config.logger.warning("Deadline reminders not delivered, will retry: %s",
+                                  len(reminders) - len(delivered_ids))
+
+        return len(delivered_ids)
+
+
+_instance = None
+
+
+def get_deadline_scheduler() -> DeadlineScheduler:
+    global _instance
+    if _instance is None:
+        _instance = DeadlineScheduler()
+
+    return _instance
@@ -0,0 +1,156 @@
+# Внешние зависимости
+from typing import Optional, List, Iterator, Callable, Awaitable, Set
+import os
+import time
+import asyncio
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.core.metrics import STORAGE_RECLAIMED_BYTES, STORAGE_DELETED_FILES, STORAGE_SWEEP_DURATION
+from web_app.src.crud import sql_filter_existing_document_paths, sql_filter_existing_pdf_urls
+from web_app.src.utils import token_service, delete_files, build_file_url
+
+
+# Потоково читаем содержимое директории пачками
+def scan_directory_batches(directory: str, batch_size: int) -> Iterator[List[os.DirEntry]]:
+    if not os.path.isdir(directory):
+        return
+
+    with os.scandir(directory) as entries:
+        batch = []
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                continue
+
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+
+class StorageSweeper:
+    def __init__(self):
+        self.interval = config.STORAGE_SWEEP_INTERVAL
+        self.batch_size = config.STORAGE_SWEEP_BATCH_SIZE
+        self.temp_ttl = config.STORAGE_TEMP_TTL
+        self.orphan_grace = config.STORAGE_ORPHAN_GRACE
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Запуск фоновой очистки хранилища"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Остановка фоновой очистки хранилища"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                # Очистку выполняет только один процесс из всех
+                if await token_service.acquire_lock("storage_sweeper", expire_seconds=self.interval):
+                    await self.sweep()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                config.logger.error("Unexpected error storage sweep: %s", e)
+
+            await asyncio.sleep(self.interval)
+
+    async def sweep(self) -> int:
+        """Один проход очистки, возвращает количество освобожденных байт"""
+        started = time.monotonic()
+        now = time.time()
+        pdf_dir = config.PDF_REQUESTS
+
+        reclaimed = await self._sweep_expired(f"{pdf_dir}/temp", "pdf_temp", now)
+        reclaimed += await self._sweep_orphans(
+            config.USER_DOCUMENTS, "user_documents", now,
+            key=lambda path: path,
+            filter_existing=lambda keys: sql_filter_existing_document_paths(file_paths=keys)
+        )
+        reclaimed += await self._sweep_orphans(
+            f"{pdf_dir}/not_signed", "pdf_not_signed", now,
+            key=build_file_url,
+            filter_existing=lambda keys: sql_filter_existing_pdf_urls(file_urls=keys, signed=False)
+        )
+        reclaimed += await self._sweep_orphans(
+            f"{pdf_dir}/signed", "pdf_signed", now,
+            key=build_file_url,
+            filter_existing=lambda keys: sql_filter_existing_pdf_urls(file_urls=keys, signed=True)
+        )
+
+        STORAGE_SWEEP_DURATION.observe(time.monotonic() - started)
+        config.logger.info("Storage sweep finished, reclaimed %s bytes", reclaimed)
+
+        return reclaimed
+
+    # Удаляем временные файлы старше TTL
+    async def _sweep_expired(self, directory: str, label: str, now: float) -> int:
+        reclaimed = 0
+
+        for batch in scan_directory_batches(directory, self.batch_size):
+            expired = [entry.path for entry in batch if now - entry.stat().st_mtime > self.temp_ttl]
+            reclaimed += self._delete(expired, label, "expired")
+            await asyncio.sleep(0)
+
+        return reclaimed
+
+    # Удаляем файлы, на которые нет ссылок в базе данных
+    async def _sweep_orphans(
+        self,
+        directory: str,
+        label: str,
+        now: float,
+        key: Callable[[str], str],
+        filter_existing: Callable[[List[str]], Awaitable[Set[str]]]
+    ) -> int:
+        reclaimed = 0
+
+        for batch in scan_directory_batches(directory, self.batch_size):
+            # Свежие файлы могут принадлежать заявке, которая еще не сохранена
+            candidates = {
+                key(entry.path): entry.path
+                for entry in batch if now - entry.stat().st_mtime > self.orphan_grace
+            }
+            if not candidates:
+                continue
+
+            existing = await filter_existing(list(candidates.keys()))
+            orphans = [path for k, path in candidates.items() if k not in existing]
+            reclaimed += self._delete(orphans, label, "orphan")
+
+        return reclaimed
+
+    @staticmethod
+    def _delete(file_paths: List[str], label: str, reason: str) -> int:
+        if not file_paths:
+            return 0
+
+        reclaimed = delete_files(file_paths=file_paths)
+        STORAGE_RECLAIMED_BYTES.labels(directory=label).inc(reclaimed)
+        STORAGE_DELETED_FILES.labels(directory=label, reason=reason).inc(len(file_paths))
+
+        return reclaimed
+
+
+_instance = None
+
+
+def get_storage_sweeper() -> StorageSweeper:
+    global _instance
+    if _instance is None:
+        _instance = StorageSweeper()
+
+    return _instance
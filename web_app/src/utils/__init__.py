@@ -1,10 +1,19 @@
 from web_app.src.utils.validators import validate_phone_from_form, validate_phone_list
 from web_app.src.utils.work_with_password import (verify_password, get_password_hash,
+                                                  verify_password_async, get_password_hash_async,
                                                   create_secret_token, generate_password)
 from web_app.src.utils.redis_token_service import get_token_service
+from web_app.src.utils.redis_event_service import get_event_service, get_user_audience
 from web_app.src.utils.work_with_files import save_uploaded_files, delete_files
 from web_app.src.utils.work_with_rights import get_allowed_rights
 from web_app.src.utils.email_service import send_password_reset_email, send_confirm_create_secretary_email
-from web_app.src.utils.work_with_pdf import generate_pdf, save_pdf_signed
+from web_app.src.utils.work_with_pdf import generate_pdf, save_pdf_signed, build_file_url
+from web_app.src.utils.work_with_xlsx import build_xlsx
+from web_app.src.utils.work_with_static import static_url
+from web_app.src.utils.reference_cache import (get_reference_cache, ReferenceSnapshot, REFERENCE_DEPARTMENTS,
+                                               REFERENCE_JUDGES, REFERENCE_EXECUTORS,
+                                               REFERENCE_EXECUTOR_ORGANIZATIONS, REFERENCE_MANAGEMENT_DEPARTMENTS)
 
-token_service = get_token_service()
\ No newline at end of file
+token_service = get_token_service()
+event_service = get_event_service()
+reference_cache = get_reference_cache()
\ No newline at end of file
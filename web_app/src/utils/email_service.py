@@ -1,12 +1,11 @@
 # Внешние зависимости
 from datetime import datetime
-from emails import Message
-from emails.template import JinjaTemplate
 # Внутренние модули
-from web_app.src.core import config
+from web_app.src.core import config, traced
 
 
 # Отправка email для восстановления пароля
+@traced("smtp.send_password_reset_email", kind="client")
 def send_password_reset_email(to_email: str, reset_token: str, username: str):
     reset_link = f"{config.FRONTEND_URL}/u8ufy1/login/reset-password?token={reset_token}"
 
@@ -65,6 +64,10 @@ def send_password_reset_email(to_email: str, reset_token: str, username: str):
     Команда {config.APP_NAME}
     """
 
+    # Библиотека emails тянет lxml и cssutils, поэтому импортируется только при отправке письма
+    from emails import Message
+    from emails.template import JinjaTemplate
+
     try:
         message = Message(
             subject="Восстановление пароля",
@@ -93,11 +96,12 @@ def send_password_reset_email(to_email: str, reset_token: str, username: str):
         return response.success
 
     except Exception as e:
-        config.logger.error(f"Ошибка отправки email {to_email}: {e}")
+        config.logger.error("Ошибка отправки email %s: %s", to_email, e)
         return False
 
 
 # Отправка email для подтверждения создания секретаря
+@traced("smtp.send_confirm_create_secretary_email", kind="client")
 def send_confirm_create_secretary_email(
     to_email: str,
     confirm_token: str,
@@ -196,6 +200,9 @@ def send_confirm_create_secretary_email(
         Это автоматическое сообщение, пожалуйста, не отвечайте на него.
     """
 
+    from emails import Message
+    from emails.template import JinjaTemplate
+
     try:
         message = Message(
             subject="Подтверждение создания аккаунта секретаря судьи",
@@ -224,12 +231,12 @@ def send_confirm_create_secretary_email(
         )
 
         if response.success:
-            config.logger.info(f"Email подтверждения отправлен на {to_email}")
+            config.logger.info("Email подтверждения отправлен на %s", to_email)
         else:
-            config.logger.error(f"Ошибка отправки email на {to_email}: {response.error}")
+            config.logger.error("Ошибка отправки email на %s: %s", to_email, response.error)
 
         return response.success
 
     except Exception as e:
-        config.logger.error(f"Ошибка отправки email {to_email}: {e}")
+        config.logger.error("Ошибка отправки email %s: %s", to_email, e)
         return False
\ No newline at end of file
@@ -0,0 +1,151 @@
+# Внешние зависимости
+from typing import Optional, Dict, Any, Iterable, FrozenSet
+import json
+import asyncio
+import redis.asyncio as redis
+# Внутренние модули
+from web_app.src.core import config, traced
+from web_app.src.core.metrics import EVENTS_PUBLISHED, EVENTS_DROPPED, SSE_CONNECTIONS
+from web_app.src.models import User
+
+
+# Ключи аудитории пользователя: событие доставляется, если пересекается с аудиторией заявки
+def get_user_audience(user: User) -> FrozenSet[str]:
+    if user.is_secretary:
+        return frozenset({f"secretary:{user.secretary_profile.id}"})
+
+    if user.is_judge:
+        return frozenset({f"judge:{user.judge_profile.id}"})
+
+    if user.is_management:
+        # Утвержденные заявки видны всем сотрудникам управления
+        return frozenset({f"management:{user.management_profile.id}", "management:*"})
+
+    if user.is_management_department:
+        return frozenset({f"management_department:{user.management_department_profile.id}"})
+
+    if user.is_executor:
+        return frozenset({f"executor:{user.executor_profile.id}"})
+
+    if user.is_executor_organization:
+        return frozenset({f"executor_organization:{user.executor_organization_profile.id}"})
+
+    return frozenset()
+
+
+class EventService:
+    """
+    Изменения заявок публикуются в канал Redis, каждый воркер держит одну подписку
+    и раздает события своим SSE соединениям с учетом аудитории пользователя
+    """
+
+    def __init__(self):
+        self.redis_url = config.REDIS_URL
+        self.channel = config.EVENTS_CHANNEL
+        self.queue_size = config.EVENTS_QUEUE_SIZE
+        self.redis: Optional[redis.Redis] = None
+        self._subscribers: Dict[asyncio.Queue, FrozenSet[str]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Подключение к Redis и запуск прослушивания канала событий"""
+        if self.redis is None:
+            self.redis = await redis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        """Остановка прослушивания и закрытие подключения"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # Открытые SSE потоки завершаются
+        for queue in list(self._subscribers):
+            queue.put_nowait(None)
+
+        if self.redis is not None:
+            await self.redis.close()
+            self.redis = None
+
+    @traced("redis.publish", kind="client")
+    async def publish(self, event: str, data: Dict[str, Any], audience: Iterable[str]) -> bool:
+        """
+        Публикация события; ошибка Redis не должна отменять уже сохраненное изменение.
+        Возвращает False, если событие не опубликовано (отправитель из очереди повторит попытку)
+        """
+        if self.redis is None:
+            return False
+
+        try:
+            payload = json.dumps({"event": event, "data": data, "audience": sorted(set(audience))},
+                                 ensure_ascii=False, default=str)
+            await self.redis.publish(self.channel, payload)
+            EVENTS_PUBLISHED.labels(event=event).inc()
+            return True
+
+        except Exception as e:
+            config.logger.error("Error publish event %s: %s", event, e)
+            return False
+
+    def subscribe(self, audience: FrozenSet[str]) -> asyncio.Queue:
+        """Регистрация SSE соединения, None в очереди означает завершение потока"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[queue] = audience
+        SSE_CONNECTIONS.inc()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if self._subscribers.pop(queue, None) is not None:
+            SSE_CONNECTIONS.dec()
+
+    def dispatch(self, message: str):
+        """Раздача события из канала подписчикам воркера"""
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            config.logger.warning("Invalid event payload: %s", message)
+            return
+
+        audience = frozenset(payload.pop("audience", ()))
+        for queue, user_audience in self._subscribers.items():
+            if audience.isdisjoint(user_audience):
+                continue
+
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Медленный клиент: событие теряется, клиент обновит данные при следующем
+                EVENTS_DROPPED.inc()
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.dispatch(message["data"])
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                config.logger.error("Event subscription error: %s", e)
+                await asyncio.sleep(config.EVENTS_RECONNECT_DELAY)
+
+
+_instance = None
+
+
+def get_event_service() -> EventService:
+    global _instance
+    if _instance is None:
+        _instance = EventService()
+
+    return _instance
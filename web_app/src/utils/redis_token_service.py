@@ -3,9 +3,11 @@ from typing import Optional
 import json
 import redis.asyncio as redis
 # Внутренние модули
-from web_app.src.core import config
+from web_app.src.core import config, trace_methods
 
 
+# Каждый вызов Redis попадает в трассу запроса span "redis.<метод>"
+@trace_methods("redis")
 class TokenService:
     def __init__(self):
         self.redis_url = config.REDIS_URL
@@ -14,6 +16,9 @@ class TokenService:
         self.session_prefix = "access_token:"
         self.reset_password = "reset_password:"
         self.secretary_data = "secretary_data:"
+        self.lock_prefix = "lock:"
+        self.login_ip_prefix = "login_failures:ip:"
+        self.login_user_prefix = "login_failures:user:"
 
     async def init_redis(self):
         """Инициализация подключения к Redis"""
@@ -145,6 +150,49 @@ class TokenService:
             return json.loads(data[0])
         return None
 
+    async def acquire_lock(self, name: str, expire_seconds: int) -> bool:
+        """Захват блокировки для фоновых задач (выполняется одним процессом из всех)"""
+        key = f"{self.lock_prefix}{name}"
+        return bool(await self.redis.set(key, "1", nx=True, ex=expire_seconds))
+
+    async def get_login_ip_block(self, ip: str) -> Optional[int]:
+        """Проверка блокировки входа с IP после неудачных попыток (успешные входы не учитываются)"""
+        key = f"{self.login_ip_prefix}{ip}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            failures, ttl = await pipe.get(key).ttl(key).execute()
+
+        if failures is not None and int(failures) >= config.LOGIN_IP_MAX_FAILURES:
+            return max(ttl, 1)
+        return None
+
+    async def get_login_block(self, username: str) -> Optional[int]:
+        """Проверка блокировки входа для пользователя после неудачных попыток"""
+        key = f"{self.login_user_prefix}{username}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            failures, ttl = await pipe.get(key).ttl(key).execute()
+
+        if failures is not None and int(failures) >= config.LOGIN_USER_MAX_FAILURES:
+            return max(ttl, 1)
+        return None
+
+    async def register_login_failure(self, username: str, ip: str):
+        """Учет неудачной попытки входа пользователя и IP"""
+        user_key = f"{self.login_user_prefix}{username}"
+        ip_key = f"{self.login_ip_prefix}{ip}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            await (
+                pipe.incr(user_key).expire(user_key, config.LOGIN_USER_WINDOW, nx=True)
+                .incr(ip_key).expire(ip_key, config.LOGIN_IP_WINDOW, nx=True)
+                .execute()
+            )
+
+    async def reset_login_failures(self, username: str):
+        """Сброс неудачных попыток входа после успешной аутентификации"""
+        await self.redis.delete(f"{self.login_user_prefix}{username}")
+
     async def get_stats(self) -> dict:
         """Статистика аутентификаций"""
         blacklist_keys = await self.redis.keys(f"{self.blacklist_prefix}*")
@@ -0,0 +1,202 @@
+# Внешние зависимости
+from typing import Optional, Dict, Any, Callable, Awaitable, Tuple, Hashable
+from dataclasses import dataclass
+from collections import defaultdict
+import json
+import time
+import asyncio
+import hashlib
+import redis.asyncio as redis
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.encoders import jsonable_encoder
+# Внутренние модули
+from web_app.src.core import config
+
+
+# Справочники, которые меняются только из админки
+REFERENCE_DEPARTMENTS = "departments"
+REFERENCE_JUDGES = "judges"
+REFERENCE_EXECUTORS = "executors"
+REFERENCE_EXECUTOR_ORGANIZATIONS = "executor_organizations"
+REFERENCE_MANAGEMENT_DEPARTMENTS = "management_departments"
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    data: Any
+    version: int
+    etag: str
+    # Тело ответа сериализуется один раз при загрузке снимка
+    body: bytes
+    loaded_at: float
+
+
+class ReferenceCache:
+    """
+    Снимки справочников в памяти воркера: чтение не обращается ни к БД, ни к Redis.
+    Версия справочника хранится в Redis, изменение в админке увеличивает ее и рассылает
+    имена справочников всем воркерам через pub/sub, после чего снимки загружаются заново
+    """
+
+    def __init__(self):
+        self.redis_url = config.REDIS_URL
+        self.channel = config.REFERENCE_CHANNEL
+        self.ttl = config.REFERENCE_CACHE_TTL
+        self.version_prefix = "reference_version:"
+        self.redis: Optional[redis.Redis] = None
+        self._snapshots: Dict[Tuple[str, Hashable], ReferenceSnapshot] = {}
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._locks: Dict[Tuple[str, Hashable], asyncio.Lock] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Подключение к Redis и запуск прослушивания канала сброса справочников"""
+        if self.redis is None:
+            self.redis = await redis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        """Остановка прослушивания и закрытие подключения"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.redis is not None:
+            await self.redis.close()
+            self.redis = None
+
+    async def get(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[Any]],
+        key: Hashable = None
+    ) -> ReferenceSnapshot:
+        """Снимок справочника (key - вариант справочника, например исполнители одного отдела)"""
+        snapshot = self._get_fresh(name, key)
+        if snapshot is not None:
+            return snapshot
+
+        # Одновременные запросы после сброса ждут одну загрузку
+        async with self._locks.setdefault((name, key), asyncio.Lock()):
+            snapshot = self._get_fresh(name, key)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self._generations[name]
+            version = await self._get_version(name)
+            data = await loader()
+
+            body = json.dumps(jsonable_encoder(data), ensure_ascii=False).encode("utf-8")
+            digest = hashlib.sha256(body).hexdigest()[:16]
+            snapshot = ReferenceSnapshot(
+                data=data,
+                version=version,
+                # Слабый ETag: тело в gzip, br и без сжатия одно и то же по содержанию
+                etag=f'W/"{name}-{version}-{digest}"',
+                body=body,
+                loaded_at=time.monotonic()
+            )
+
+            # Сброс во время загрузки: снимок мог прочитать старые данные, в кэш он не попадает
+            if self._generations[name] == generation:
+                self._snapshots[(name, key)] = snapshot
+
+            return snapshot
+
+    async def get_data(self, name: str, loader: Callable[[], Awaitable[Any]], key: Hashable = None) -> Any:
+        return (await self.get(name, loader, key)).data
+
+    async def invalidate(self, *names: str):
+        """Сброс справочников во всех воркерах; вызывается после фиксации изменений"""
+        self.drop(names)
+        if self.redis is None:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.incr(f"{self.version_prefix}{name}")
+                pipe.publish(self.channel, json.dumps(list(names)))
+                await pipe.execute()
+
+        except Exception as e:
+            config.logger.error("Error invalidate reference cache %s: %s", names, e)
+
+    def drop(self, names):
+        """Сброс снимков справочников в текущем воркере"""
+        for name in names:
+            self._generations[name] += 1
+
+        for snapshot_key in [snapshot_key for snapshot_key in self._snapshots if snapshot_key[0] in names]:
+            del self._snapshots[snapshot_key]
+
+    @staticmethod
+    def response(snapshot: ReferenceSnapshot, request: Request) -> Response:
+        """
+        Ответ со снимком справочника: 304 без тела, если у клиента та же версия.
+        Тело может прийти сжатым, поэтому ответ зависит от Accept-Encoding,
+        а If-None-Match сравнивается слабым сравнением (без учета W/)
+        """
+        headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if snapshot.etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+    def _get_fresh(self, name: str, key: Hashable) -> Optional[ReferenceSnapshot]:
+        snapshot = self._snapshots.get((name, key))
+        # TTL страхует от изменений в обход админки (скрипты загрузки) и потерянных сообщений
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl:
+            return snapshot
+
+        return None
+
+    async def _get_version(self, name: str) -> int:
+        if self.redis is None:
+            return 0
+
+        try:
+            return int(await self.redis.get(f"{self.version_prefix}{name}") or 0)
+
+        except Exception as e:
+            config.logger.error("Error get reference version %s: %s", name, e)
+            return 0
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Пока подписки не было, сообщения могли потеряться
+                    self.drop(list({name for name, _ in self._snapshots}))
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.drop(json.loads(message["data"]))
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                config.logger.error("Reference cache subscription error: %s", e)
+                await asyncio.sleep(config.EVENTS_RECONNECT_DELAY)
+
+
+_instance = None
+
+
+def get_reference_cache() -> ReferenceCache:
+    global _instance
+    if _instance is None:
+        _instance = ReferenceCache()
+
+    return _instance
@@ -3,15 +3,16 @@ from typing import List, Optional
 import os
 import uuid
 import aiofiles
-import magic
 from fastapi import UploadFile
 from fastapi import HTTPException, status
 # Внутренние модули
 from web_app.src.schemas import AttachmentsRequest
-from web_app.src.core import config
+from web_app.src.core import config, span, traced
+from web_app.src.core.metrics import STORAGE_DELETE_ERRORS
 
 
 # Извлекаем файлы из формы и сохраняем их
+@traced("files.save_uploaded_files")
 async def save_uploaded_files(attachments: Optional[List[UploadFile]]) -> Optional[List[AttachmentsRequest]]:
     files_info = []
 
@@ -28,14 +29,17 @@ async def save_uploaded_files(attachments: Optional[List[UploadFile]]) -> Option
 
             content = await attachment.read()
 
-            validate_file_safety(content, attachment.filename)
+            with span("files.validate", bytes=len(content)):
+                validate_file_safety(content, attachment.filename)
+
             file_extension = os.path.splitext(attachment.filename)[1]
             unique_filename = uuid.uuid4().hex
             file_path = f"{config.USER_DOCUMENTS}/{unique_filename}{file_extension}"
 
             # Сохраняем файл с помощью aiofiles
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
+            with span("files.write", bytes=len(content)):
+                async with aiofiles.open(file_path, 'wb') as f:
+                    await f.write(content)
 
             files_info.append(AttachmentsRequest(
                 file_name=unique_filename,
@@ -48,9 +52,9 @@ async def save_uploaded_files(attachments: Optional[List[UploadFile]]) -> Option
             raise
 
         except Exception as err:
-            delete_files(files_info)
+            delete_files([file.file_path for file in files_info])
 
-            config.logger.error(f"Error saving file {attachment.filename}: {err}")
+            config.logger.error("Error saving file %s: %s", attachment.filename, err)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error saving file {attachment.filename}"
@@ -59,14 +63,37 @@ async def save_uploaded_files(attachments: Optional[List[UploadFile]]) -> Option
     return files_info
 
 
-# Удаляем файлы
-def delete_files(file_paths: List[str]) -> None:
+_mime_detector = None
+
+
+# Определяем MIME тип по содержимому (libmagic загружается при первом вызове, а не при старте приложения)
+def detect_mime(file_content: bytes) -> str:
+    global _mime_detector
+    if _mime_detector is None:
+        import magic
+        _mime_detector = magic.Magic(mime=True)
+
+    return _mime_detector.from_buffer(file_content)
+
+
+# Удаляем файлы и возвращаем количество освобожденных байт
+def delete_files(file_paths: List[str]) -> int:
+    reclaimed = 0
+
     for file_path in file_paths:
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except:
-            pass
+            size = os.path.getsize(file_path)
+            os.remove(file_path)
+            reclaimed += size
+
+        except FileNotFoundError:
+            continue
+
+        except OSError as err:
+            STORAGE_DELETE_ERRORS.inc()
+            config.logger.warning("Error deleting file %s: %s", file_path, err)
+
+    return reclaimed
 
 
 # Проверяет файл на безопасность
@@ -81,8 +108,7 @@ def validate_file_safety(file_content: bytes, filename: str) -> str:
 
     # Определяем MIME тип по содержимому (более надежно чем по расширению)
     try:
-        mime = magic.Magic(mime=True)
-        detected_mime = mime.from_buffer(file_content)
+        detected_mime = detect_mime(file_content)
 
     except:
         # Если не удалось определить MIME, используем расширение как fallback
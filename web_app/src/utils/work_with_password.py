@@ -1,7 +1,14 @@
 # Внешние зависимости
+from concurrent.futures import ThreadPoolExecutor
+import time
 import secrets
 import string
+import asyncio
 from passlib.context import CryptContext
+from fastapi import HTTPException, status
+# Внутренние модули
+from web_app.src.core import config
+from web_app.src.core.metrics import PASSWORD_HASH_QUEUE_SECONDS, PASSWORD_HASH_SECONDS
 
 
 # Настройки безопасности
@@ -24,6 +31,51 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+# argon2 отпускает GIL, поэтому хватает пула потоков
+_hash_executor = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password_hash"
+)
+_hash_semaphore = asyncio.Semaphore(config.PASSWORD_HASH_CONCURRENCY)
+
+
+# Выполняем хеширование вне event loop с ограничением очереди
+async def _run_in_hash_executor(operation: str, func, *args):
+    queued_at = time.perf_counter()
+    try:
+        await asyncio.wait_for(_hash_semaphore.acquire(), timeout=config.PASSWORD_HASH_QUEUE_TIMEOUT)
+
+    except asyncio.TimeoutError:
+        config.logger.warning("Password hash queue is full, operation %s rejected", operation)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": "1"}
+        )
+
+    try:
+        def timed_call():
+            started_at = time.perf_counter()
+            PASSWORD_HASH_QUEUE_SECONDS.labels(operation=operation).observe(started_at - queued_at)
+            try:
+                return func(*args)
+            finally:
+                PASSWORD_HASH_SECONDS.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, timed_call)
+
+    finally:
+        _hash_semaphore.release()
+
+
+async def verify_password_async(plain_password, hashed_password):
+    return await _run_in_hash_executor("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password):
+    return await _run_in_hash_executor("hash", get_password_hash, password)
+
+
 def create_secret_token():
     return secrets.token_urlsafe(32)
 
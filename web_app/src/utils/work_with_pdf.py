@@ -1,16 +1,21 @@
 # Внешние зависимости
 import os
-import magic
 import aiofiles
 from jinja2 import Template
-from weasyprint import HTML
 from fastapi import HTTPException, status, UploadFile
 # Внутренние модули
-from web_app.src.core import config
+from web_app.src.core import config, span, traced
 from web_app.src.schemas import DocumentResponse, DocumentData
+from web_app.src.utils.work_with_files import detect_mime
+
+
+# Формирует публичную ссылку на файл из static
+def build_file_url(file_path: str) -> str:
+    return f"/u8ufy1/{file_path.replace('web_app/src', '')}"
 
 
 # Генерирует PDF с данными по предметам заявки
+@traced("pdf.generate_pdf")
 def generate_pdf(data: DocumentData, filename: str) -> DocumentResponse:
     # Загружаем шаблон из файла
     template_path = "web_app/templates/pdf_template.html"
@@ -28,14 +33,18 @@ def generate_pdf(data: DocumentData, filename: str) -> DocumentResponse:
         data_dict["signature"]["valid_until"] = data_dict["signature"]["valid_until"].strftime("%d.%m.%Y")
 
     # Рендерим шаблон с помощью Jinja2
-    template = Template(template_content)
-    rendered_html = template.render(**data_dict)
+    with span("pdf.render_template"):
+        template = Template(template_content)
+        rendered_html = template.render(**data_dict)
 
-    # Создаем PDF из HTML
-    HTML(string=rendered_html, encoding='utf-8').write_pdf(file_path)
+    # Создаем PDF из HTML (WeasyPrint с pango и cairo импортируется при первой генерации)
+    from weasyprint import HTML
+
+    with span("pdf.weasyprint", html_bytes=len(rendered_html)):
+        HTML(string=rendered_html, encoding='utf-8').write_pdf(file_path)
 
     return DocumentResponse(
-        file_url=f"/u8ufy1/{file_path.replace("web_app/src", "")}"
+        file_url=build_file_url(file_path)
     )
 
 
@@ -52,8 +61,7 @@ def validate_pdf_file(file_content: bytes, filename: str) -> None:
 
     # Определяем MIME тип по содержимому (более надежно чем по расширению)
     try:
-        mime = magic.Magic(mime=True)
-        detected_mime = mime.from_buffer(file_content)
+        detected_mime = detect_mime(file_content)
 
     except:
         # Если не удалось определить MIME, используем расширение как fallback
@@ -75,20 +83,24 @@ def validate_pdf_file(file_content: bytes, filename: str) -> None:
 
 
 # Сохраняет pdf файл с подписью и удаляет pdf файл из temp
+@traced("files.save_pdf_signed")
 async def save_pdf_signed(file: UploadFile, filename: str) -> DocumentResponse:
     content = await file.read()
 
-    validate_pdf_file(content, file.filename)
+    with span("files.validate_pdf", bytes=len(content)):
+        validate_pdf_file(content, file.filename)
+
     temp_file_path = f"{config.PDF_REQUESTS}/temp/{filename}.pdf"
     file_path = f"{config.PDF_REQUESTS}/signed/{filename}.pdf"
 
     # Сохраняем файл с помощью aiofiles
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    with span("files.write", bytes=len(content)):
+        async with aiofiles.open(file_path, 'wb') as f:
+            await f.write(content)
 
     if os.path.exists(temp_file_path):
         os.remove(temp_file_path)
 
     return DocumentResponse(
-        file_url=f"/u8ufy1/{file_path.replace("web_app/src", "")}"
+        file_url=build_file_url(file_path)
     )
@@ -0,0 +1,30 @@
+# Внешние зависимости
+from typing import Dict, Optional
+import json
+# Внутренние модули
+from web_app.src.core import config
+
+
+_manifest: Optional[Dict[str, str]] = None
+
+
+# Манифест собранной статики читается один раз на процесс
+def load_static_manifest() -> Dict[str, str]:
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(config.STATIC_MANIFEST, mode="r", encoding="utf-8") as file:
+                _manifest = json.load(file)
+
+        except FileNotFoundError:
+            # Без сборки (локальная разработка) ссылки ведут на исходные файлы
+            config.logger.warning("Static manifest not found: %s", config.STATIC_MANIFEST)
+            _manifest = {}
+
+    return _manifest
+
+
+# URL статического файла: версия с хешем содержимого из манифеста или исходный файл
+def static_url(path: str) -> str:
+    path = path.lstrip("/")
+    return f"{config.STATIC_URL}/{load_static_manifest().get(path, path)}"
@@ -0,0 +1,34 @@
+# Внешние зависимости
+from typing import List, Dict, Any
+from io import BytesIO
+# Внутренние модули
+from web_app.src.core import traced
+
+
+# Формирует xlsx из списка словарей (ключи первой строки - заголовки столбцов)
+@traced("xlsx.build_xlsx")
+def build_xlsx(rows: List[Dict[str, Any]], sheet_name: str) -> bytes:
+    # Режим write_only пишет строки потоково и не держит в памяти объекты ячеек
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_name)
+
+    if rows:
+        header_font = Font(bold=True)
+        header = []
+        for column in rows[0].keys():
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = header_font
+            header.append(cell)
+
+        sheet.append(header)
+
+        for row in rows:
+            sheet.append(list(row.values()))
+
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()